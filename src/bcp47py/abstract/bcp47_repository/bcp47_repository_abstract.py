@@ -0,0 +1,882 @@
+"""Module related with BCP47RepositoryAbstract class."""
+import abc
+import bisect
+import dataclasses
+import re
+import threading
+from abc import ABC
+from collections import OrderedDict
+from datetime import datetime
+from typing import List, Dict, Union, Optional, Tuple, Iterable, Iterator, Sequence, FrozenSet, Set, Any
+
+from cache.lru_cache import LRUCache
+from enums.bcp47_type import BCP47Type
+from enums.language_scope import LanguageScopeEnum
+from exceptions.invalid.invalid_tag_code_error import InvalidTagCodeError
+from exceptions.invalid.invalid_variant_prefix_error import InvalidVariantPrefixError
+from exceptions.not_found.ext_lang_subtag_not_found_error import ExtLangSubtagNotFoundError
+from exceptions.not_found.grandfathered_tag_not_found_error import GrandfatheredTagNotFoundError
+from exceptions.not_found.language_scope_not_found_error import LanguageScopeNotFoundError
+from exceptions.not_found.language_subtag_not_found_error import LanguageSubtagNotFoundError
+from exceptions.not_found.redundant_tag_not_found_error import RedundantTagNotFoundError
+from exceptions.not_found.region_subtag_not_found_error import RegionSubtagNotFoundError
+from exceptions.not_found.script_subtag_not_found_error import ScriptSubtagNotFoundError
+from exceptions.not_found.tag_or_subtag_not_found_error import TagOrSubtagNotFoundError
+from exceptions.not_found.variant_subtag_not_found_error import VariantSubtagNotFoundError
+from interface.bcp47_repository.bcp47_repository_interface import BCP47RepositoryInterface
+from schemas.abstract.preferred_value import PreferredValue
+from schemas.cache_info import CacheInfo
+from schemas.ext_lang import ExtLang
+from schemas.grandfathered import Grandfathered
+from schemas.language import Language
+from schemas.language_scope import LanguageScope
+from schemas.redundant import Redundant
+from schemas.region import Region
+from schemas.script import Script
+from schemas.tag_code_layout import TagCodeLayout
+from schemas.tag_code_slot import TagCodeSlot
+from schemas.tag_parser_failure import TagParserFailure
+from schemas.parsed_tag import ParsedTag
+from schemas.variant import Variant
+from type_aliases import TagsOrSubtagType, SubtagType
+
+
+class BCP47RepositoryAbstract(BCP47RepositoryInterface, ABC):  # pylint: disable=too-many-public-methods
+    """Implementation of :class:`interface.bcp47_repository.bcp47_repository_interface.BCP47RepositoryInterface` that
+    does not depend on how the data is stored. Getters, the tag parser and the canonicalization are built on top of a
+    few lookups that implementations must provide:
+    :func:`abstract.bcp47_repository.bcp47_repository_abstract.BCP47RepositoryAbstract._find_tag_or_subtag`,
+    :func:`abstract.bcp47_repository.bcp47_repository_abstract.BCP47RepositoryAbstract._get_subtag_candidates`,
+    :func:`abstract.bcp47_repository.bcp47_repository_abstract.BCP47RepositoryAbstract._find_whole_tag`,
+    :func:`abstract.bcp47_repository.bcp47_repository_abstract.BCP47RepositoryAbstract._find_referrers`,
+    :func:`abstract.bcp47_repository.bcp47_repository_abstract.BCP47RepositoryAbstract._get_language_indexes`,
+    :func:`abstract.bcp47_repository.bcp47_repository_abstract.BCP47RepositoryAbstract._get_language_by_position`,
+    :func:`abstract.bcp47_repository.bcp47_repository_abstract.BCP47RepositoryAbstract._get_dense_ids` and
+    :func:`abstract.bcp47_repository.bcp47_repository_abstract.BCP47RepositoryAbstract._get_canonicalization_tables`.
+
+    If a tag parser cache size is provided, results of
+    :func:`abstract.bcp47_repository.bcp47_repository_abstract.BCP47RepositoryAbstract.tag_parser` are cached in a
+    thread-safe LRU cache of that size. The cache is invalidated whenever the data of the repository changes. Cached
+    :class:`schemas.parsed_tag.ParsedTag` instances are shared between callers, so they must not be modified."""
+
+    _CANONICALIZE_CACHE_SIZE = 4096
+    _TAG_CODE_CACHE_SIZE = 4096
+    _OVERFLOW_TABLE_SIZE = 65536
+
+    def __init__(self, tag_parser_cache_size: Optional[int] = None):
+        self._tag_parser_cache: Optional[LRUCache[Tuple[str, bool], ParsedTag]] = (LRUCache(tag_parser_cache_size)
+                                                                                    if tag_parser_cache_size else None)
+        self._canonicalize_cache: LRUCache[Tuple[str, bool], str] = LRUCache(self._CANONICALIZE_CACHE_SIZE)
+        self._tag_code_cache: LRUCache[Tuple[str, bool], int] = LRUCache(self._TAG_CODE_CACHE_SIZE)
+        self._overflow_tags: 'OrderedDict[int, str]' = OrderedDict()
+        self._overflow_codes: Dict[str, int] = {}
+        self._next_overflow_index = 0
+        self._overflow_lock = threading.Lock()
+
+    def get_language_by_subtag(self, subtag: str, case_sensitive: bool = False) -> Language:
+        try:
+            return self._get_tag_or_subtag(BCP47Type.LANGUAGE, subtag, case_sensitive)
+        except TagOrSubtagNotFoundError as e:
+            raise LanguageSubtagNotFoundError(subtag) from e
+
+    def try_get_language_by_subtag(self, subtag: str, case_sensitive: bool = False) -> Optional[Language]:
+        return self._find_tag_or_subtag(BCP47Type.LANGUAGE, subtag, case_sensitive)
+
+    def get_language_scope_by_name(self, name: str) -> LanguageScope:
+        try:
+            langauge_scope_enum = LanguageScopeEnum(name)
+        except ValueError as e:
+            raise LanguageScopeNotFoundError(name) from e
+
+        for bcp47_language_scope in self.languages_scopes:
+            if langauge_scope_enum == bcp47_language_scope.scope:
+                return bcp47_language_scope
+        raise RuntimeError(f'Unexpected workflow error to find a language scope: "{name}"')
+
+    def get_ext_lang_by_subtag(self, subtag: str, case_sensitive: bool = False) -> ExtLang:
+        try:
+            return self._get_tag_or_subtag(BCP47Type.EXTLANG, subtag, case_sensitive)
+        except TagOrSubtagNotFoundError as e:
+            raise ExtLangSubtagNotFoundError(subtag) from e
+
+    def try_get_ext_lang_by_subtag(self, subtag: str, case_sensitive: bool = False) -> Optional[ExtLang]:
+        return self._find_tag_or_subtag(BCP47Type.EXTLANG, subtag, case_sensitive)
+
+    def get_script_by_subtag(self, subtag: str, case_sensitive: bool = False) -> Script:
+        try:
+            return self._get_tag_or_subtag(BCP47Type.SCRIPT, subtag, case_sensitive)
+        except TagOrSubtagNotFoundError as e:
+            raise ScriptSubtagNotFoundError(subtag) from e
+
+    def try_get_script_by_subtag(self, subtag: str, case_sensitive: bool = False) -> Optional[Script]:
+        return self._find_tag_or_subtag(BCP47Type.SCRIPT, subtag, case_sensitive)
+
+    def get_region_by_subtag(self, subtag: str, case_sensitive: bool = False) -> Region:
+        try:
+            return self._get_tag_or_subtag(BCP47Type.REGION, subtag, case_sensitive)
+        except TagOrSubtagNotFoundError as e:
+            raise RegionSubtagNotFoundError(subtag) from e
+
+    def try_get_region_by_subtag(self, subtag: str, case_sensitive: bool = False) -> Optional[Region]:
+        return self._find_tag_or_subtag(BCP47Type.REGION, subtag, case_sensitive)
+
+    def get_variant_by_subtag(self, subtag: str, case_sensitive: bool = False) -> Variant:
+        try:
+            return self._get_tag_or_subtag(BCP47Type.VARIANT, subtag, case_sensitive)
+        except TagOrSubtagNotFoundError as e:
+            raise VariantSubtagNotFoundError(subtag) from e
+
+    def try_get_variant_by_subtag(self, subtag: str, case_sensitive: bool = False) -> Optional[Variant]:
+        return self._find_tag_or_subtag(BCP47Type.VARIANT, subtag, case_sensitive)
+
+    def get_grandfathered_by_tag(self, tag: str, case_sensitive: bool = False) -> Grandfathered:
+        try:
+            return self._get_tag_or_subtag(BCP47Type.GRANDFATHERED, tag, case_sensitive)
+        except TagOrSubtagNotFoundError as e:
+            raise GrandfatheredTagNotFoundError(tag) from e
+
+    def try_get_grandfathered_by_tag(self, tag: str, case_sensitive: bool = False) -> Optional[Grandfathered]:
+        return self._find_tag_or_subtag(BCP47Type.GRANDFATHERED, tag, case_sensitive)
+
+    def get_redundant_by_tag(self, tag: str, case_sensitive: bool = False) -> Redundant:
+        try:
+            return self._get_tag_or_subtag(BCP47Type.REDUNDANT, tag, case_sensitive)
+        except TagOrSubtagNotFoundError as e:
+            raise RedundantTagNotFoundError(tag) from e
+
+    def try_get_redundant_by_tag(self, tag: str, case_sensitive: bool = False) -> Optional[Redundant]:
+        return self._find_tag_or_subtag(BCP47Type.REDUNDANT, tag, case_sensitive)
+
+    def get_languages_by_macro_language(self, subtag: str) -> Tuple[Language, ...]:
+        return self._find_referrers(_MACRO_LANGUAGE_MEMBERS, subtag.lower())
+
+    def get_languages_by_suppress_script(self, subtag: str) -> Tuple[Language, ...]:
+        return self._find_referrers(_SUPPRESS_SCRIPT_USERS, subtag.lower())
+
+    def get_tags_or_subtags_by_preferred_value(self, tag: str) -> Tuple[TagsOrSubtagType, ...]:
+        return self._find_referrers(_PREFERRED_VALUE_SOURCES, tag.lower())
+
+    def find_languages(self,
+                       scope: Optional[Union[LanguageScopeEnum, str]] = None,
+                       deprecated: Optional[bool] = None,
+                       added_from: Optional[datetime] = None,
+                       added_to: Optional[datetime] = None) -> Iterator[Language]:
+        """Return a lazy iterator over the languages that match all the provided criteria, in the order of the registry.
+        Criteria that are None are ignored.
+
+        The iteration starts from the smallest candidates of the secondary indexes, a scope bucket, the deprecated or
+        not deprecated languages or the range of the sorted added dates, and the rest of criteria are checked for each
+        candidate, so no intermediate list of languages is built.
+
+        :raise exceptions.not_found.language_scope_not_found_error.LanguageScopeNotFoundError:"""
+        if isinstance(scope, str):
+            scope = self.get_language_scope_by_name(scope).scope
+        return map(self._get_language_by_position,
+                   self._get_language_indexes().find(scope, deprecated, added_from, added_to))
+
+    def tag_parser(self, tag: str, case_sensitive: bool = False, strict: bool = False) -> ParsedTag:
+        """Method that parse a bcp47 string tag and return a dataclass with all subtags information."""
+        if not self._tag_parser_cache:
+            return ParsedTag.model_construct(**self._tag_parser(tag, case_sensitive, strict))
+
+        cache_key = (tag, case_sensitive, strict)
+        generation = self._tag_parser_cache.generation
+        if (parsed_tag := self._tag_parser_cache.get(cache_key)) is not None:
+            return parsed_tag
+        parsed_tag = ParsedTag.model_construct(**self._tag_parser(tag, case_sensitive, strict))
+        self._tag_parser_cache.put(cache_key, parsed_tag, generation)
+        return parsed_tag
+
+    def is_valid(self, tag: str, case_sensitive: bool = False, strict: bool = False) -> bool:
+        if not strict:
+            return self._parse_subtags(tag, case_sensitive, None) is None
+        tag_parsed_data: Dict[str, Union[SubtagType, List[SubtagType], Redundant]] = {}
+        return (self._parse_subtags(tag, case_sensitive, tag_parsed_data) is None
+                and self._find_variant_without_prefix(tag_parsed_data) is None)
+
+    def is_well_formed(self, tag: str) -> bool:
+        return _WELL_FORMED_TAG_REGEX.fullmatch(tag) is not None
+
+    def canonicalize(self, tag: str) -> str:
+        return self._canonicalize(tag, False)
+
+    def canonicalize_extlang_form(self, tag: str) -> str:
+        return self._canonicalize(tag, True)
+
+    def _canonicalize(self, tag: str, extlang_form: bool) -> str:
+        """Return the canonical form of a string tag following the RFC 5646 (section 4.5). Results are memoized.
+
+        :raise exceptions.not_found.tag_or_subtag_not_found_error.TagOrSubtagNotFoundError:"""
+        cache_key = (tag, extlang_form)
+        generation = self._canonicalize_cache.generation
+        if (canonical_tag := self._canonicalize_cache.get(cache_key)) is not None:
+            return canonical_tag
+
+        tables = self._get_canonicalization_tables()
+        if (canonical_tag := tables.tags.get(tag.lower())) is None:
+            tag_parsed_data = self._tag_parser(tag, False, False)
+            # Grandfathered tags are found in the tags table, so every parsed tag here must have a language.
+            if (language_subtag := tag_parsed_data.get('language')) is None:
+                raise TagOrSubtagNotFoundError(f"Language subtag of {tag} is not found.")
+
+            language = language_subtag.subtag
+            # Only the first ext lang replaces the language, the rest of them are reserved by the RFC 5646 and they are
+            # kept as they are.
+            if ext_langs := tag_parsed_data.get('ext_lang', []):
+                language = tables.ext_langs.get(ext_langs[0].subtag, f'{language}-{ext_langs[0].subtag}')
+            language = tables.languages.get(language, language)
+            if extlang_form and (ext_lang_prefix := tables.ext_lang_prefixes.get(language)):
+                language = f'{ext_lang_prefix}-{language}'
+
+            script = tag_parsed_data.get('script')
+            region = tag_parsed_data.get('region')
+            canonical_tag = '-'.join((
+                language,
+                *(ext_lang.subtag for ext_lang in ext_langs[1:]),
+                *([script.subtag] if script else []),
+                *([tables.regions.get(region.subtag, region.subtag)] if region else []),
+                *(tables.variants.get(variant.subtag, variant.subtag)
+                  for variant in tag_parsed_data.get('variant', [])),
+            ))
+        elif extlang_form and (ext_lang_prefix := tables.ext_lang_prefixes.get(canonical_tag.split('-', 1)[0])):
+            canonical_tag = f'{ext_lang_prefix}-{canonical_tag}'
+
+        self._canonicalize_cache.put(cache_key, canonical_tag, generation)
+        return canonical_tag
+
+    def parse_many(self,
+                   tags: Iterable[str],
+                   case_sensitive: bool = False,
+                   strict: bool = False) -> Iterator[Union[ParsedTag, TagParserFailure]]:
+        """Parse several string tags. Return an iterator with one result for each tag in the same order: a ParsedTag or
+        a TagParserFailure if the tag could not be parsed.
+
+        Tags are consumed and results are yielded one by one. Each distinct tag is parsed only once, so the memory that
+        is used is bounded by the number of distinct tags and not by the number of tags."""
+        results: Dict[str, Union[ParsedTag, TagParserFailure]] = {}
+        for tag in tags:
+            if (result := results.get(tag)) is None:
+                try:
+                    result = self.tag_parser(tag, case_sensitive, strict)
+                except (TagOrSubtagNotFoundError, InvalidVariantPrefixError) as e:
+                    result = TagParserFailure(tag=tag, error=type(e).__name__, message=str(e))
+                results[tag] = result
+            yield result
+
+    def encode_tag(self, tag: str, case_sensitive: bool = False) -> int:
+        """Return the tag code of a string tag, an integer that packs the dense IDs of his subtags in fixed-width
+        fields. Results are memoized, except codes of the overflow table, that could be evicted.
+
+        :raise exceptions.not_found.tag_or_subtag_not_found_error.TagOrSubtagNotFoundError:"""
+        cache_key = (tag, case_sensitive)
+        generation = self._tag_code_cache.generation
+        if (code := self._tag_code_cache.get(cache_key)) is not None:
+            return code
+
+        tag_parsed_data = self._tag_parser(tag, case_sensitive, False)
+        if (grandfathered := tag_parsed_data.get('grandfathered')) is not None:
+            code = _TAG_CODE_GRANDFATHERED | self._get_dense_ids(BCP47Type.GRANDFATHERED).ids[grandfathered.tag.lower()]
+        elif (code := self._pack_subtags(tag_parsed_data)) is None:
+            return self._get_overflow_code(ParsedTag.model_construct(**tag_parsed_data).tag)
+
+        self._tag_code_cache.put(cache_key, code, generation)
+        return code
+
+    def decode_tag(self, code: int) -> ParsedTag:
+        """Return the parsed tag of a tag code generated by
+        :func:`abstract.bcp47_repository.bcp47_repository_abstract.BCP47RepositoryAbstract.encode_tag`.
+
+        :raise exceptions.invalid.invalid_tag_code_error.InvalidTagCodeError:"""
+        if code < 0 or code >> _TAG_CODE_FLAGS_SHIFT > 2:
+            raise InvalidTagCodeError(code)
+        if code & _TAG_CODE_OVERFLOW:
+            with self._overflow_lock:
+                if (tag := self._overflow_tags.get(code ^ _TAG_CODE_OVERFLOW)) is None:
+                    raise InvalidTagCodeError(code)
+                self._overflow_tags.move_to_end(code ^ _TAG_CODE_OVERFLOW)
+            return self.tag_parser(tag, case_sensitive=True)
+        if code & _TAG_CODE_GRANDFATHERED:
+            return ParsedTag.model_construct(grandfathered=self._get_tag_or_subtag_by_dense_id(
+                BCP47Type.GRANDFATHERED, code ^ _TAG_CODE_GRANDFATHERED, code))
+
+        tag_parsed_data: Dict[str, Union[SubtagType, List[SubtagType], Redundant]] = {}
+        subtag_strs = []
+        for slot in _TAG_CODE_SLOTS:
+            if not (dense_id := code >> slot.shift & (1 << slot.width) - 1):
+                continue
+            subtag = self._get_tag_or_subtag_by_dense_id(slot.subtag_type.bcp47_type, dense_id, code)
+            field_name = slot.subtag_type.field_name
+            if slot.subtag_type.max_subtags == 1:
+                tag_parsed_data[field_name] = subtag
+            elif len(tag_parsed_data.setdefault(field_name, [])) == slot.index:
+                tag_parsed_data[field_name].append(subtag)
+            else:
+                raise InvalidTagCodeError(code)
+            subtag_strs.append(subtag.subtag)
+        if 'language' not in tag_parsed_data:
+            raise InvalidTagCodeError(code)
+
+        whole_tag = self._find_whole_tag('-'.join(subtag_strs).lower())
+        if whole_tag is not None and whole_tag.bcp47_type is BCP47Type.REDUNDANT:
+            tag_parsed_data['redundant'] = whole_tag.tag
+        return ParsedTag.model_construct(**tag_parsed_data)
+
+    @property
+    def tag_code_layout(self) -> TagCodeLayout:
+        return _TAG_CODE_LAYOUT
+
+    def tag_parser_cache_info(self) -> Optional[CacheInfo]:
+        """Return the statistics of the tag parser cache or None if the tag parser cache is not enabled."""
+        return self._tag_parser_cache.cache_info() if self._tag_parser_cache else None
+
+    def clear_tag_parser_cache(self):
+        """Remove all entries of the tag parser cache and reset his statistics."""
+        if self._tag_parser_cache:
+            self._tag_parser_cache.clear()
+
+    def _invalidate_caches(self):
+        """Remove cached results that depend on the data of the repository. It must be called whenever the data of the
+        repository changes."""
+        if self._tag_parser_cache:
+            self._tag_parser_cache.invalidate()
+        self._canonicalize_cache.invalidate()
+        self._tag_code_cache.invalidate()
+
+    def _get_tag_or_subtag(self, bcp47_type: BCP47Type, tag_str: str, case_sensitive: bool) -> TagsOrSubtagType:
+        """Return a tag or subtag object of a type by his tag or subtag string.
+
+        :raise exceptions.not_found.tag_or_subtag_not_found_error.TagOrSubtagNotFoundError:"""
+        if (tag_or_subtag := self._find_tag_or_subtag(bcp47_type, tag_str, case_sensitive)) is None:
+            raise TagOrSubtagNotFoundError(tag_str)
+        return tag_or_subtag
+
+    def _tag_parser(self, tag: str, case_sensitive: bool,
+                    strict: bool) -> Dict[str, Union[SubtagType, List[SubtagType], Redundant]]:
+        """Method that parse a string tag and return a Dict with all subtag objects contained in previous string tag.
+        Keys of the dict are the names of the fields of :class:`schemas.parsed_tag.ParsedTag`.
+
+        :raise exceptions.not_found.tag_or_subtag_not_found_error.TagOrSubtagNotFoundError:
+        :raise exceptions.invalid.invalid_variant_prefix_error.InvalidVariantPrefixError:
+        """
+        tag_parsed_data: Dict[str, Union[SubtagType, List[SubtagType], Redundant]] = {}
+        if (not_found_subtag := self._parse_subtags(tag, case_sensitive, tag_parsed_data)) is not None:
+            raise TagOrSubtagNotFoundError(f"Subtag {not_found_subtag} of {tag} is not found.")
+        if strict and (variant := self._find_variant_without_prefix(tag_parsed_data)) is not None:
+            raise InvalidVariantPrefixError(variant.subtag, tag)
+        return tag_parsed_data
+
+    def _find_variant_without_prefix(self, tag_parsed_data: Dict[str, Union[SubtagType, List[SubtagType], Redundant]]
+                                     ) -> Optional[Variant]:
+        """Return the first variant of a parsed tag that has prefixes and it does not follow any of them, or None if all
+        variants follow their prefixes. The subtags that precede each variant are checked with a set membership test
+        for each combination of fields used by his prefixes. Prefixes start with a language, so the first variant is
+        returned if the parsed tag has no language."""
+        if not (variants := tag_parsed_data.get('variant')):
+            return None
+        if _is_missing_language(tag_parsed_data):
+            return variants[0]
+        subtags = _VariantPrefixes.get_subtags(tag_parsed_data['language'], tag_parsed_data.get('ext_lang', ()),
+                                               tag_parsed_data.get('script'), tag_parsed_data.get('region'), variants)
+        for index, variant in enumerate(variants):
+            variant_prefixes = self._get_variant_prefixes(variant)
+            if variant_prefixes is not None and not variant_prefixes.match(subtags, index):
+                return variant
+        return None
+
+    def _pack_subtags(self, tag_parsed_data: Dict[str, Union[SubtagType, List[SubtagType], Redundant]]
+                      ) -> Optional[int]:
+        """Return the tag code of a parsed tag that is not grandfathered or None if it does not fit in the slots of the
+        tag codes, because it has more ext langs or variants than slots or some dense ID is wider than his slot."""
+        if any(len(tag_parsed_data.get(field_name, ())) > max_subtags
+               for field_name, max_subtags in _TAG_CODE_MAX_SUBTAGS.items()):
+            return None
+        code = 0
+        for slot in _TAG_CODE_SLOTS:
+            subtag = tag_parsed_data.get(slot.subtag_type.field_name)
+            if isinstance(subtag, list):
+                subtag = subtag[slot.index] if slot.index < len(subtag) else None
+            if subtag is None:
+                continue
+            dense_id = self._get_dense_ids(slot.subtag_type.bcp47_type).ids[subtag.subtag.lower()]
+            if dense_id >> slot.width:
+                return None
+            code |= dense_id << slot.shift
+        return code
+
+    def _get_overflow_code(self, tag: str) -> int:
+        """Return the tag code of a tag that does not fit in the slots of the tag codes. The tag is added to the
+        overflow table the first time with the next index, and the code contains that index. The table is bounded: when
+        it is full, the least recently used tag is evicted and his code is not valid anymore. Indexes are never reused,
+        so an evicted code could not be decoded as another tag."""
+        with self._overflow_lock:
+            if (code := self._overflow_codes.get(tag)) is not None:
+                self._overflow_tags.move_to_end(code ^ _TAG_CODE_OVERFLOW)
+                return code
+            code = self._overflow_codes[tag] = _TAG_CODE_OVERFLOW | self._next_overflow_index
+            self._overflow_tags[self._next_overflow_index] = tag
+            self._next_overflow_index += 1
+            if len(self._overflow_tags) > self._OVERFLOW_TABLE_SIZE:
+                del self._overflow_codes[self._overflow_tags.popitem(last=False)[1]]
+        return code
+
+    def _get_tag_or_subtag_by_dense_id(self, bcp47_type: BCP47Type, dense_id: int, code: int) -> TagsOrSubtagType:
+        """Return the tag or subtag object of a type by his dense ID.
+
+        :raise exceptions.invalid.invalid_tag_code_error.InvalidTagCodeError: the dense ID of the tag code is not
+            found."""
+        tag_strs = self._get_dense_ids(bcp47_type).tag_strs
+        if not 0 < dense_id <= len(tag_strs):
+            raise InvalidTagCodeError(code)
+        return self._get_tag_or_subtag(bcp47_type, tag_strs[dense_id - 1], True)
+
+    def _parse_subtags(self, tag: str, case_sensitive: bool,
+                       tag_parsed_data: Optional[Dict[str, Union[SubtagType, List[SubtagType], Redundant]]]
+                       ) -> Optional[str]:
+        """Core of the tag parser that never raises. It returns None if all subtags of the tag are found, otherwise it
+        returns the first subtag that is not found. If a dict is provided, it is filled with all subtag objects
+        contained in the tag.
+
+        Each subtag is checked by his shape (from one to eight ASCII letters or digits) and looked up once in the
+        subtags table. The subtag is assigned to the first type of his candidates that could be placed after the
+        previous subtag: the first subtag must be a language, types must follow the order language, ext lang, script,
+        region and variant, and each type could be repeated up to his max subtags.
+
+        Grandfathered and redundant tags are looked up as a whole before the subtags. A grandfathered tag is not
+        decomposed, because most of them are irregular and do not follow the syntax of the subtags."""
+        if (whole_tag := self._find_whole_tag(tag.lower())) is None:
+            pass
+        elif whole_tag.bcp47_type is BCP47Type.REDUNDANT:
+            if tag_parsed_data is not None:
+                tag_parsed_data['redundant'] = whole_tag.tag
+        elif not case_sensitive or whole_tag.tag.tag == tag:
+            if tag_parsed_data is not None:
+                tag_parsed_data['grandfathered'] = whole_tag.tag
+            return None
+
+        position = 0
+        repetitions = 0
+        for index, subtag in enumerate(tag.split('-')):
+            if len(subtag) > _SUBTAG_MAX_LENGTH or not subtag.isalnum() or not subtag.isascii():
+                return subtag
+
+            for candidate in self._get_subtag_candidates(subtag.lower()):
+                subtag_type = candidate.subtag_type
+                if subtag_type.position < position or (subtag_type.position == position
+                                                       and repetitions >= subtag_type.max_subtags):
+                    continue
+                if not index and subtag_type.bcp47_type is not BCP47Type.LANGUAGE:
+                    continue
+                if case_sensitive and candidate.subtag.subtag != subtag:
+                    continue
+                break
+            else:
+                return subtag
+
+            if subtag_type.position != position:
+                position = subtag_type.position
+                repetitions = 0
+            repetitions += 1
+
+            if tag_parsed_data is None:
+                continue
+            if subtag_type.max_subtags == 1:
+                tag_parsed_data[subtag_type.field_name] = candidate.subtag
+            else:
+                tag_parsed_data.setdefault(subtag_type.field_name, []).append(candidate.subtag)
+        if tag_parsed_data is not None and _is_missing_language(tag_parsed_data):
+            return tag
+        return None
+
+    @abc.abstractmethod
+    def _find_tag_or_subtag(self, bcp47_type: BCP47Type, tag_str: str,
+                            case_sensitive: bool) -> Optional[TagsOrSubtagType]:
+        """Return a tag or subtag object of a type by his tag or subtag string or None if it is not found. If some tag
+        or subtag string is repeated, the first one of the registry must be returned."""
+
+    @abc.abstractmethod
+    def _get_subtag_candidates(self, subtag: str) -> Sequence['_SubtagCandidate']:
+        """Return the subtag objects whose lower case subtag string is the lower case subtag, sorted by the position of
+        their type in a tag. Only the first subtag object of each type must be returned."""
+
+    @abc.abstractmethod
+    def _find_whole_tag(self, tag: str) -> Optional['_WholeTag']:
+        """Return the grandfathered or redundant object whose lower case tag is the lower case tag or None if it is not
+        found. If some tag is repeated, the first one of the registry must be returned."""
+
+    @abc.abstractmethod
+    def _find_referrers(self, reverse_index: str, tag_str: str) -> Tuple[TagsOrSubtagType, ...]:
+        """Return the objects that reference the lower case tag or subtag string in the reverse index, a field name of
+        :class:`abstract.bcp47_repository.bcp47_repository_abstract._ReverseIndexes`, in the order of the registry."""
+
+    @abc.abstractmethod
+    def _get_variant_prefixes(self, variant: Variant) -> Optional['_VariantPrefixes']:
+        """Return the prefixes of a variant or None if the variant has no prefixes."""
+
+    @abc.abstractmethod
+    def _get_language_indexes(self) -> '_LanguageIndexes':
+        """Return the secondary indexes of the languages."""
+
+    @abc.abstractmethod
+    def _get_language_by_position(self, position: int) -> Language:
+        """Return the language of a position of the secondary indexes, that is his position in the registry."""
+
+    @abc.abstractmethod
+    def _get_dense_ids(self, bcp47_type: BCP47Type) -> '_DenseIds':
+        """Return the dense IDs of the tags or subtags of a type."""
+
+    @abc.abstractmethod
+    def _get_canonicalization_tables(self) -> '_CanonicalizationTables':
+        """Return the mapping tables used to canonicalize tags."""
+
+
+@dataclasses.dataclass
+class _CanonicalizationTables:
+    """Dataclass that contains flat mapping tables used to canonicalize tags. Tables of subtags map a deprecated subtag
+    to his preferred value. The tags table maps a lower case grandfathered or redundant tag to his preferred value;
+    grandfathered tags without preferred value are mapped to themselves, because they are already canonical. The ext
+    lang prefixes table maps a language subtag to the prefix of the ext lang with the same subtag."""
+    tags: Dict[str, str] = dataclasses.field(default_factory=dict)
+    languages: Dict[str, str] = dataclasses.field(default_factory=dict)
+    ext_langs: Dict[str, str] = dataclasses.field(default_factory=dict)
+    regions: Dict[str, str] = dataclasses.field(default_factory=dict)
+    variants: Dict[str, str] = dataclasses.field(default_factory=dict)
+    ext_lang_prefixes: Dict[str, str] = dataclasses.field(default_factory=dict)
+
+    def add(self, bcp47_type: BCP47Type, tag_or_subtag: TagsOrSubtagType):
+        """Add the mappings of a tag or subtag object to the tables."""
+        preferred_value = getattr(tag_or_subtag, 'preferred_value', None)
+        preferred_value_tag = PreferredValue.format_tag(preferred_value) if preferred_value else None
+
+        if bcp47_type == BCP47Type.GRANDFATHERED:
+            if not preferred_value_tag:
+                preferred_value_tag = tag_or_subtag.tag
+            self.tags.setdefault(tag_or_subtag.tag.lower(), preferred_value_tag)
+        elif bcp47_type == BCP47Type.REDUNDANT:
+            if preferred_value_tag:
+                self.tags.setdefault(tag_or_subtag.tag.lower(), preferred_value_tag)
+        elif bcp47_type == BCP47Type.EXTLANG:
+            if preferred_value_tag:
+                self.ext_langs.setdefault(tag_or_subtag.subtag, preferred_value_tag)
+            if tag_or_subtag.prefix:
+                self.ext_lang_prefixes.setdefault(tag_or_subtag.subtag, tag_or_subtag.prefix[0].tag)
+        elif preferred_value_tag and (table := {
+                BCP47Type.LANGUAGE: self.languages,
+                BCP47Type.REGION: self.regions,
+                BCP47Type.VARIANT: self.variants
+        }.get(bcp47_type)) is not None:
+            table.setdefault(tag_or_subtag.subtag, preferred_value_tag)
+
+    def remove(self, bcp47_type: BCP47Type, tag_str: str):
+        """Remove the mappings of a tag or subtag string of a type from the tables."""
+        if bcp47_type in _WHOLE_TAG_TYPES:
+            self.tags.pop(tag_str.lower(), None)
+        elif bcp47_type == BCP47Type.EXTLANG:
+            self.ext_langs.pop(tag_str, None)
+            self.ext_lang_prefixes.pop(tag_str, None)
+        elif (table := {
+                BCP47Type.LANGUAGE: self.languages,
+                BCP47Type.REGION: self.regions,
+                BCP47Type.VARIANT: self.variants
+        }.get(bcp47_type)) is not None:
+            table.pop(tag_str, None)
+
+    def copy(self) -> '_CanonicalizationTables':
+        """Return a copy whose tables could be modified without changing this one."""
+        return _CanonicalizationTables(**{field.name: dict(getattr(self, field.name))
+                                          for field in dataclasses.fields(self)})
+
+
+@dataclasses.dataclass
+class _ReverseIndexes:
+    """Dataclass that contains reverse indexes of the references between objects, keyed by the lower case tag or
+    subtag string that is referenced. The macro language members index contains the languages of a macro language, the
+    suppress script users index contains the languages that suppress a script and the preferred value sources index
+    contains the tags and subtags of any type that are replaced by a preferred value. Values are tuples, so they are
+    returned without copying them."""
+    macro_language_members: Dict[str, Tuple[Language, ...]] = dataclasses.field(default_factory=dict)
+    suppress_script_users: Dict[str, Tuple[Language, ...]] = dataclasses.field(default_factory=dict)
+    preferred_value_sources: Dict[str, Tuple[TagsOrSubtagType, ...]] = dataclasses.field(default_factory=dict)
+
+    def add(self, bcp47_type: BCP47Type, tag_or_subtag: TagsOrSubtagType):
+        """Add a tag or subtag object to the reverse indexes of the objects that it references."""
+        for reverse_index, tag_str in self._get_references(bcp47_type, tag_or_subtag):
+            index = getattr(self, reverse_index)
+            index[tag_str] = index.get(tag_str, ()) + (tag_or_subtag,)
+
+    def replace(self, bcp47_type: BCP47Type, old: Optional[TagsOrSubtagType], new: Optional[TagsOrSubtagType]):
+        """Replace a tag or subtag object by a new one in the reverse indexes. If both reference the same tag or subtag,
+        the new one keeps the position of the old one, otherwise the old one is removed and the new one is added at the
+        end. The old or the new one could be None to only add or remove an object."""
+        old_references = set(self._get_references(bcp47_type, old)) if old is not None else set()
+        new_references = list(self._get_references(bcp47_type, new)) if new is not None else []
+        for reverse_index, tag_str in old_references:
+            index = getattr(self, reverse_index)
+            if (reverse_index, tag_str) in new_references:
+                index[tag_str] = tuple(new if referrer is old else referrer for referrer in index[tag_str])
+            elif referrers := tuple(referrer for referrer in index[tag_str] if referrer is not old):
+                index[tag_str] = referrers
+            else:
+                del index[tag_str]
+        for reverse_index, tag_str in new_references:
+            if (reverse_index, tag_str) not in old_references:
+                index = getattr(self, reverse_index)
+                index[tag_str] = index.get(tag_str, ()) + (new,)
+
+    def copy(self) -> '_ReverseIndexes':
+        """Return a copy whose indexes could be modified without changing this one. Values are tuples, so they are
+        shared."""
+        return _ReverseIndexes(**{field.name: dict(getattr(self, field.name)) for field in dataclasses.fields(self)})
+
+    @staticmethod
+    def _get_references(bcp47_type: BCP47Type, tag_or_subtag: TagsOrSubtagType) -> Iterator[Tuple[str, str]]:
+        """Yield the reverse indexes where a tag or subtag object must be added and the lower case tag or subtag string
+        that it references in each one. Ext langs also have a macro language, but only languages are members."""
+        if bcp47_type is BCP47Type.LANGUAGE:
+            if macro_language := tag_or_subtag.macro_language:
+                yield _MACRO_LANGUAGE_MEMBERS, macro_language.subtag.lower()
+            if suppress_script := tag_or_subtag.suppress_script:
+                yield _SUPPRESS_SCRIPT_USERS, suppress_script.subtag.lower()
+        if preferred_value := getattr(tag_or_subtag, 'preferred_value', None):
+            yield _PREFERRED_VALUE_SOURCES, PreferredValue.format_tag(preferred_value).lower()
+
+
+@dataclasses.dataclass
+class _VariantPrefixes:
+    """Dataclass that contains the prefixes of a variant as sets of lower case subtags. Each prefix only constrains the
+    fields that it uses, so prefixes are grouped by those fields and the subtags of a tag in the same fields are looked
+    up in the set of the group. Fields are, in order, the language, the ext langs, the script, the region and the
+    variants."""
+    prefixes_by_fields: Dict[Tuple[int, ...], FrozenSet[Tuple[Any, ...]]]
+
+    @classmethod
+    def from_variant(cls, variant: Variant) -> Optional['_VariantPrefixes']:
+        """Return the prefixes of a variant or None if the variant has no prefixes."""
+        prefixes_by_fields: Dict[Tuple[int, ...], Set[Tuple[Any, ...]]] = {}
+        for prefix in variant.prefix:
+            subtags = cls.get_subtags(prefix.language, prefix.extlang, prefix.script, prefix.region, prefix.variant)
+            fields = tuple(field for field, field_subtags in enumerate(subtags) if field_subtags)
+            prefixes_by_fields.setdefault(fields, set()).add(tuple(subtags[field] for field in fields))
+        if not prefixes_by_fields:
+            return None
+        return cls({fields: frozenset(prefixes) for fields, prefixes in prefixes_by_fields.items()})
+
+    @staticmethod
+    def get_subtags(language: Optional[SubtagType], ext_langs: Iterable[SubtagType], script: Optional[SubtagType],
+                    region: Optional[SubtagType], variants: Iterable[SubtagType]) -> Tuple[Any, ...]:
+        """Return the lower case subtags of each field. Ext langs and variants are tuples."""
+        return (language.subtag.lower() if language else None,
+                tuple(ext_lang.subtag.lower() for ext_lang in ext_langs),
+                script.subtag.lower() if script else None,
+                region.subtag.lower() if region else None,
+                tuple(variant.subtag.lower() for variant in variants))
+
+    def match(self, subtags: Tuple[Any, ...], variant_index: int) -> bool:
+        """Return if the subtags of a tag that precede his variant of an index match any prefix."""
+        preceding_subtags = (*subtags[:4], subtags[4][:variant_index])
+        return any(tuple(preceding_subtags[field] for field in fields) in prefixes
+                   for fields, prefixes in self.prefixes_by_fields.items())
+
+
+@dataclasses.dataclass
+class _LanguageIndexes:
+    """Dataclass that contains secondary indexes of the languages by their position in the registry. The scope, the
+    deprecated flag and the added date of each position are kept to check the criteria of a candidate, and the
+    positions are indexed in buckets by scope (None for individual languages), in deprecated and not deprecated lists
+    and sorted by added date to find a range of dates with a binary search."""
+    scopes: List[Optional[LanguageScopeEnum]] = dataclasses.field(default_factory=list)
+    deprecated: List[bool] = dataclasses.field(default_factory=list)
+    added: List[datetime] = dataclasses.field(default_factory=list)
+    scope_buckets: Dict[Optional[LanguageScopeEnum], List[int]] = dataclasses.field(default_factory=dict)
+    deprecated_buckets: Dict[bool, List[int]] = dataclasses.field(default_factory=lambda: {False: [], True: []})
+    sorted_added: List[datetime] = dataclasses.field(default_factory=list)
+    sorted_added_positions: List[int] = dataclasses.field(default_factory=list)
+
+    def add(self, scope: Optional[LanguageScopeEnum], deprecated: bool, added: datetime):
+        """Add the next language of the registry to the indexes."""
+        position = len(self.scopes)
+        self.scopes.append(scope)
+        self.deprecated.append(deprecated)
+        self.added.append(added)
+        self.scope_buckets.setdefault(scope, []).append(position)
+        self.deprecated_buckets[deprecated].append(position)
+        index = bisect.bisect_right(self.sorted_added, added)
+        self.sorted_added.insert(index, added)
+        self.sorted_added_positions.insert(index, position)
+
+    def replace(self, position: int, scope: Optional[LanguageScopeEnum], deprecated: bool, added: datetime):
+        """Replace the language of a position in the indexes."""
+        if (old_scope := self.scopes[position]) is not scope:
+            self.scope_buckets[old_scope].remove(position)
+            if not self.scope_buckets[old_scope]:
+                del self.scope_buckets[old_scope]
+            bisect.insort(self.scope_buckets.setdefault(scope, []), position)
+        if self.deprecated[position] != deprecated:
+            self.deprecated_buckets[self.deprecated[position]].remove(position)
+            bisect.insort(self.deprecated_buckets[deprecated], position)
+        if self.added[position] != added:
+            index = bisect.bisect_left(self.sorted_added, self.added[position])
+            index = self.sorted_added_positions.index(position, index)
+            del self.sorted_added[index], self.sorted_added_positions[index]
+            index = bisect.bisect_right(self.sorted_added, added)
+            self.sorted_added.insert(index, added)
+            self.sorted_added_positions.insert(index, position)
+        self.scopes[position] = scope
+        self.deprecated[position] = deprecated
+        self.added[position] = added
+
+    def copy(self) -> '_LanguageIndexes':
+        """Return a copy whose indexes could be modified without changing this one."""
+        return _LanguageIndexes(
+            scopes=list(self.scopes),
+            deprecated=list(self.deprecated),
+            added=list(self.added),
+            scope_buckets={scope: list(positions) for scope, positions in self.scope_buckets.items()},
+            deprecated_buckets={deprecated: list(positions)
+                                for deprecated, positions in self.deprecated_buckets.items()},
+            sorted_added=list(self.sorted_added),
+            sorted_added_positions=list(self.sorted_added_positions),
+        )
+
+    def find(self, scope: Optional[LanguageScopeEnum], deprecated: Optional[bool], added_from: Optional[datetime],
+             added_to: Optional[datetime]) -> Iterator[int]:
+        """Yield the positions of the languages that match all the criteria that are not None in ascending order. The
+        added range includes both limits."""
+        candidates: Sequence[int] = range(len(self.scopes))
+        if scope is not None and len(scope_bucket := self.scope_buckets.get(scope, ())) < len(candidates):
+            candidates = scope_bucket
+        if deprecated is not None and len(
+                deprecated_bucket := self.deprecated_buckets[bool(deprecated)]) < len(candidates):
+            candidates = deprecated_bucket
+        if added_from is not None or added_to is not None:
+            start = bisect.bisect_left(self.sorted_added, added_from) if added_from is not None else 0
+            end = bisect.bisect_right(self.sorted_added, added_to) if added_to is not None else len(self.sorted_added)
+            if end - start < len(candidates):
+                candidates = sorted(self.sorted_added_positions[start:end])
+
+        for position in candidates:
+            if ((scope is None or self.scopes[position] is scope)
+                    and (deprecated is None or self.deprecated[position] == deprecated)
+                    and (added_from is None or self.added[position] >= added_from)
+                    and (added_to is None or self.added[position] <= added_to)):
+                yield position
+
+
+@dataclasses.dataclass
+class _DenseIds:
+    """Dataclass that contains the dense IDs of the tags or subtags of a type. IDs are assigned from 1 in the order of
+    the registry, so they are stable for the same registry, and 0 is kept for missing subtags. The IDs dict uses the
+    lower case tag or subtag string as key and, if it is repeated, the first one is the one that is indexed."""
+    ids: Dict[str, int] = dataclasses.field(default_factory=dict)
+    tag_strs: List[str] = dataclasses.field(default_factory=list)
+
+    def add(self, tag_str: str):
+        """Assign the next ID to the next tag or subtag string of the registry."""
+        self.tag_strs.append(tag_str)
+        self.ids.setdefault(tag_str.lower(), len(self.tag_strs))
+
+    def copy(self) -> '_DenseIds':
+        """Return a copy whose IDs could be assigned without changing this one."""
+        return _DenseIds(dict(self.ids), list(self.tag_strs))
+
+
+@dataclasses.dataclass(frozen=True)
+class _SubtagType:
+    """Dataclass that describes how a subtag type is placed in a tag: the name of the field of
+    :class:`schemas.parsed_tag.ParsedTag`, the position of the type in a tag and how many times the type could be
+    repeated."""
+    bcp47_type: BCP47Type
+    field_name: str
+    position: int
+    max_subtags: int
+
+
+@dataclasses.dataclass(frozen=True)
+class _TagCodeSlot:
+    """Dataclass that describes the bits of a tag code that contain the dense ID of a subtag: the subtag type, the
+    index of the subtag in his type, the position of the lowest bit and the number of bits."""
+    subtag_type: _SubtagType
+    index: int
+    shift: int
+    width: int
+
+
+@dataclasses.dataclass
+class _SubtagCandidate:
+    """Dataclass that it structures the values of the subtags table used by the tag parser."""
+    subtag_type: _SubtagType
+    subtag: SubtagType
+
+
+@dataclasses.dataclass
+class _WholeTag:
+    """Dataclass that it structures the values of the whole tags table used by the tag parser."""
+    bcp47_type: BCP47Type
+    tag: Union[Grandfathered, Redundant]
+
+
+def _is_missing_language(tag_parsed_data: Dict[str, Union[SubtagType, List[SubtagType], Redundant]]) -> bool:
+    """Return if a parsed tag has no language. Only grandfathered tags, that are not decomposed in subtags, could be
+    parsed without a language."""
+    return 'language' not in tag_parsed_data and 'grandfathered' not in tag_parsed_data
+
+
+_WHOLE_TAG_TYPES = (BCP47Type.GRANDFATHERED, BCP47Type.REDUNDANT)
+
+_SUBTAG_TYPES: Dict[BCP47Type, _SubtagType] = {
+    subtag_type.bcp47_type: subtag_type
+    for subtag_type in (
+        _SubtagType(BCP47Type.LANGUAGE, 'language', 0, 1),
+        _SubtagType(BCP47Type.EXTLANG, 'ext_lang', 1, 3),
+        _SubtagType(BCP47Type.SCRIPT, 'script', 2, 1),
+        _SubtagType(BCP47Type.REGION, 'region', 3, 1),
+        _SubtagType(BCP47Type.VARIANT, 'variant', 4, 999),
+    )
+}
+
+_TAG_CODE_SLOTS = (
+    _TagCodeSlot(_SUBTAG_TYPES[BCP47Type.LANGUAGE], 0, 44, 15),
+    _TagCodeSlot(_SUBTAG_TYPES[BCP47Type.EXTLANG], 0, 35, 9),
+    _TagCodeSlot(_SUBTAG_TYPES[BCP47Type.SCRIPT], 0, 26, 9),
+    _TagCodeSlot(_SUBTAG_TYPES[BCP47Type.REGION], 0, 16, 10),
+    _TagCodeSlot(_SUBTAG_TYPES[BCP47Type.VARIANT], 0, 8, 8),
+    _TagCodeSlot(_SUBTAG_TYPES[BCP47Type.VARIANT], 1, 0, 8),
+)
+"""Slots of a tag code from the highest to the lowest bits, so sorting tag codes groups them by language."""
+_TAG_CODE_MAX_SUBTAGS = {'ext_lang': 1, 'variant': 2}
+_TAG_CODE_FLAGS_SHIFT = 59
+_TAG_CODE_GRANDFATHERED = 1 << _TAG_CODE_FLAGS_SHIFT
+_TAG_CODE_OVERFLOW = 2 << _TAG_CODE_FLAGS_SHIFT
+_TAG_CODE_LAYOUT = TagCodeLayout(
+    slots=tuple(TagCodeSlot(bcp47_type=slot.subtag_type.bcp47_type, index=slot.index, shift=slot.shift,
+                            width=slot.width)
+                for slot in _TAG_CODE_SLOTS),
+    grandfathered_flag=_TAG_CODE_GRANDFATHERED,
+    overflow_flag=_TAG_CODE_OVERFLOW,
+)
+
+_MACRO_LANGUAGE_MEMBERS = 'macro_language_members'
+_SUPPRESS_SCRIPT_USERS = 'suppress_script_users'
+_PREFERRED_VALUE_SOURCES = 'preferred_value_sources'
+
+_SUBTAG_MAX_LENGTH = 8
+
+_WELL_FORMED_TAG_REGEX = re.compile(
+    r"""
+    (?:
+        (?P<langtag>
+            (?:[a-z]{2,3}(?:-[a-z]{3}){0,3}|[a-z]{4}|[a-z]{5,8})  # language and extlang
+            (?:-[a-z]{4})?  # script
+            (?:-(?:[a-z]{2}|[0-9]{3}))?  # region
+            (?:-(?:[a-z0-9]{5,8}|[0-9][a-z0-9]{3}))*  # variant
+            (?:-[0-9a-wyz](?:-[a-z0-9]{2,8})+)*  # extension
+            (?:-x(?:-[a-z0-9]{1,8})+)?  # privateuse
+        )
+        |(?P<privateuse>x(?:-[a-z0-9]{1,8})+)
+        |(?P<grandfathered>
+            en-gb-oed|i-ami|i-bnn|i-default|i-enochian|i-hak|i-klingon|i-lux|i-mingo|i-navajo|i-pwn|i-tao|i-tay
+            |i-tsu|sgn-be-fr|sgn-be-nl|sgn-ch-de
+            |art-lojban|cel-gaulish|no-bok|no-nyn|zh-guoyu|zh-hakka|zh-min|zh-min-nan|zh-xiang
+        )
+    )
+    """, re.IGNORECASE | re.VERBOSE | re.ASCII)
+
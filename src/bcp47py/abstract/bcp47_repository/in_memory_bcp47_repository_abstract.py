@@ -1,21 +1,16 @@
 """Module related with InMemoryBCP47RepositoryAbstract class."""
 import abc
 import dataclasses
+import threading
 from abc import ABC
-from typing import List, Dict, Union, Callable, Any
+from datetime import datetime
+from typing import List, Dict, Optional, Sequence, Set, Iterable, Iterator, Tuple, Union
 
+from abstract.bcp47_repository.bcp47_repository_abstract import BCP47RepositoryAbstract, _CanonicalizationTables, \
+    _SubtagCandidate, _SubtagType, _SUBTAG_TYPES, _WholeTag, _WHOLE_TAG_TYPES, _ReverseIndexes, \
+    _LanguageIndexes, _VariantPrefixes, _DenseIds, _MACRO_LANGUAGE_MEMBERS, _SUPPRESS_SCRIPT_USERS
 from enums.bcp47_type import BCP47Type
 from enums.language_scope import LanguageScopeEnum
-from exceptions.not_found.ext_lang_subtag_not_found_error import ExtLangSubtagNotFoundError
-from exceptions.not_found.grandfathered_tag_not_found_error import GrandfatheredTagNotFoundError
-from exceptions.not_found.language_scope_not_found_error import LanguageScopeNotFoundError
-from exceptions.not_found.language_subtag_not_found_error import LanguageSubtagNotFoundError
-from exceptions.not_found.redundant_tag_not_found_error import RedundantTagNotFoundError
-from exceptions.not_found.region_subtag_not_found_error import RegionSubtagNotFoundError
-from exceptions.not_found.script_subtag_not_found_error import ScriptSubtagNotFoundError
-from exceptions.not_found.tag_or_subtag_not_found_error import TagOrSubtagNotFoundError
-from exceptions.not_found.variant_subtag_not_found_error import VariantSubtagNotFoundError
-from interface.bcp47_repository.bcp47_repository_interface import BCP47RepositoryInterface
 from schemas.ext_lang import ExtLang
 from schemas.grandfathered import Grandfathered
 from schemas.language import Language
@@ -23,179 +18,189 @@ from schemas.language_scope import LanguageScope
 from schemas.redundant import Redundant
 from schemas.region import Region
 from schemas.script import Script
-from schemas.parsed_tag import ParsedTag
 from schemas.variant import Variant
-from type_aliases import TagsOrSubtagType, SubtagType
-
-_TagParsedData = Dict[str, Union[SubtagType, List[SubtagType]]]
-
-
-class InMemoryBCP47RepositoryAbstract(BCP47RepositoryInterface, ABC):
+from type_aliases import TagsOrSubtagType, SubtagType, TagOrSubtagChanges
+
+_IN_MEMORY_TYPES = (
+    BCP47Type.LANGUAGE,
+    BCP47Type.EXTLANG,
+    BCP47Type.SCRIPT,
+    BCP47Type.REGION,
+    BCP47Type.VARIANT,
+    BCP47Type.GRANDFATHERED,
+    BCP47Type.REDUNDANT,
+)
+"""Types that are kept in memory, in the order of their lists."""
+
+_REVERSE_INDEX_TYPES = {
+    _MACRO_LANGUAGE_MEMBERS: (BCP47Type.LANGUAGE,),
+    _SUPPRESS_SCRIPT_USERS: (BCP47Type.LANGUAGE,),
+}
+"""Types of the objects of each reverse index, the preferred value sources index could contain objects of all types."""
+
+
+class InMemoryBCP47RepositoryAbstract(BCP47RepositoryAbstract, ABC):  # pylint: disable=too-many-public-methods
     """Basic in memory implementation of
     :class:`interface.bcp47_repository.bcp47_repository_interface.BCP47RepositoryInterface`. It requires implementation
-    of :func:`abstract.bcp47_repository.in_memory_repository_abstract.InMemoryRepositoryAbstract._load_data` to work."""
+    of :func:`abstract.bcp47_repository.in_memory_repository_abstract.InMemoryRepositoryAbstract._load_data` to work.
 
-    def __init__(self):
-        self._languages: List[Language] = []
+    All objects are kept in lists and indexed in hash tables. Check
+    :class:`abstract.bcp47_repository.bcp47_repository_abstract.BCP47RepositoryAbstract` for more information about the
+    tag parser cache.
+
+    Implementations could also load types lazily: types added to _unloaded_types are loaded through
+    :func:`abstract.bcp47_repository.in_memory_repository_abstract.InMemoryRepositoryAbstract._load_tags_or_subtags`
+    the first time that they are accessed. The tag parser and canonicalization require all subtag types or all types
+    respectively."""
+
+    def __init__(self, tag_parser_cache_size: Optional[int] = None):
+        super().__init__(tag_parser_cache_size=tag_parser_cache_size)
         self._languages_scopes: List[LanguageScope] = []
-        self._ext_langs: List[ExtLang] = []
-        self._scripts: List[Script] = []
-        self._regions: List[Region] = []
-        self._variants: List[Variant] = []
-        self._grandfathered: List[Grandfathered] = []
-        self._redundant: List[Redundant] = []
-
-        self._SUBTAG_DATA_FINDER = [
-            _SubtagDataFinder(self.get_language_by_subtag, BCP47Type.LANGUAGE, 1),
-            _SubtagDataFinder(self.get_ext_lang_by_subtag, BCP47Type.EXTLANG, 3),
-            _SubtagDataFinder(self.get_script_by_subtag, BCP47Type.SCRIPT, 1),
-            _SubtagDataFinder(self.get_region_by_subtag, BCP47Type.REGION, 1),
-            _SubtagDataFinder(self.get_variant_by_subtag, BCP47Type.VARIANT, 999)
-        ]
+        self._tables = _InMemoryTables()
+        self._unloaded_types: Set[BCP47Type] = set()
+        self._unloaded_types_lock = threading.RLock()
         self._load_data()
+        self._invalidate_caches()
 
     @property
-    def languages(self) -> List[Language]:
-        return self._languages
-
-    def get_language_by_subtag(self, subtag: str, case_sensitive: bool = False) -> Language:
-        try:
-            return self._subtag_filter(subtag, self.languages, case_sensitive)
-        except TagOrSubtagNotFoundError as e:
-            raise LanguageSubtagNotFoundError(subtag) from e
+    def languages(self) -> Sequence[Language]:
+        return self._get_tags_or_subtags(BCP47Type.LANGUAGE)
 
     @property
-    def languages_scopes(self) -> List[LanguageScope]:
+    def languages_scopes(self) -> Sequence[LanguageScope]:
         return self._languages_scopes
 
-    def get_language_scope_by_name(self, name: str) -> LanguageScope:
-        try:
-            langauge_scope_enum = LanguageScopeEnum(name)
-        except ValueError as e:
-            raise LanguageScopeNotFoundError(name) from e
-
-        for bcp47_language_scope in self.languages_scopes:
-            if langauge_scope_enum == bcp47_language_scope.scope:
-                return bcp47_language_scope
-        raise RuntimeError(f'Unexpected workflow error to find a language scope: "{name}"')
-
     @property
-    def ext_langs(self) -> List[ExtLang]:
-        return self._ext_langs
-
-    def get_ext_lang_by_subtag(self, subtag: str, case_sensitive: bool = False) -> ExtLang:
-        try:
-            return self._subtag_filter(subtag, self.ext_langs, case_sensitive)
-        except TagOrSubtagNotFoundError as e:
-            raise ExtLangSubtagNotFoundError(subtag) from e
+    def ext_langs(self) -> Sequence[ExtLang]:
+        return self._get_tags_or_subtags(BCP47Type.EXTLANG)
 
     @property
-    def scripts(self) -> List[Script]:
-        return self._scripts
-
-    def get_script_by_subtag(self, subtag: str, case_sensitive: bool = False) -> Script:
-        try:
-            return self._subtag_filter(subtag, self.scripts, case_sensitive)
-        except TagOrSubtagNotFoundError as e:
-            raise ScriptSubtagNotFoundError(subtag) from e
+    def scripts(self) -> Sequence[Script]:
+        return self._get_tags_or_subtags(BCP47Type.SCRIPT)
 
     @property
-    def regions(self) -> List[Region]:
-        return self._regions
-
-    def get_region_by_subtag(self, subtag: str, case_sensitive: bool = False) -> Region:
-        try:
-            return self._subtag_filter(subtag, self.regions, case_sensitive)
-        except TagOrSubtagNotFoundError as e:
-            raise RegionSubtagNotFoundError(subtag) from e
+    def regions(self) -> Sequence[Region]:
+        return self._get_tags_or_subtags(BCP47Type.REGION)
 
     @property
-    def variants(self) -> List[Variant]:
-        return self._variants
+    def variants(self) -> Sequence[Variant]:
+        return self._get_tags_or_subtags(BCP47Type.VARIANT)
 
-    def get_variant_by_subtag(self, subtag: str, case_sensitive: bool = False) -> Variant:
-        try:
-            return self._subtag_filter(subtag, self.variants, case_sensitive)
-        except TagOrSubtagNotFoundError as e:
-            raise VariantSubtagNotFoundError(subtag) from e
+    @property
+    def grandfathered(self) -> Sequence[Grandfathered]:
+        return self._get_tags_or_subtags(BCP47Type.GRANDFATHERED)
 
     @property
-    def grandfathered(self) -> List[Grandfathered]:
-        return self._grandfathered
+    def redundant(self) -> Sequence[Redundant]:
+        return self._get_tags_or_subtags(BCP47Type.REDUNDANT)
 
-    def get_grandfathered_by_tag(self, tag: str, case_sensitive: bool = False) -> Grandfathered:
-        try:
-            return self._subtag_filter(tag, self.grandfathered, case_sensitive)
-        except TagOrSubtagNotFoundError as e:
-            raise GrandfatheredTagNotFoundError(tag) from e
+    def _get_tags_or_subtags(self, bcp47_type: BCP47Type) -> Sequence[TagsOrSubtagType]:
+        """Return the tag or subtag objects of a type in the order of the registry. The type is loaded if it is not
+        loaded yet."""
+        return self._get_tables((bcp47_type,)).tags_or_subtags[bcp47_type]
 
     @property
-    def redundant(self) -> List[Redundant]:
-        return self._redundant
-
-    def get_redundant_by_tag(self, tag: str, case_sensitive: bool = False) -> Redundant:
-        try:
-            return self._subtag_filter(tag, self.redundant, case_sensitive)
-        except TagOrSubtagNotFoundError as e:
-            raise RedundantTagNotFoundError(tag) from e
+    def _tags_or_subtags(self) -> Dict[BCP47Type, List[TagsOrSubtagType]]:
+        """Lists of the tag or subtag objects of each type, in the order of the registry."""
+        return self._tables.tags_or_subtags
 
-    def tag_parser(self, tag: str, case_sensitive: bool = False) -> ParsedTag:
-        """Method that parse a bcp47 string tag and return a dataclass with all subtags information."""
-        return ParsedTag(**self._tag_parser(tag, case_sensitive))
+    @property
+    def _indexes(self) -> Dict[BCP47Type, '_TagOrSubtagIndex']:
+        """Hash indexes of each type."""
+        return self._tables.indexes
 
-    @staticmethod
-    def _subtag_filter(subtag_str: str, tag_or_subtag_list: List[TagsOrSubtagType],
-                       case_sensitive: bool) -> TagsOrSubtagType:
-        """Method that helps to find a subtag object in a list through subtag string."""
-        if not case_sensitive:
-            subtag_str = subtag_str.lower()
-        for subtag in tag_or_subtag_list:
-            tag_str = subtag.tag_str
-            if not case_sensitive:
-                tag_str = tag_str.lower()
-            if subtag_str == tag_str:
-                return subtag
-        raise TagOrSubtagNotFoundError(subtag_str)
-
-    def _tag_parser(
-            self, tag: str,
-            case_sensitive: bool) -> Dict[str, Union[Language, ExtLang, Script, Region, Variant, ExtLang, Redundant]]:
-        """Method that parse a string tag and return a Dict with all subtag objects contained in previous string tag.
-        :raise exceptions.not_found.tag_or_subtag_not_found_error.TagOrSubtagNotFoundError:
-        """
-        tag_parsed_data = {}
-        try:
-            redundant = self.get_redundant_by_tag(tag)
-            tag_parsed_data[BCP47Type.REDUNDANT.value] = redundant
-        except RedundantTagNotFoundError:
-            pass
-
-        iterator = _SubtagDataFinderIterator(self._SUBTAG_DATA_FINDER)
-        for subtag in tag.split('-'):
-            found = False
-            while found is False:
-                try:
-                    subtag_data_finder = iterator.next()
-                except StopIteration:
-                    raise TagOrSubtagNotFoundError(f"Subtag {subtag} of {tag} is not found.")
-                try:
-                    value = subtag_data_finder.callable(subtag, case_sensitive)
-                except TagOrSubtagNotFoundError:
-                    try:
-                        iterator.next_subtag_type()
-                    except StopIteration:
-                        raise TagOrSubtagNotFoundError(f"Subtag {subtag} of {tag} is not found.")
+    @property
+    def _reverse_indexes(self) -> _ReverseIndexes:
+        """Reverse indexes of the references between objects."""
+        return self._tables.reverse_indexes
+
+    def find_languages(self,
+                       scope: Optional[Union[LanguageScopeEnum, str]] = None,
+                       deprecated: Optional[bool] = None,
+                       added_from: Optional[datetime] = None,
+                       added_to: Optional[datetime] = None) -> Iterator[Language]:
+        if isinstance(scope, str):
+            scope = self.get_language_scope_by_name(scope).scope
+        # Positions and languages are taken from the same tables, so the iteration is not affected by a diff.
+        tables = self._get_tables((BCP47Type.LANGUAGE,))
+        return map(tables.tags_or_subtags[BCP47Type.LANGUAGE].__getitem__,
+                   tables.language_indexes.find(scope, deprecated, added_from, added_to))
+
+    def _add_tag_or_subtag(self, bcp47_type: BCP47Type, tag_or_subtag: TagsOrSubtagType):
+        """Append a tag or subtag object to the list of his type and add it to the hash index of his type.
+        Implementations of :func:`InMemoryBCP47RepositoryAbstract._load_data` must load data through this method. Caches
+        are not invalidated for each object, callers that add objects after loading must invalidate them once all
+        objects are added."""
+        self._tables.add(bcp47_type, tag_or_subtag)
+
+    def _update_tags_or_subtags(self, changes: TagOrSubtagChanges):
+        """Replace loaded tag or subtag objects by new ones with the same tag or subtag string. Each change is a pair of
+        the old and the new object; the old one is None to add an object and the new one is None to remove it.
+        Replaced objects keep their position in the list of their type and added objects are appended at the end.
+
+        Changes are applied to a copy of the tables, that replaces the current ones in a single assignment once it is
+        complete, so readers in other threads see either the old or the new data and never a partially updated one.
+        Only the tables of the changed types are copied, and only the entries of the changed objects are updated."""
+        with self._unloaded_types_lock:
+            tables = self._tables.copy(changes)
+            tables.update(changes)
+            self._tables = tables
+            self._invalidate_caches()
+
+    def _find_tag_or_subtag(self, bcp47_type: BCP47Type, tag_str: str,
+                            case_sensitive: bool) -> Optional[TagsOrSubtagType]:
+        return self._get_tables((bcp47_type,)).indexes[bcp47_type].find(tag_str, case_sensitive)
+
+    def _get_subtag_candidates(self, subtag: str) -> Sequence[_SubtagCandidate]:
+        return self._get_tables(_SUBTAG_TYPES).subtags_table.get(subtag, ())
+
+    def _find_whole_tag(self, tag: str) -> Optional[_WholeTag]:
+        return self._get_tables(_WHOLE_TAG_TYPES).whole_tags_table.get(tag)
+
+    def _find_referrers(self, reverse_index: str, tag_str: str) -> Tuple[TagsOrSubtagType, ...]:
+        tables = self._get_tables(_REVERSE_INDEX_TYPES.get(reverse_index, _IN_MEMORY_TYPES))
+        return getattr(tables.reverse_indexes, reverse_index).get(tag_str, ())
+
+    def _get_variant_prefixes(self, variant: Variant) -> Optional[_VariantPrefixes]:
+        return self._tables.variant_prefixes.get(variant.subtag.lower())
+
+    def _get_language_indexes(self) -> _LanguageIndexes:
+        return self._get_tables((BCP47Type.LANGUAGE,)).language_indexes
+
+    def _get_language_by_position(self, position: int) -> Language:
+        return self._tables.tags_or_subtags[BCP47Type.LANGUAGE][position]
+
+    def _get_dense_ids(self, bcp47_type: BCP47Type) -> _DenseIds:
+        return self._get_tables((bcp47_type,)).dense_ids[bcp47_type]
+
+    def _get_canonicalization_tables(self) -> _CanonicalizationTables:
+        return self._get_tables(_IN_MEMORY_TYPES).canonicalization_tables
+
+    def _get_tables(self, bcp47_types: Iterable[BCP47Type]) -> '_InMemoryTables':
+        """Return the current tables once the types are loaded."""
+        self._ensure_loaded(bcp47_types)
+        return self._tables
+
+    def _ensure_loaded(self, bcp47_types: Iterable[BCP47Type]):
+        """Load the types that are not loaded yet. A type is only marked as loaded once all his objects are added, so
+        other threads wait for the lock instead of reading a partially loaded type."""
+        if not self._unloaded_types:
+            return
+        for bcp47_type in bcp47_types:
+            if bcp47_type not in self._unloaded_types:
+                continue
+            with self._unloaded_types_lock:
+                if bcp47_type not in self._unloaded_types:
                     continue
+                for tag_or_subtag in self._load_tags_or_subtags(bcp47_type):
+                    self._add_tag_or_subtag(bcp47_type, tag_or_subtag)
+                self._unloaded_types.discard(bcp47_type)
+                self._invalidate_caches()
 
-                if subtag_data_finder.max_subtags == 1:
-                    tag_parsed_data[subtag_data_finder.bcp47_subtag_type.value] = value
-                else:
-                    try:
-                        tag_parsed_data[subtag_data_finder.bcp47_subtag_type.value].append(value)
-                    except KeyError:
-                        tag_parsed_data[subtag_data_finder.bcp47_subtag_type.value] = [value]
-                found = True
-        return tag_parsed_data
+    def _load_tags_or_subtags(self, bcp47_type: BCP47Type) -> List[TagsOrSubtagType]:
+        """Return all objects of a type that is not loaded yet. Implementations that add types to _unloaded_types must
+        override it."""
+        raise NotImplementedError(bcp47_type)
 
     @abc.abstractmethod
     def _load_data(self):
@@ -203,44 +208,184 @@ class InMemoryBCP47RepositoryAbstract(BCP47RepositoryInterface, ABC):
 
 
 @dataclasses.dataclass
-class _SubtagDataFinder:
-    """Dataclass that have the relationship between bcp47 subtag type and the method that should be called to search
-    the subtag. _SUBTAG_DATA_FINDER constant is a list that contains instances of this class that are used search in
-    a specific order to parse a bcp47 tag."""
-    callable: Callable[[str, bool], Any]
-    bcp47_subtag_type: BCP47Type
-    max_subtags: int
-
-    def add_subtag_to_tag_parsed_data(self, tag_parsed_data: _TagParsedData, value: SubtagType) -> _TagParsedData:
-        if self.max_subtags == 1:
-            tag_parsed_data['bcp47_subtag_type'] = value
-        else:
-            try:
-                tag_parsed_data['bcp47_subtag_type'].append(value)
-            except KeyError:
-                tag_parsed_data['bcp47_subtag_type'] = [value]
-        return tag_parsed_data
-
-
-class _SubtagDataFinderIterator:
-
-    def __init__(self, subtag_data_finder: List[_SubtagDataFinder]):
-        self._subtag_data_finder = subtag_data_finder
-        self._list_iteration = 0
-        self._subtag_repetition = -1
-
-    def next(self) -> _SubtagDataFinder:
-        self._subtag_repetition += 1
-        if self._subtag_data_finder[self._list_iteration].max_subtags <= self._subtag_repetition:
-            return self._next_subtag_finder()
-        return self._subtag_data_finder[self._list_iteration]
-
-    def _next_subtag_finder(self) -> _SubtagDataFinder:
-        self.next_subtag_type()
-        return self.next()
-
-    def next_subtag_type(self):
-        self._subtag_repetition = -1
-        self._list_iteration += 1
-        if len(self._subtag_data_finder) <= self._list_iteration:
-            raise StopIteration
+class _TagOrSubtagIndex:
+    """Dataclass that contains the hash indexes of a tag or subtag type. The case-sensitive dict use the tag or subtag
+    string as key and the case-folded dict use the lower case tag or subtag string as key. If some tag or subtag string
+    is repeated, the first one that is added is the one that is indexed."""
+    case_sensitive: Dict[str, TagsOrSubtagType] = dataclasses.field(default_factory=dict)
+    case_folded: Dict[str, TagsOrSubtagType] = dataclasses.field(default_factory=dict)
+
+    def add(self, tag_or_subtag: TagsOrSubtagType):
+        """Add a tag or subtag object to the indexes."""
+        tag_str = tag_or_subtag.tag_str
+        self.case_sensitive.setdefault(tag_str, tag_or_subtag)
+        self.case_folded.setdefault(tag_str.lower(), tag_or_subtag)
+
+    def replace(self, old: TagsOrSubtagType, new: TagsOrSubtagType):
+        """Replace an indexed tag or subtag object by a new one with the same tag or subtag string."""
+        tag_str = old.tag_str
+        if self.case_sensitive.get(tag_str) is old:
+            self.case_sensitive[tag_str] = new
+        if self.case_folded.get(tag_str.lower()) is old:
+            self.case_folded[tag_str.lower()] = new
+
+    def copy(self) -> '_TagOrSubtagIndex':
+        """Return a copy whose indexes could be modified without changing this one."""
+        return _TagOrSubtagIndex(dict(self.case_sensitive), dict(self.case_folded))
+
+    def find(self, tag_str: str, case_sensitive: bool) -> Optional[TagsOrSubtagType]:
+        """Method that helps to find a tag or subtag object through tag or subtag string. Return None if it is not
+        found."""
+        if case_sensitive:
+            return self.case_sensitive.get(tag_str)
+        return self.case_folded.get(tag_str.lower())
+
+
+@dataclasses.dataclass
+class _InMemoryTables:
+    """Dataclass that contains the lists of the tag or subtag objects of each type and all the tables that are built
+    from them. The tables of a repository are replaced as a whole when his data changes, so readers always see a
+    consistent version."""
+    tags_or_subtags: Dict[BCP47Type, List[TagsOrSubtagType]] = dataclasses.field(
+        default_factory=lambda: {bcp47_type: [] for bcp47_type in _IN_MEMORY_TYPES})
+    indexes: Dict[BCP47Type, _TagOrSubtagIndex] = dataclasses.field(
+        default_factory=lambda: {bcp47_type: _TagOrSubtagIndex() for bcp47_type in _IN_MEMORY_TYPES})
+    subtags_table: Dict[str, List[_SubtagCandidate]] = dataclasses.field(default_factory=dict)
+    whole_tags_table: Dict[str, _WholeTag] = dataclasses.field(default_factory=dict)
+    canonicalization_tables: _CanonicalizationTables = dataclasses.field(default_factory=_CanonicalizationTables)
+    reverse_indexes: _ReverseIndexes = dataclasses.field(default_factory=_ReverseIndexes)
+    language_indexes: _LanguageIndexes = dataclasses.field(default_factory=_LanguageIndexes)
+    variant_prefixes: Dict[str, Optional[_VariantPrefixes]] = dataclasses.field(default_factory=dict)
+    dense_ids: Dict[BCP47Type, _DenseIds] = dataclasses.field(
+        default_factory=lambda: {bcp47_type: _DenseIds() for bcp47_type in _IN_MEMORY_TYPES})
+
+    def add(self, bcp47_type: BCP47Type, tag_or_subtag: TagsOrSubtagType):
+        """Append a tag or subtag object to the list of his type and add it to all the tables."""
+        self.tags_or_subtags[bcp47_type].append(tag_or_subtag)
+        self.indexes[bcp47_type].add(tag_or_subtag)
+        self.dense_ids[bcp47_type].add(tag_or_subtag.tag_str)
+        if subtag_type := _SUBTAG_TYPES.get(bcp47_type):
+            self._add_subtag_candidate(subtag_type, tag_or_subtag)
+        if bcp47_type is BCP47Type.LANGUAGE:
+            self.language_indexes.add(*self._get_language_criteria(tag_or_subtag))
+        elif bcp47_type is BCP47Type.VARIANT:
+            self.variant_prefixes.setdefault(tag_or_subtag.subtag.lower(), _VariantPrefixes.from_variant(tag_or_subtag))
+        elif bcp47_type in _WHOLE_TAG_TYPES:
+            self.whole_tags_table.setdefault(tag_or_subtag.tag.lower(), _WholeTag(bcp47_type, tag_or_subtag))
+        self.canonicalization_tables.add(bcp47_type, tag_or_subtag)
+        self.reverse_indexes.add(bcp47_type, tag_or_subtag)
+
+    def copy(self, bcp47_types: Iterable[BCP47Type]) -> '_InMemoryTables':
+        """Return a copy that could be updated with changes of the types without changing these tables. The lists, hash
+        indexes and dense IDs of other types and the values of the tables are shared, because
+        :func:`_InMemoryTables.update` replaces them instead of modifying them."""
+        bcp47_types = set(bcp47_types)
+        return _InMemoryTables(
+            tags_or_subtags={bcp47_type: list(tags_or_subtags) if bcp47_type in bcp47_types else tags_or_subtags
+                             for bcp47_type, tags_or_subtags in self.tags_or_subtags.items()},
+            indexes={bcp47_type: index.copy() if bcp47_type in bcp47_types else index
+                     for bcp47_type, index in self.indexes.items()},
+            subtags_table=dict(self.subtags_table),
+            whole_tags_table=dict(self.whole_tags_table),
+            canonicalization_tables=self.canonicalization_tables.copy(),
+            reverse_indexes=self.reverse_indexes.copy(),
+            language_indexes=(self.language_indexes.copy()
+                              if BCP47Type.LANGUAGE in bcp47_types else self.language_indexes),
+            variant_prefixes=dict(self.variant_prefixes),
+            dense_ids={bcp47_type: dense_ids.copy() if bcp47_type in bcp47_types else dense_ids
+                       for bcp47_type, dense_ids in self.dense_ids.items()},
+        )
+
+    def update(self, changes: TagOrSubtagChanges):
+        """Apply the changes of :func:`InMemoryBCP47RepositoryAbstract._update_tags_or_subtags` to the tables.
+
+        Only the entries of the changed objects are updated, except for types with removed objects: positions of those
+        types are shifted, so their hash indexes, dense IDs and language indexes are rebuilt from their lists."""
+        for bcp47_type, type_changes in changes.items():
+            replacements = {id(old): new for old, new in type_changes if old is not None}
+            added = [new for old, new in type_changes if old is None]
+            if any(new is None for new in replacements.values()):
+                self._rebuild(bcp47_type, [
+                    *(new for tag_or_subtag in self.tags_or_subtags[bcp47_type]
+                      if (new := replacements.get(id(tag_or_subtag), tag_or_subtag)) is not None),
+                    *added,
+                ])
+                continue
+
+            tags_or_subtags = self.tags_or_subtags[bcp47_type]
+            for position, tag_or_subtag in enumerate(tags_or_subtags):
+                if (new := replacements.get(id(tag_or_subtag))) is not None:
+                    tags_or_subtags[position] = new
+                    self.indexes[bcp47_type].replace(tag_or_subtag, new)
+                    if bcp47_type is BCP47Type.LANGUAGE:
+                        self.language_indexes.replace(position, *self._get_language_criteria(new))
+            for tag_or_subtag in added:
+                tags_or_subtags.append(tag_or_subtag)
+                self.indexes[bcp47_type].add(tag_or_subtag)
+                self.dense_ids[bcp47_type].add(tag_or_subtag.tag_str)
+                if bcp47_type is BCP47Type.LANGUAGE:
+                    self.language_indexes.add(*self._get_language_criteria(tag_or_subtag))
+
+        for bcp47_type, type_changes in changes.items():
+            for old, new in type_changes:
+                for tag_str in {tag_or_subtag.tag_str for tag_or_subtag in (old, new) if tag_or_subtag is not None}:
+                    self._update_entries(bcp47_type, tag_str)
+                self.reverse_indexes.replace(bcp47_type, old, new)
+
+    def _rebuild(self, bcp47_type: BCP47Type, tags_or_subtags: List[TagsOrSubtagType]):
+        """Replace the list of a type and rebuild the indexes of the type that depend on the positions."""
+        self.tags_or_subtags[bcp47_type][:] = tags_or_subtags
+        self.indexes[bcp47_type] = _TagOrSubtagIndex()
+        self.dense_ids[bcp47_type] = _DenseIds()
+        if bcp47_type is BCP47Type.LANGUAGE:
+            self.language_indexes = _LanguageIndexes()
+        for tag_or_subtag in tags_or_subtags:
+            self.indexes[bcp47_type].add(tag_or_subtag)
+            self.dense_ids[bcp47_type].add(tag_or_subtag.tag_str)
+            if bcp47_type is BCP47Type.LANGUAGE:
+                self.language_indexes.add(*self._get_language_criteria(tag_or_subtag))
+
+    def _update_entries(self, bcp47_type: BCP47Type, tag_str: str):
+        """Update the entries of a tag or subtag string in the tables used by the tag parser and canonicalization from
+        the hash indexes, that must be already updated."""
+        key = tag_str.lower()
+        tag_or_subtag = self.indexes[bcp47_type].case_folded.get(key)
+        if subtag_type := _SUBTAG_TYPES.get(bcp47_type):
+            if candidates := [candidate for candidate in self.subtags_table.pop(key, ())
+                              if candidate.subtag_type is not subtag_type]:
+                self.subtags_table[key] = candidates
+            if tag_or_subtag is not None:
+                self._add_subtag_candidate(subtag_type, tag_or_subtag)
+        if bcp47_type is BCP47Type.VARIANT:
+            self.variant_prefixes.pop(key, None)
+            if tag_or_subtag is not None:
+                self.variant_prefixes[key] = _VariantPrefixes.from_variant(tag_or_subtag)
+
+        self.canonicalization_tables.remove(bcp47_type, tag_str)
+        if bcp47_type not in _WHOLE_TAG_TYPES:
+            if (tag_or_subtag := self.indexes[bcp47_type].case_sensitive.get(tag_str)) is not None:
+                self.canonicalization_tables.add(bcp47_type, tag_or_subtag)
+            return
+
+        self.whole_tags_table.pop(key, None)
+        for whole_tag_type in _WHOLE_TAG_TYPES:
+            if (tag_or_subtag := self.indexes[whole_tag_type].case_folded.get(key)) is not None:
+                self.whole_tags_table.setdefault(key, _WholeTag(whole_tag_type, tag_or_subtag))
+                self.canonicalization_tables.add(whole_tag_type, tag_or_subtag)
+
+    def _add_subtag_candidate(self, subtag_type: _SubtagType, subtag: SubtagType):
+        """Add a subtag object to the table used by the tag parser. The table use the lower case subtag string as key
+        and contains all the subtag objects with that subtag string, sorted by the position of their type in a tag. Only
+        the first subtag object of each type is added, the same one as the hash index of the type. Lists of candidates
+        are replaced instead of modified, so they could be shared with a copy of the tables."""
+        key = subtag.subtag.lower()
+        candidates = self.subtags_table.get(key, [])
+        if any(candidate.subtag_type is subtag_type for candidate in candidates):
+            return
+        self.subtags_table[key] = sorted([*candidates, _SubtagCandidate(subtag_type, subtag)],
+                                         key=lambda candidate: candidate.subtag_type.position)
+
+    @staticmethod
+    def _get_language_criteria(language: Language) -> Tuple[Optional[LanguageScopeEnum], bool, datetime]:
+        """Return the scope, the deprecated flag and the added date of a language, as they are indexed."""
+        return language.scope.scope if language.scope else None, language.deprecated is not None, language.added
@@ -0,0 +1,180 @@
+"""Module related with ArrowExporter class. It requires PyArrow, that is installed with the "arrow" extra."""
+import dataclasses
+import os
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from enums.bcp47_type import BCP47Type
+from interface.bcp47_repository.bcp47_repository_interface import BCP47RepositoryInterface
+from schemas.abstract.preferred_value import PreferredValue
+from type_aliases import TagsOrSubtagType
+
+
+class ArrowExporter:
+    """Exporter of the data of a repository as one Apache Arrow table for each type, that could be written as Parquet
+    files to be used as dimension tables.
+
+    Each table has an "id" column with the dense ID of each tag or subtag, his position in the registry starting from 1,
+    that is the same ID used by tag codes. References to other tags or subtags, like the macro language, the suppress
+    script, the prefixes or the preferred value, are foreign key columns with the ID of the referenced row. Preferred
+    values and prefixes that are tags also have a column with the tag in string format.
+
+    Columns are built directly from the attributes of the loaded objects, without dumping them to dicts."""
+
+    def __init__(self, repository: BCP47RepositoryInterface):
+        self._repository = repository
+
+    def get_tables(self) -> Dict[str, pa.Table]:
+        """Return the tables of all types by their name: languages, ext_langs, scripts, regions, variants, grandfathered
+        and redundant."""
+        tags_or_subtags = {bcp47_type: getattr(self._repository, table.name) for bcp47_type, table in _TABLES.items()}
+        foreign_key = _ForeignKey({bcp47_type: self._get_ids(items) for bcp47_type, items in tags_or_subtags.items()})
+        return {table.name: self._get_table(table, tags_or_subtags[bcp47_type], foreign_key)
+                for bcp47_type, table in _TABLES.items()}
+
+    def write_parquet(self, dir_path: str, **kwargs: Any) -> Dict[str, str]:
+        """Write each table as a Parquet file named as the table in a directory and return the path of each table.
+        Keyword arguments are passed to :func:`pyarrow.parquet.write_table`."""
+        os.makedirs(dir_path, exist_ok=True)
+        file_paths = {}
+        for name, table in self.get_tables().items():
+            file_paths[name] = os.path.join(dir_path, f'{name}.parquet')
+            pq.write_table(table, file_paths[name], **kwargs)
+        return file_paths
+
+    @staticmethod
+    def _get_table(table: '_Table', tags_or_subtags: Sequence[TagsOrSubtagType],
+                   foreign_key: '_ForeignKey') -> pa.Table:
+        """Return the table of the tags or subtags of a type. Each column is built from a list of his values."""
+        columns = {'id': pa.array(range(1, len(tags_or_subtags) + 1), type=_ID)}
+        for column in (*table.columns, *_COMMON_COLUMNS):
+            columns[column.name] = pa.array([column.get_value(item, foreign_key) for item in tags_or_subtags],
+                                            type=column.arrow_type)
+        return pa.table(columns)
+
+    @staticmethod
+    def _get_ids(tags_or_subtags: Sequence[TagsOrSubtagType]) -> Dict[str, int]:
+        """Return the IDs of the tags or subtags of a type by their lower case tag or subtag string. If some tag or
+        subtag string is repeated, the first one is the one that is referenced."""
+        ids: Dict[str, int] = {}
+        for position, tag_or_subtag in enumerate(tags_or_subtags, 1):
+            ids.setdefault(tag_or_subtag.tag_str.lower(), position)
+        return ids
+
+
+@dataclasses.dataclass
+class _ForeignKey:
+    """Dataclass that resolves the ID of the tags or subtags that are referenced by other tags or subtags."""
+    ids: Dict[BCP47Type, Dict[str, int]]
+
+    def get(self, bcp47_type: BCP47Type, tag_or_subtag: Optional[TagsOrSubtagType]) -> Optional[int]:
+        """Return the ID of a referenced tag or subtag or None if there is no reference."""
+        return self.ids[bcp47_type].get(tag_or_subtag.tag_str.lower()) if tag_or_subtag is not None else None
+
+    def get_many(self, bcp47_type: BCP47Type, tags_or_subtags: Sequence[TagsOrSubtagType]) -> List[int]:
+        """Return the IDs of several referenced tags or subtags."""
+        return [self.get(bcp47_type, tag_or_subtag) for tag_or_subtag in tags_or_subtags]
+
+
+@dataclasses.dataclass(frozen=True)
+class _Column:
+    """Dataclass that describes a column of a table: his name, his Arrow type and how his value is obtained from a tag
+    or subtag object."""
+    name: str
+    arrow_type: pa.DataType
+    get_value: Callable[[TagsOrSubtagType, _ForeignKey], Any]
+
+
+@dataclasses.dataclass(frozen=True)
+class _Table:
+    """Dataclass that describes the table of a type: his name, that is the name of the property of the repository, and
+    his columns."""
+    name: str
+    columns: Tuple[_Column, ...]
+
+
+def _get_preferred_value_tag(tag_or_subtag: TagsOrSubtagType) -> Optional[str]:
+    """Return the preferred value of a tag or subtag object in string format or None if it does not have one."""
+    if (preferred_value := getattr(tag_or_subtag, 'preferred_value', None)) is None:
+        return None
+    return PreferredValue.format_tag(preferred_value)
+
+
+def _get_preferred_value_subtag(tag_or_subtag: TagsOrSubtagType, field_name: str) -> Optional[TagsOrSubtagType]:
+    """Return a subtag of the preferred value of a tag or subtag object or None if it does not have one."""
+    return getattr(getattr(tag_or_subtag, 'preferred_value', None), field_name, None)
+
+
+_ID = pa.int32()
+_STRINGS = pa.list_(pa.string())
+_TIMESTAMP = pa.timestamp('us')
+
+_SUBTAG_COLUMN = _Column('subtag', pa.string(), lambda item, foreign_key: item.subtag)
+_TAG_COLUMN = _Column('tag', pa.string(), lambda item, foreign_key: item.tag)
+_COMMON_COLUMNS = (
+    _Column('description', _STRINGS, lambda item, foreign_key: list(item.description)),
+    _Column('comments', _STRINGS, lambda item, foreign_key: list(getattr(item, 'comments', ()))),
+    _Column('added', _TIMESTAMP, lambda item, foreign_key: item.added),
+    _Column('deprecated', _TIMESTAMP, lambda item, foreign_key: getattr(item, 'deprecated', None)),
+    _Column('updated_at', _TIMESTAMP, lambda item, foreign_key: item.updated_at),
+)
+_PREFERRED_VALUE_COLUMN = _Column('preferred_value', pa.string(),
+                                  lambda item, foreign_key: _get_preferred_value_tag(item))
+
+_TABLES: Dict[BCP47Type, _Table] = {
+    BCP47Type.LANGUAGE: _Table('languages', (
+        _SUBTAG_COLUMN,
+        _Column('scope', pa.string(), lambda item, foreign_key: item.scope.scope.value if item.scope else None),
+        _Column('macro_language_id', _ID,
+                lambda item, foreign_key: foreign_key.get(BCP47Type.LANGUAGE, item.macro_language)),
+        _Column('suppress_script_id', _ID,
+                lambda item, foreign_key: foreign_key.get(BCP47Type.SCRIPT, item.suppress_script)),
+        _Column('preferred_value_id', _ID, lambda item, foreign_key: foreign_key.get(
+            BCP47Type.LANGUAGE, _get_preferred_value_subtag(item, 'language'))),
+    )),
+    BCP47Type.EXTLANG: _Table('ext_langs', (
+        _SUBTAG_COLUMN,
+        _Column('prefix_language_ids', pa.list_(_ID), lambda item, foreign_key: foreign_key.get_many(
+            BCP47Type.LANGUAGE, [prefix.language for prefix in item.prefix])),
+        _Column('macro_language_id', _ID,
+                lambda item, foreign_key: foreign_key.get(BCP47Type.LANGUAGE, item.macro_language)),
+        _Column('preferred_value_id', _ID, lambda item, foreign_key: foreign_key.get(
+            BCP47Type.LANGUAGE, _get_preferred_value_subtag(item, 'language'))),
+    )),
+    BCP47Type.SCRIPT: _Table('scripts', (_SUBTAG_COLUMN,)),
+    BCP47Type.REGION: _Table('regions', (
+        _SUBTAG_COLUMN,
+        _Column('preferred_value_id', _ID, lambda item, foreign_key: foreign_key.get(
+            BCP47Type.REGION, _get_preferred_value_subtag(item, 'region'))),
+    )),
+    BCP47Type.VARIANT: _Table('variants', (
+        _SUBTAG_COLUMN,
+        _Column('prefix', _STRINGS, lambda item, foreign_key: [prefix.tag for prefix in item.prefix]),
+        _Column('prefix_language_ids', pa.list_(_ID), lambda item, foreign_key: foreign_key.get_many(
+            BCP47Type.LANGUAGE, [prefix.language for prefix in item.prefix])),
+        _Column('preferred_value_ids', pa.list_(_ID), lambda item, foreign_key: foreign_key.get_many(
+            BCP47Type.VARIANT, _get_preferred_value_subtag(item, 'variant') or ())),
+    )),
+    BCP47Type.GRANDFATHERED: _Table('grandfathered', (
+        _TAG_COLUMN,
+        _PREFERRED_VALUE_COLUMN,
+        _Column('preferred_value_language_id', _ID, lambda item, foreign_key: foreign_key.get(
+            BCP47Type.LANGUAGE, _get_preferred_value_subtag(item, 'language'))),
+    )),
+    BCP47Type.REDUNDANT: _Table('redundant', (
+        _TAG_COLUMN,
+        _Column('language_id', _ID, lambda item, foreign_key: foreign_key.get(BCP47Type.LANGUAGE,
+                                                                              item.subtags.language)),
+        _Column('ext_lang_ids', pa.list_(_ID),
+                lambda item, foreign_key: foreign_key.get_many(BCP47Type.EXTLANG, item.subtags.extlang)),
+        _Column('script_id', _ID, lambda item, foreign_key: foreign_key.get(BCP47Type.SCRIPT, item.subtags.script)),
+        _Column('region_id', _ID, lambda item, foreign_key: foreign_key.get(BCP47Type.REGION, item.subtags.region)),
+        _Column('variant_ids', pa.list_(_ID),
+                lambda item, foreign_key: foreign_key.get_many(BCP47Type.VARIANT, item.subtags.variant)),
+        _PREFERRED_VALUE_COLUMN,
+        _Column('preferred_value_language_id', _ID, lambda item, foreign_key: foreign_key.get(
+            BCP47Type.LANGUAGE, _get_preferred_value_subtag(item, 'language'))),
+    )),
+}
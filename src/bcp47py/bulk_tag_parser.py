@@ -0,0 +1,80 @@
+"""Module related with BulkTagParser class. It requires NumPy, that is installed with the "numpy" extra."""
+from typing import Any, Iterable, Union
+
+import numpy as np
+
+from enums.bcp47_type import BCP47Type
+from exceptions.invalid.invalid_tag_code_error import InvalidTagCodeError
+from exceptions.not_found.tag_or_subtag_not_found_error import TagOrSubtagNotFoundError
+from interface.bcp47_repository.bcp47_repository_interface import BCP47RepositoryInterface
+from schemas.bulk_parsed_tags import BulkParsedTags
+
+
+class BulkTagParser:
+    """Parser of arrays of string tags, like the columns of a dataframe, that returns parallel NumPy arrays instead of
+    a :class:`schemas.parsed_tag.ParsedTag` for each tag.
+
+    Each distinct tag is only parsed once: tags are reduced to their distinct values with :func:`numpy.unique`, each
+    distinct tag is encoded with
+    :func:`interface.bcp47_repository.bcp47_repository_interface.BCP47RepositoryInterface.encode_tag` and canonicalized,
+    and the results are broadcast back to the tags with the inverse indexes. The dense IDs of the subtags are extracted
+    from the tag codes with vectorized bit operations."""
+    _ID_DTYPE = np.int32
+
+    def __init__(self, repository: BCP47RepositoryInterface):
+        self._repository = repository
+
+    def parse(self, tags: Union[Iterable[str], Any], case_sensitive: bool = False) -> BulkParsedTags:
+        """Parse an array or iterable of string tags. Values that are not strings, like None or NaN, and tags that could
+        not be parsed are not valid, so one invalid tag does not fail the whole array."""
+        tags = np.asarray(tags if hasattr(tags, '__len__') else list(tags)).ravel()
+        if tags.dtype.kind != 'U':
+            tags = tags.astype(object)
+            is_str = np.fromiter((isinstance(tag, str) for tag in tags), dtype=bool, count=len(tags))
+            tags = np.where(is_str, tags, '').astype(str)
+        distinct_tags, inverse = np.unique(tags, return_inverse=True)
+        inverse = inverse.ravel()
+
+        codes = np.zeros(len(distinct_tags), dtype=np.int64)
+        valid = np.zeros(len(distinct_tags), dtype=bool)
+        canonical_forms = np.full(len(distinct_tags), '', dtype=object)
+        for index, tag in enumerate(distinct_tags.tolist()):
+            try:
+                codes[index] = self._encode_components(tag, case_sensitive)
+                canonical_forms[index] = self._repository.canonicalize(tag)
+            except (TagOrSubtagNotFoundError, InvalidTagCodeError):
+                continue
+            valid[index] = True
+
+        canonical_tags, canonical_indices = np.unique(canonical_forms[valid].astype(str), return_inverse=True)
+        distinct_canonical_indices = np.full(len(distinct_tags), -1, dtype=np.int64)
+        distinct_canonical_indices[valid] = canonical_indices.ravel()
+
+        tag_code_layout = self._repository.tag_code_layout
+        subtag_ids = {
+            bcp47_type: tag_code_layout.get_slot(bcp47_type).get_dense_id(codes).astype(self._ID_DTYPE)[inverse]
+            for bcp47_type in (BCP47Type.LANGUAGE, BCP47Type.SCRIPT, BCP47Type.REGION)
+        }
+        return BulkParsedTags(valid=valid[inverse],
+                              language_ids=subtag_ids[BCP47Type.LANGUAGE],
+                              script_ids=subtag_ids[BCP47Type.SCRIPT],
+                              region_ids=subtag_ids[BCP47Type.REGION],
+                              canonical_indices=distinct_canonical_indices[inverse],
+                              canonical_tags=canonical_tags)
+
+    def _encode_components(self, tag: str, case_sensitive: bool) -> int:
+        """Return a tag code whose slots of the language, script and region contain the dense IDs of the tag. Codes of
+        the overflow table do not contain them, so the tag is encoded again only with those subtags, and grandfathered
+        tags do not have them, so their code is 0.
+
+        :raise exceptions.not_found.tag_or_subtag_not_found_error.TagOrSubtagNotFoundError:
+        :raise exceptions.invalid.invalid_tag_code_error.InvalidTagCodeError: the code of the overflow table is evicted
+            before it is decoded."""
+        code = self._repository.encode_tag(tag, case_sensitive)
+        if self._repository.tag_code_layout.is_grandfathered(code):
+            return 0
+        if self._repository.tag_code_layout.is_overflow(code):
+            parsed_tag = self._repository.decode_tag(code)
+            return self._repository.encode_tag('-'.join(
+                subtag.subtag for subtag in (parsed_tag.language, parsed_tag.script, parsed_tag.region) if subtag))
+        return code
@@ -0,0 +1,80 @@
+"""Module related with LRUCache class."""
+import threading
+from collections import OrderedDict
+from typing import Generic, TypeVar, Hashable, Optional
+
+from schemas.cache_info import CacheInfo
+
+_KeyType = TypeVar('_KeyType', bound=Hashable)
+_ValueType = TypeVar('_ValueType')
+
+
+class LRUCache(Generic[_KeyType, _ValueType]):
+    """Thread-safe cache bounded by a max size. When the cache is full, the least recently used entry is evicted. It
+    counts hits, misses and evictions.
+
+    Each invalidation starts a new generation. Values that are computed from data that could change are put with the
+    generation that was read before computing them, so they are discarded if the cache was invalidated meanwhile."""
+
+    def __init__(self, max_size: int):
+        if max_size <= 0:
+            raise ValueError(f'Max size of the cache must be greater than 0: "{max_size}".')
+        self._max_size = max_size
+        self._data: 'OrderedDict[_KeyType, _ValueType]' = OrderedDict()
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """Return the number of invalidations of the cache."""
+        return self._generation
+
+    def get(self, key: _KeyType) -> Optional[_ValueType]:
+        """Return the value of the key and mark it as the most recently used. If the key is not cached return None."""
+        with self._lock:
+            try:
+                value = self._data[key]
+            except KeyError:
+                self._misses += 1
+                return None
+            self._data.move_to_end(key)
+            self._hits += 1
+            return value
+
+    def put(self, key: _KeyType, value: _ValueType, generation: Optional[int] = None):
+        """Cache the value of the key. If the cache is full the least recently used entry is evicted. If a generation is
+        provided and the cache was invalidated after it, the value is not cached."""
+        with self._lock:
+            if generation is not None and generation != self._generation:
+                return
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self._max_size:
+                self._data.popitem(last=False)
+                self._evictions += 1
+
+    def invalidate(self):
+        """Remove all entries of the cache keeping the statistics and start a new generation."""
+        with self._lock:
+            self._data.clear()
+            self._generation += 1
+
+    def clear(self):
+        """Remove all entries of the cache and reset the statistics."""
+        with self._lock:
+            self._data.clear()
+            self._hits = 0
+            self._misses = 0
+            self._evictions = 0
+
+    def cache_info(self) -> CacheInfo:
+        """Return the statistics of the cache."""
+        with self._lock:
+            return CacheInfo(hits=self._hits,
+                             misses=self._misses,
+                             evictions=self._evictions,
+                             max_size=self._max_size,
+                             current_size=len(self._data))
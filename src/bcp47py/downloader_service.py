@@ -1,41 +1,122 @@
 """Utility module that update language subtag registry."""
-from typing import Annotated
-from urllib.request import urlopen
-
-from pydantic import Field
+import gzip
+import json
+import os
+import shutil
+import stat
+import tempfile
+from http import HTTPStatus
+from typing import Dict, Optional, BinaryIO
+from urllib.error import HTTPError
+from urllib.request import Request, urlopen
 
 from mixin.base import Base
 
-_FILE_CONTENT_FIELD_INFO = Field(title="File Content",
-                                 description="""File content in string format.""",
-                                 examples=[
-                                     """File-Date: 2023-10-16
-        %%
-        Type: language
-        Subtag: aa
-        Description: Afar
-        Added: 2005-10-16
-        %%
-        ...""",
-                                 ])
-
 
 class DownloaderService(Base):  # pylint: disable=too-few-public-methods
-    """Utility class that update language subtag registry."""
+    """Utility class that update language subtag registry.
+
+    Downloads are conditional: the 'ETag' and 'Last-Modified' headers of the last download are stored in a metadata
+    file next to the language subtag registry and they are sent as 'If-None-Match' and 'If-Modified-Since', so the
+    registry is not transferred again if it is not modified. The registry is requested with gzip encoding and it is
+    streamed to a temporary file in the same directory that replaces the registry with an atomic rename, so readers
+    never see a half-written registry. If the 'File-Date' of the downloaded registry is the same as the current one, the
+    registry is not replaced."""
     _LANGUAGE_SUBTAG_REGISTRY_URL = 'https://www.iana.org/assignments/language-subtag-registry/language-subtag-registry'
+    _METADATA_FILE_SUFFIX = '.http.json'
+    _FILE_HEADER = b'File-Date: '
+    _DEFAULT_FILE_MODE = 0o644
+    _CHUNK_SIZE = 1 << 16
+    _TIMEOUT = 60
+
+    def download(self) -> bool:
+        """Method that update language subtag registry. Return if the registry was replaced.
+
+        :raise RuntimeError: the downloaded data is not a language subtag registry.
+        :raise urllib.error.URLError:"""
+        file_path = os.fspath(self._LANGUAGE_SUBTAG_REGISTRY_FILE_PATH)
+        request = Request(self._LANGUAGE_SUBTAG_REGISTRY_URL, headers=self._get_request_headers(file_path))
+        try:
+            with urlopen(request, timeout=self._TIMEOUT) as response:
+                tmp_file_path = self._write_tmp_file(file_path, response)
+                metadata = {'etag': response.headers.get('ETag'),
+                            'last_modified': response.headers.get('Last-Modified')}
+        except HTTPError as e:
+            if e.code == HTTPStatus.NOT_MODIFIED:
+                return False
+            raise
+
+        try:
+            if (file_date := self._get_file_date(tmp_file_path)) is None:
+                raise RuntimeError("Problems to download BCP47 data.")
+            replaced = file_date != self._get_file_date(file_path)
+            if replaced:
+                os.chmod(tmp_file_path, stat.S_IMODE(os.stat(file_path).st_mode) if os.path.exists(file_path)
+                         else self._DEFAULT_FILE_MODE)
+                os.replace(tmp_file_path, file_path)
+        finally:
+            if os.path.exists(tmp_file_path):
+                os.remove(tmp_file_path)
+
+        self._dump_metadata(file_path, metadata)
+        return replaced
+
+    def _get_request_headers(self, file_path: str) -> Dict[str, str]:
+        """Return the headers of the request: gzip encoding and the conditional headers of the last download if the
+        registry exists."""
+        headers = {'Accept-Encoding': 'gzip'}
+        if not os.path.exists(file_path):
+            return headers
+        try:
+            with open(file_path + self._METADATA_FILE_SUFFIX, 'r', encoding='utf-8') as f:
+                metadata = json.load(f)
+        except (OSError, ValueError):
+            return headers
+        if etag := metadata.get('etag'):
+            headers['If-None-Match'] = etag
+        if last_modified := metadata.get('last_modified'):
+            headers['If-Modified-Since'] = last_modified
+        return headers
 
-    def download(self):
-        """Method that update language subtag registry."""
-        with open(self._LANGUAGE_SUBTAG_REGISTRY_FILE_PATH, 'w', encoding=self._LANGUAGE_SUBTAG_REGISTRY_ENCODING) as f:
-            f.write(self._get_data())
+    def _write_tmp_file(self, file_path: str, response: BinaryIO) -> str:
+        """Stream the body of the response, decompressed if it is gzip encoded, to a temporary file in the directory of
+        the registry and return his path."""
+        if response.headers.get('Content-Encoding', '').lower() == 'gzip':
+            response = gzip.GzipFile(fileobj=response)
+        file_descriptor, tmp_file_path = tempfile.mkstemp(dir=os.path.dirname(file_path),
+                                                          prefix=f'.{os.path.basename(file_path)}.', suffix='.tmp')
+        try:
+            with os.fdopen(file_descriptor, 'wb') as f:
+                shutil.copyfileobj(response, f, self._CHUNK_SIZE)
+        except BaseException:
+            os.remove(tmp_file_path)
+            raise
+        return tmp_file_path
 
-    def _get_data(self) -> Annotated[str, _FILE_CONTENT_FIELD_INFO]:
-        with urlopen(self._LANGUAGE_SUBTAG_REGISTRY_URL) as response:
-            data = response.read().decode('utf-8')
+    def _dump_metadata(self, file_path: str, metadata: Dict[str, Optional[str]]):
+        """Store the conditional headers of the last download next to the registry. The metadata file is replaced with
+        an atomic rename too."""
+        file_descriptor, tmp_file_path = tempfile.mkstemp(dir=os.path.dirname(file_path),
+                                                          prefix=f'.{os.path.basename(file_path)}.', suffix='.tmp')
+        try:
+            with os.fdopen(file_descriptor, 'w', encoding='utf-8') as f:
+                json.dump(metadata, f)
+            os.replace(tmp_file_path, file_path + self._METADATA_FILE_SUFFIX)
+        except BaseException:
+            os.remove(tmp_file_path)
+            raise
 
-        if not data:
-            raise RuntimeError("Problems to download BCP47 data.")
-        return data
+    def _get_file_date(self, file_path: str) -> Optional[str]:
+        """Return the 'File-Date' of a language subtag registry or None if the file does not exist or it does not start
+        with the 'File-Date'."""
+        try:
+            with open(file_path, 'rb') as f:
+                first_line = f.readline()
+        except FileNotFoundError:
+            return None
+        if not first_line.startswith(self._FILE_HEADER):
+            return None
+        return first_line[len(self._FILE_HEADER):].strip().decode(self._LANGUAGE_SUBTAG_REGISTRY_ENCODING)
 
 
 if __name__ == '__main__':
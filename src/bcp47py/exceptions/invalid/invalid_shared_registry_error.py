@@ -0,0 +1,6 @@
+class InvalidSharedRegistryError(Exception):
+    """Exception that should be raised when a buffer does not contain a shared registry with the expected format."""
+    _MESSAGE_TEMPLATE = 'Shared registry is invalid: "{}"'
+
+    def __init__(self, reason: str):
+        super().__init__(self._MESSAGE_TEMPLATE.format(reason))
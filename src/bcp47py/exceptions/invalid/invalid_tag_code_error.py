@@ -0,0 +1,6 @@
+class InvalidTagCodeError(Exception):
+    """Exception that should be raised when an integer is not a tag code of the repository."""
+    _MESSAGE_TEMPLATE = 'Tag code {} is not valid.'
+
+    def __init__(self, code: int):
+        super().__init__(self._MESSAGE_TEMPLATE.format(code))
@@ -0,0 +1,6 @@
+class InvalidVariantPrefixError(Exception):
+    """Exception that should be raised when a variant of a tag does not follow any of his prefixes."""
+    _MESSAGE_TEMPLATE = 'Variant "{}" of "{}" does not follow any of his prefixes.'
+
+    def __init__(self, variant_subtag: str, tag: str):
+        super().__init__(self._MESSAGE_TEMPLATE.format(variant_subtag, tag))
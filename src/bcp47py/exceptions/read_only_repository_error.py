@@ -0,0 +1,6 @@
+class ReadOnlyRepositoryError(RuntimeError):
+    """Exception that should be raised when a repository that is shared by the whole process is modified."""
+    _MESSAGE_TEMPLATE = 'Repository of "{}" is shared and it could not be modified.'
+
+    def __init__(self, language_subtag_registry_file_path: str):
+        super().__init__(self._MESSAGE_TEMPLATE.format(language_subtag_registry_file_path))
@@ -0,0 +1,10 @@
+from enums.bcp47_type import BCP47Type
+
+
+class UnexpectedBCP47CircularReferenceError(RuntimeError):
+    """Exception that should be raised when an item of the "Language subtag registry" references itself through other
+    items and is not possible to create it."""
+    _MESSAGE_TEMPLATE = 'Unexpected BCP47 circular reference: "{}" of type "{}".'
+
+    def __init__(self, bcp47_type: BCP47Type, key: str):
+        super().__init__(self._MESSAGE_TEMPLATE.format(key, bcp47_type.value))
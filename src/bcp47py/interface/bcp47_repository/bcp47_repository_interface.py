@@ -1,6 +1,8 @@
 import abc
-from typing import List, Iterable
+from datetime import datetime
+from typing import List, Iterable, Iterator, Union, Optional, Tuple
 
+from enums.language_scope import LanguageScopeEnum
 from schemas.ext_lang import ExtLang
 from schemas.grandfathered import Grandfathered
 from schemas.language import Language
@@ -9,7 +11,10 @@ from schemas.redundant import Redundant
 from schemas.region import Region
 from schemas.script import Script
 from schemas.parsed_tag import ParsedTag
+from schemas.tag_code_layout import TagCodeLayout
+from schemas.tag_parser_failure import TagParserFailure
 from schemas.variant import Variant
+from type_aliases import TagsOrSubtagType
 
 
 class BCP47RepositoryInterface(abc.ABC):
@@ -25,6 +30,10 @@ class BCP47RepositoryInterface(abc.ABC):
 
         :raise exceptions.not_found.language_subtag_not_found_error.LanguageSubtagNotFoundError:"""
 
+    @abc.abstractmethod
+    def try_get_language_by_subtag(self, subtag: str, case_sensitive: bool = False) -> Optional[Language]:
+        """Return a Language by his subtag or None if it is not found. It never raises an exception."""
+
     @property
     @abc.abstractmethod
     def languages_scopes(self) -> Iterable[LanguageScope]:
@@ -48,6 +57,10 @@ class BCP47RepositoryInterface(abc.ABC):
 
         :raise exceptions.not_found.ext_lang_subtag_not_found_error.ExtLangSubtagNotFoundError:"""
 
+    @abc.abstractmethod
+    def try_get_ext_lang_by_subtag(self, subtag: str, case_sensitive: bool = False) -> Optional[ExtLang]:
+        """Return a ExtLang by his subtag or None if it is not found. It never raises an exception."""
+
     @property
     @abc.abstractmethod
     def scripts(self) -> Iterable[Script]:
@@ -59,6 +72,10 @@ class BCP47RepositoryInterface(abc.ABC):
 
         :raise exceptions.not_found.script_subtag_not_found_error.ScriptSubtagNotFoundError:"""
 
+    @abc.abstractmethod
+    def try_get_script_by_subtag(self, subtag: str, case_sensitive: bool = False) -> Optional[Script]:
+        """Return a Script by his subtag or None if it is not found. It never raises an exception."""
+
     @property
     @abc.abstractmethod
     def regions(self) -> Iterable[Region]:
@@ -68,6 +85,10 @@ class BCP47RepositoryInterface(abc.ABC):
     def get_region_by_subtag(self, subtag: str, case_sensitive: bool = False) -> Region:
         """Return a Region by his subtag."""
 
+    @abc.abstractmethod
+    def try_get_region_by_subtag(self, subtag: str, case_sensitive: bool = False) -> Optional[Region]:
+        """Return a Region by his subtag or None if it is not found. It never raises an exception."""
+
     @property
     @abc.abstractmethod
     def variants(self) -> Iterable[Variant]:
@@ -77,6 +98,10 @@ class BCP47RepositoryInterface(abc.ABC):
     def get_variant_by_subtag(self, subtag: str, case_sensitive: bool = False) -> Variant:
         """Return a Variant by his subtag."""
 
+    @abc.abstractmethod
+    def try_get_variant_by_subtag(self, subtag: str, case_sensitive: bool = False) -> Optional[Variant]:
+        """Return a Variant by his subtag or None if it is not found. It never raises an exception."""
+
     @property
     @abc.abstractmethod
     def grandfathered(self) -> Iterable[Grandfathered]:
@@ -86,6 +111,10 @@ class BCP47RepositoryInterface(abc.ABC):
     def get_grandfathered_by_tag(self, tag: str, case_sensitive: bool = False) -> Grandfathered:
         """Return a Variant by his tag."""
 
+    @abc.abstractmethod
+    def try_get_grandfathered_by_tag(self, tag: str, case_sensitive: bool = False) -> Optional[Grandfathered]:
+        """Return a Grandfathered by his tag or None if it is not found. It never raises an exception."""
+
     @property
     @abc.abstractmethod
     def redundant(self) -> Iterable[Redundant]:
@@ -96,5 +125,101 @@ class BCP47RepositoryInterface(abc.ABC):
         """Return a Redundant by his tag."""
 
     @abc.abstractmethod
-    def tag_parser(self, tag: str, case_sensitive: bool = False) -> ParsedTag:
-        """Parse string tag to get all subtags."""
+    def try_get_redundant_by_tag(self, tag: str, case_sensitive: bool = False) -> Optional[Redundant]:
+        """Return a Redundant by his tag or None if it is not found. It never raises an exception."""
+
+    @abc.abstractmethod
+    def find_languages(self,
+                       scope: Optional[Union[LanguageScopeEnum, str]] = None,
+                       deprecated: Optional[bool] = None,
+                       added_from: Optional[datetime] = None,
+                       added_to: Optional[datetime] = None) -> Iterator[Language]:
+        """Return a lazy iterator over the languages with a scope, deprecated or not and added between two dates, both
+        included, in the order of the registry. Criteria that are None are ignored and the rest are combined.
+
+        :raise exceptions.not_found.language_scope_not_found_error.LanguageScopeNotFoundError:"""
+
+    @abc.abstractmethod
+    def get_languages_by_macro_language(self, subtag: str) -> Tuple[Language, ...]:
+        """Return the languages whose macro language is the language of a subtag, like the individual languages of
+        'zh'. The subtag is case-insensitive and an empty tuple is returned if there is none."""
+
+    @abc.abstractmethod
+    def get_languages_by_suppress_script(self, subtag: str) -> Tuple[Language, ...]:
+        """Return the languages that suppress the script of a subtag, like the languages that suppress 'Latn'. The
+        subtag is case-insensitive and an empty tuple is returned if there is none."""
+
+    @abc.abstractmethod
+    def get_tags_or_subtags_by_preferred_value(self, tag: str) -> Tuple[TagsOrSubtagType, ...]:
+        """Return the tags and subtags of any type whose preferred value is a tag, like the deprecated 'iw' for 'he'.
+        The tag is case-insensitive and an empty tuple is returned if there is none."""
+
+    @abc.abstractmethod
+    def tag_parser(self, tag: str, case_sensitive: bool = False, strict: bool = False) -> ParsedTag:
+        """Parse string tag to get all subtags. Grandfathered tags, like 'i-klingon', are not decomposed in subtags and
+        only the grandfathered attribute is set. If strict is enabled, each variant with prefixes must follow one of
+        them, like 'de-CH-1901' for the prefix 'de' of '1901'.
+
+        :raise exceptions.not_found.tag_or_subtag_not_found_error.TagOrSubtagNotFoundError:
+        :raise exceptions.invalid.invalid_variant_prefix_error.InvalidVariantPrefixError:"""
+
+    @abc.abstractmethod
+    def is_valid(self, tag: str, case_sensitive: bool = False, strict: bool = False) -> bool:
+        """Return if a string tag could be parsed, that is, if it is a grandfathered tag or if all his subtags are found
+        in the right order and, if strict is enabled, his variants follow their prefixes. It never raises an exception
+        and it does not create a ParsedTag."""
+
+    @abc.abstractmethod
+    def is_well_formed(self, tag: str) -> bool:
+        """Return if a string tag follows the syntax of RFC 5646 ("well-formed" tag), without checking his subtags
+        against the registry. It never raises an exception."""
+
+    @abc.abstractmethod
+    def canonicalize(self, tag: str) -> str:
+        """Return the canonical form of a string tag following the RFC 5646: grandfathered and redundant tags and
+        deprecated subtags are replaced by their preferred values and subtags use the case of the registry.
+
+        :raise exceptions.not_found.tag_or_subtag_not_found_error.TagOrSubtagNotFoundError:"""
+
+    @abc.abstractmethod
+    def canonicalize_extlang_form(self, tag: str) -> str:
+        """Return the "extlang form" of a string tag following the RFC 5646: the canonical form where languages that
+        have an ext lang record are preceded by the prefix of that ext lang.
+
+        :raise exceptions.not_found.tag_or_subtag_not_found_error.TagOrSubtagNotFoundError:"""
+
+    @abc.abstractmethod
+    def encode_tag(self, tag: str, case_sensitive: bool = False) -> int:
+        """Return a tag as an integer that fits in a signed 64 bits column, so tags could be compared, grouped and
+        hashed as integers. Each subtag of each type has a dense ID in the order of the registry, and the IDs of the
+        language, one ext lang, the script, the region and two variants are packed in fixed-width fields, the language
+        in the highest bits. Grandfathered tags are encoded by their own ID.
+
+        Tags that do not fit, with more ext langs or variants, are stored in a bounded overflow table of the repository.
+        Codes of the overflow table are only valid in the same instance while their tag is one of the most recently used
+        ones, and codes of the fields are only stable for the same registry, so stored codes must be kept together with
+        the 'File-Date' of the registry.
+
+        :raise exceptions.not_found.tag_or_subtag_not_found_error.TagOrSubtagNotFoundError:"""
+
+    @abc.abstractmethod
+    def decode_tag(self, code: int) -> ParsedTag:
+        """Return the parsed tag of an integer generated by
+        :func:`interface.bcp47_repository.bcp47_repository_interface.BCP47RepositoryInterface.encode_tag`.
+
+        :raise exceptions.invalid.invalid_tag_code_error.InvalidTagCodeError:"""
+
+    @property
+    @abc.abstractmethod
+    def tag_code_layout(self) -> TagCodeLayout:
+        """Return the layout of the integers generated by
+        :func:`interface.bcp47_repository.bcp47_repository_interface.BCP47RepositoryInterface.encode_tag`, so the dense
+        IDs of the subtags could be extracted from them without decoding them."""
+
+    @abc.abstractmethod
+    def parse_many(self,
+                   tags: Iterable[str],
+                   case_sensitive: bool = False,
+                   strict: bool = False) -> Iterator[Union[ParsedTag, TagParserFailure]]:
+        """Parse several string tags. Return an iterator with one result for each tag in the same order: a ParsedTag or
+        a TagParserFailure if the tag could not be parsed."""
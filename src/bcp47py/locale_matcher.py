@@ -0,0 +1,226 @@
+"""Module related with LocaleMatcher class."""
+import dataclasses
+from typing import Dict, List, Tuple, Iterable, Optional, Union
+
+from cache.lru_cache import LRUCache
+from exceptions.not_found.tag_or_subtag_not_found_error import TagOrSubtagNotFoundError
+from interface.bcp47_repository.bcp47_repository_interface import BCP47RepositoryInterface
+from schemas.cache_info import CacheInfo
+
+
+class LocaleMatcher:
+    """Matcher of language ranges against a list of supported tags following the RFC 4647: "lookup", "basic filtering"
+    and "extended filtering".
+
+    The supported tags are canonicalized and compiled once when the matcher is created: a table with the truncation
+    targets used by "lookup" and a prefix trie of subtags used by both filterings. Requested language ranges are
+    canonicalized too, so 'iw-IL' matches a supported 'he-IL'; ranges that could not be canonicalized (wildcards,
+    private use, unknown subtags...) are compared in lower case. Requested ranges and Accept-Language headers are
+    memoized, so the repository is not used again for a range that was already seen.
+
+    Matching methods accept a language priority list, that is, language ranges sorted by preference, or a string with
+    the value of an Accept-Language HTTP header. Results are supported tags as they were given to the constructor.
+
+    :raise exceptions.not_found.tag_or_subtag_not_found_error.TagOrSubtagNotFoundError: some supported tag is not
+        well-formed."""
+    _WILDCARD = '*'
+    _DEFAULT_CACHE_SIZE = 4096
+
+    def __init__(self,
+                 repository: BCP47RepositoryInterface,
+                 supported_tags: Iterable[str],
+                 default: Optional[str] = None,
+                 cache_size: int = _DEFAULT_CACHE_SIZE):
+        self._repository = repository
+        self._default = default
+        self._supported_tags: Dict[str, str] = {}
+        self._trie = _TrieNode()
+        for supported_tag in supported_tags:
+            key = self._canonicalize_supported_tag(supported_tag)
+            if key not in self._supported_tags:
+                self._supported_tags[key] = supported_tag
+                self._trie.add(key.split('-'), supported_tag)
+        self._trie.freeze({tag: position for position, tag in enumerate(self._supported_tags.values())})
+        self._language_ranges_cache: LRUCache[str, _LanguageRange] = LRUCache(cache_size)
+        self._accept_language_cache: LRUCache[str, Tuple[str, ...]] = LRUCache(cache_size)
+
+    @property
+    def supported_tags(self) -> Tuple[str, ...]:
+        """Return the supported tags without duplicates in the order that they were given."""
+        return tuple(self._supported_tags.values())
+
+    def lookup(self, language_priority_list: Union[str, Iterable[str]]) -> Optional[str]:
+        """Return the supported tag that best matches the language priority list following the "lookup" scheme of the
+        RFC 4647 (section 3.4). If no supported tag matches, the default tag is returned."""
+        for language_range in self._get_language_ranges(language_priority_list):
+            if (supported_tag := language_range.lookup) is not None:
+                return supported_tag
+        return self._default
+
+    def basic_filter(self, language_priority_list: Union[str, Iterable[str]]) -> List[str]:
+        """Return the supported tags that match the language priority list following the "basic filtering" scheme of
+        the RFC 4647 (section 3.3.1). Tags are sorted by the language range that they match first."""
+        return self._merge(language_range.basic_filter
+                           for language_range in self._get_language_ranges(language_priority_list))
+
+    def extended_filter(self, language_priority_list: Union[str, Iterable[str]]) -> List[str]:
+        """Return the supported tags that match the language priority list following the "extended filtering" scheme of
+        the RFC 4647 (section 3.3.2). Tags are sorted by the language range that they match first."""
+        return self._merge(language_range.extended_filter
+                           for language_range in self._get_language_ranges(language_priority_list))
+
+    def parse_accept_language(self, accept_language: str) -> Tuple[str, ...]:
+        """Return the language ranges of an Accept-Language HTTP header sorted by quality value. Ranges with the same
+        quality value keep the header order and ranges with quality value 0 or malformed are discarded."""
+        if (language_ranges := self._accept_language_cache.get(accept_language)) is not None:
+            return language_ranges
+
+        weighted_language_ranges = []
+        for position, item in enumerate(accept_language.split(',')):
+            language_range, _, parameters = item.partition(';')
+            language_range = language_range.strip()
+            quality = 1.0
+            if parameters:
+                name, _, value = parameters.strip().partition('=')
+                try:
+                    quality = float(value) if name.strip().lower() == 'q' else -1.0
+                except ValueError:
+                    quality = -1.0
+            if language_range and 0 < quality <= 1:
+                weighted_language_ranges.append((-quality, position, language_range))
+        language_ranges = tuple(language_range for _, _, language_range in sorted(weighted_language_ranges))
+
+        self._accept_language_cache.put(accept_language, language_ranges)
+        return language_ranges
+
+    def cache_info(self) -> CacheInfo:
+        """Return the statistics of the cache of requested language ranges."""
+        return self._language_ranges_cache.cache_info()
+
+    def _get_language_ranges(self, language_priority_list: Union[str, Iterable[str]]) -> Iterable['_LanguageRange']:
+        if isinstance(language_priority_list, str):
+            language_priority_list = self.parse_accept_language(language_priority_list)
+        return (self._get_language_range(language_range) for language_range in language_priority_list)
+
+    def _get_language_range(self, language_range: str) -> '_LanguageRange':
+        """Return the compiled language range. Compiled language ranges are memoized."""
+        if (compiled_language_range := self._language_ranges_cache.get(language_range)) is not None:
+            return compiled_language_range
+
+        subtags = self._canonicalize_language_range(language_range).split('-')
+        compiled_language_range = _LanguageRange(self._lookup(subtags), self._basic_filter(subtags),
+                                                 self._extended_filter(subtags))
+
+        self._language_ranges_cache.put(language_range, compiled_language_range)
+        return compiled_language_range
+
+    def _canonicalize_supported_tag(self, supported_tag: str) -> str:
+        """Return the lower case canonical form of a supported tag. Well-formed tags that could not be canonicalized,
+        like tags with extensions or private use subtags, are used in lower case.
+
+        :raise exceptions.not_found.tag_or_subtag_not_found_error.TagOrSubtagNotFoundError:"""
+        try:
+            return self._repository.canonicalize(supported_tag).lower()
+        except TagOrSubtagNotFoundError:
+            if not self._repository.is_well_formed(supported_tag):
+                raise
+        return supported_tag.lower()
+
+    def _canonicalize_language_range(self, language_range: str) -> str:
+        """Return the lower case canonical form of a requested language range. It never raises: ranges that could not
+        be canonicalized, even if they are not well-formed, are used in lower case and they only match supported tags
+        with the same subtags."""
+        if self._WILDCARD not in language_range:
+            try:
+                return self._repository.canonicalize(language_range).lower()
+            except TagOrSubtagNotFoundError:
+                pass
+        return language_range.lower()
+
+    def _lookup(self, subtags: List[str]) -> Optional[str]:
+        """Return the first supported tag found truncating progressively the subtags of the language range. Wildcards
+        are ignored (RFC 4647, section 3.4)."""
+        subtags = [subtag for subtag in subtags if subtag != self._WILDCARD]
+        while subtags:
+            if (supported_tag := self._supported_tags.get('-'.join(subtags))) is not None:
+                return supported_tag
+            subtags.pop()
+            if subtags and len(subtags[-1]) == 1:
+                subtags.pop()
+        return None
+
+    def _basic_filter(self, subtags: List[str]) -> Tuple[str, ...]:
+        if subtags == [self._WILDCARD]:
+            return self._trie.subtree_tags
+        node = self._trie
+        for subtag in subtags:
+            if (node := node.children.get(subtag)) is None:
+                return ()
+        return node.subtree_tags
+
+    def _extended_filter(self, subtags: List[str]) -> Tuple[str, ...]:
+        """Return the supported tags that match the extended language range walking the trie. Wildcards that are not
+        the first subtag are ignored, and subtags of the tag could be skipped until a singleton is found (RFC 4647,
+        section 3.3.2)."""
+        subtags = subtags[:1] + [subtag for subtag in subtags[1:] if subtag != self._WILDCARD]
+        if subtags[0] == self._WILDCARD:
+            nodes = list(self._trie.children.values())
+        elif (node := self._trie.children.get(subtags[0])) is not None:
+            nodes = [node]
+        else:
+            return ()
+
+        matched_nodes = []
+        pending = [(node, 1) for node in nodes]
+        visited = set()
+        while pending:
+            node, subtag_index = pending.pop()
+            if (id(node), subtag_index) in visited:
+                continue
+            visited.add((id(node), subtag_index))
+            if subtag_index == len(subtags):
+                matched_nodes.append(node)
+                continue
+            for subtag, child in node.children.items():
+                if subtag == subtags[subtag_index]:
+                    pending.append((child, subtag_index + 1))
+                elif len(subtag) > 1:
+                    pending.append((child, subtag_index))
+
+        matched_tags = {tag for node in matched_nodes for tag in node.subtree_tags}
+        return tuple(tag for tag in self._trie.subtree_tags if tag in matched_tags)
+
+    @staticmethod
+    def _merge(tags_by_language_range: Iterable[Tuple[str, ...]]) -> List[str]:
+        return list(dict.fromkeys(tag for tags in tags_by_language_range for tag in tags))
+
+
+@dataclasses.dataclass(frozen=True)
+class _LanguageRange:
+    """Dataclass with the precomputed results of a requested language range."""
+    lookup: Optional[str]
+    basic_filter: Tuple[str, ...]
+    extended_filter: Tuple[str, ...]
+
+
+@dataclasses.dataclass
+class _TrieNode:
+    """Dataclass that contains a node of the trie of supported tags, where each edge is a lower case subtag. The
+    supported tags of the subtree are stored in each node once the trie is frozen."""
+    children: Dict[str, '_TrieNode'] = dataclasses.field(default_factory=dict)
+    tags: List[str] = dataclasses.field(default_factory=list)
+    subtree_tags: Tuple[str, ...] = ()
+
+    def add(self, subtags: List[str], tag: str):
+        """Add a supported tag by his subtags."""
+        node = self
+        for subtag in subtags:
+            node = node.children.setdefault(subtag, _TrieNode())
+        node.tags.append(tag)
+
+    def freeze(self, order: Dict[str, int]):
+        """Compute the supported tags of the subtree of each node sorted by the position of each tag."""
+        for child in self.children.values():
+            child.freeze(order)
+        subtree_tags = self.tags + [tag for child in self.children.values() for tag in child.subtree_tags]
+        self.subtree_tags = tuple(sorted(subtree_tags, key=order.__getitem__))
@@ -0,0 +1,622 @@
+"""Module related with LanguageSubtagRegistryMixin class."""
+import codecs
+import dataclasses
+import io
+import os
+import re
+from datetime import datetime
+from typing import Optional, Dict, Any, Type, List, Union, Set, Tuple, Callable, Iterator
+
+from pydantic import ValidationError
+
+from enums.bcp47_type import BCP47Type
+from enums.language_scope import LanguageScopeEnum
+from exceptions.invalid.invalid_ext_lang_data_error import InvalidExtLanguageDataError
+from exceptions.invalid.invalid_grandfathered_data_error import InvalidGrandfatheredDataError
+from exceptions.invalid.invalid_language_data_error import InvalidLanguageDataError
+from exceptions.invalid.invalid_redundant_data_error import InvalidRedundantDataError
+from exceptions.invalid.invalid_region_data_error import InvalidRegionDataError
+from exceptions.invalid.invalid_registry_file_date_error import InvalidRegistryFileDate
+from exceptions.invalid.invalid_script_data_error import InvalidScriptDataError
+from exceptions.invalid.invalid_variant_data_error import InvalidVariantDataError
+from exceptions.not_found.language_subtag_not_found_error import LanguageSubtagNotFoundError
+from exceptions.not_found.script_subtag_not_found_error import ScriptSubtagNotFoundError
+from exceptions.not_found.tag_or_subtag_not_found_error import TagOrSubtagNotFoundError
+from exceptions.unexpected_bcp47.unexpected_bcp47_circular_reference_error import \
+    UnexpectedBCP47CircularReferenceError
+from exceptions.unexpected_bcp47.unexpected_bcp47_duplicated_key import UnexpectedBCP47DuplicatedKeyError
+from exceptions.unexpected_bcp47.unexpected_bcp47_key_error import UnexpectedBCP47KeyError
+from exceptions.unexpected_bcp47.unexpected_bcp47_key_type_error import UnexpectedBCP47KeyTypeError
+from exceptions.unexpected_bcp47.unexpected_bcp47_missing_file_date_error import UnexpectedBCP47MissingFileDateError
+from exceptions.unexpected_bcp47.unexpected_bcp47_missing_type_error import UnexpectedBCP47MissingTypeError
+from exceptions.unexpected_bcp47.unexpected_bcp47_no_previous_key_error import UnexpectedBCP47NoPreviousKeyError
+from exceptions.unexpected_bcp47.unexpected_bcp47_previous_data_type_error import UnexpectedBCP47PreviousDataTypeError
+from exceptions.unexpected_bcp47.unexpected_bcp47_type_error import UnexpectedBCP47TypeError
+from exceptions.unexpected_bcp47.unexpected_bcp47_value_error import UnexpectedBCP47ValueError
+from mixin.base import Base
+from records.ext_lang_record import ExtLangRecord
+from records.grandfathered_record import GrandfatheredRecord
+from records.language_record import LanguageRecord
+from records.record import Record
+from records.redundant_record import RedundantRecord
+from records.region_record import RegionRecord
+from records.script_record import ScriptRecord
+from records.subtags_record import SubtagsRecord
+from records.variant_record import VariantRecord
+from schemas.ext_lang import ExtLang
+from schemas.grandfathered import Grandfathered
+from schemas.language import Language
+from schemas.redundant import Redundant
+from schemas.region import Region
+from schemas.script import Script
+from schemas.variant import Variant
+from type_aliases import TagsOrSubtagType, SubtagType, LanguageSubtagRegistrySource
+
+
+@dataclasses.dataclass
+class _BCP47ValueType:
+    """Helper dataclass that it structures the value of _BCP47_KEY_VALUE_TYPE_MAPPING dict."""
+    value_type: Type
+    internal_name: str
+
+
+@dataclasses.dataclass
+class _AddNewDataReturn:
+    """Helper dataclass that it structures the return data from "_add_new_data" method."""
+    data_dict: Dict[str, Any]
+    previous_key: str
+
+
+@dataclasses.dataclass
+class _TagSubtagType:
+    """Helper dataclass that it structures the value of _TAG_SUBTAG_TYPES list. The subtags of a tag are resolved
+    following the order of that list and each subtag type could be repeated up to max_subtags times."""
+    bcp47_type: BCP47Type
+    max_subtags: int
+
+
+@dataclasses.dataclass
+class _SymbolTable:
+    """Helper dataclass that contains all items of a "Language subtag registry" keyed by type and subtag or tag. All
+    items are registered before any object is created, so the references between items are linked with a dict lookup
+    and without depending on the order of the items. Created objects are also kept to link each item only once."""
+    items: Dict[BCP47Type, Dict[str, Dict[str, Any]]] = dataclasses.field(
+        default_factory=lambda: {bcp47_type: {}
+                                 for bcp47_type in BCP47Type})
+    objects: Dict[BCP47Type, Dict[str, TagsOrSubtagType]] = dataclasses.field(
+        default_factory=lambda: {bcp47_type: {}
+                                 for bcp47_type in BCP47Type})
+    in_progress: Set[Tuple[BCP47Type, str]] = dataclasses.field(default_factory=set)
+
+
+@dataclasses.dataclass
+class _RawItems:
+    """Helper dataclass that contains the raw text of the items of a type keyed by subtag or tag. It has the interface
+    of the items of a symbol table, and items are only parsed when they are requested."""
+    parse_item: Callable[[str, datetime], Dict[str, Any]]
+    updated_at: datetime
+    raw_items: Dict[str, str] = dataclasses.field(default_factory=dict)
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.raw_items
+
+    def __getitem__(self, key: str) -> Dict[str, Any]:
+        data_dict = self.parse_item(self.raw_items[key], self.updated_at)
+        data_dict.pop('bcp_type', None)
+        return data_dict
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.raw_items)
+
+
+class LanguageSubtagRegistryMixin(Base):
+    """Mixin that parses items of a "Language subtag registry" and links them into objects. Items are registered in a
+    symbol table keyed by type and subtag or tag, and objects are created on demand with their references linked
+    through that symbol table. Classes that use it must implement
+    :func:`interface.bcp47_repository.bcp47_repository_interface.BCP47RepositoryInterface.get_language_scope_by_name`.
+
+    Objects are pydantic models, or :class:`records.record.Record` instances if _use_records is enabled. Records are
+    not validated until they are converted to pydantic models. If _trusted is enabled, items are parsed without checks
+    and pydantic models are built without validation.
+    """
+    _TAG_SUBTAG_TYPES = [
+        _TagSubtagType(BCP47Type.LANGUAGE, 1),
+        _TagSubtagType(BCP47Type.EXTLANG, 3),
+        _TagSubtagType(BCP47Type.SCRIPT, 1),
+        _TagSubtagType(BCP47Type.REGION, 1),
+        _TagSubtagType(BCP47Type.VARIANT, 999),
+    ]
+    _ITEM_SEPARATOR = '%%'
+    _KEY_VALUE_SEPARATOR = ': '
+    _FILE_HEADER = 'File-Date: '
+    _BCP47_KEY_VALUE_TYPE_MAPPING: Dict[str, _BCP47ValueType] = {
+        'Type': _BCP47ValueType(value_type=BCP47Type, internal_name='bcp_type'),
+        'Subtag': _BCP47ValueType(value_type=str, internal_name='subtag'),
+        'Description': _BCP47ValueType(value_type=list, internal_name='description'),
+        'Suppress-Script': _BCP47ValueType(value_type=str, internal_name='suppress_script'),
+        'Scope': _BCP47ValueType(value_type=str, internal_name='scope'),
+        'Added': _BCP47ValueType(value_type=datetime, internal_name='added'),
+        'Macrolanguage': _BCP47ValueType(value_type=str, internal_name='macro_language'),
+        'Comments': _BCP47ValueType(value_type=list, internal_name='comments'),
+        'Preferred-Value': _BCP47ValueType(value_type=str, internal_name='preferred_value'),
+        'Deprecated': _BCP47ValueType(value_type=datetime, internal_name='deprecated'),
+        'Prefix': _BCP47ValueType(value_type=list, internal_name='prefix'),
+        'Tag': _BCP47ValueType(value_type=str, internal_name='tag'),
+    }
+    _RECORD_TYPES: Dict[BCP47Type, Type[Record]] = {
+        BCP47Type.LANGUAGE: LanguageRecord,
+        BCP47Type.EXTLANG: ExtLangRecord,
+        BCP47Type.SCRIPT: ScriptRecord,
+        BCP47Type.REGION: RegionRecord,
+        BCP47Type.VARIANT: VariantRecord,
+        BCP47Type.GRANDFATHERED: GrandfatheredRecord,
+        BCP47Type.REDUNDANT: RedundantRecord,
+    }
+    _use_records = False
+    _trusted = False
+    _CHUNK_SIZE = 1 << 16
+    _ITEM_TYPE_REGEX = re.compile(r'^Type: (.*)$', re.MULTILINE)
+    _ITEM_KEY_REGEX = re.compile(r'^(?:Tag|Subtag): (.*)$', re.MULTILINE)
+
+    def _read_items(self, source: LanguageSubtagRegistrySource) -> Iterator[Dict[str, Any]]:
+        """Read a "Language subtag registry" from a file path or a stream and yield his items parsed as dicts. Items
+        are parsed while the source is read in chunks, so the whole file is never held in memory.
+
+        :raise exceptions.unexpected_bcp47_missing_file_date_error.UnexpectedBCP47MissingFileDateError:
+        :raise exceptions.invalid.invalid_registry_file_date_error.InvalidRegistryFileDate:
+        :raise exceptions.unexpected_bcp47_no_previous_key_error.UnexpectedBCP47NoPreviousKeyError:
+        :raise exceptions.unexpected_bcp47_previous_data_type_error.UnexpectedBCP47PreviousDataTypeError:
+        :raise exceptions.unexpected_bcp47_key_error.UnexpectedBCP47KeyError:
+        :raise exceptions.unexpected_bcp47_duplicated_key.UnexpectedBCP47DuplicatedKeyError:
+        :raise exceptions.unexpected_bcp47_value_error.UnexpectedBCP47ValueError:
+        :raise exceptions.unexpected_bcp47_key_type_error.UnexpectedBCP47KeyTypeError:"""
+        raw_items = self._iter_raw_items(source)
+        updated_at = self._get_file_date(next(raw_items, ''))
+        for item in raw_items:
+            yield self._parse_item(item, updated_at)
+
+    def _index_items(self, source: LanguageSubtagRegistrySource) -> _SymbolTable:
+        """Read a "Language subtag registry" from a file path or a stream and return a symbol table with the raw text
+        of his items keyed by type and subtag or tag. Only the type and the subtag or tag of each item are read, the
+        whole item is parsed when it is linked. If an item with the same key is already indexed, the first one is kept.
+
+        :raise exceptions.unexpected_bcp47_missing_file_date_error.UnexpectedBCP47MissingFileDateError:
+        :raise exceptions.invalid.invalid_registry_file_date_error.InvalidRegistryFileDate:
+        :raise exceptions.missing_bcp_type_error.MissingBCPTypeError:
+        :raise exceptions.unexpected_bcp47_value_error.UnexpectedBCP47ValueError:"""
+        raw_items = self._iter_raw_items(source)
+        updated_at = self._get_file_date(next(raw_items, ''))
+        raw_items_by_type = {bcp47_type: _RawItems(self._parse_item, updated_at) for bcp47_type in BCP47Type}
+        for item in raw_items:
+            if not (type_match := self._ITEM_TYPE_REGEX.search(item)):
+                raise UnexpectedBCP47MissingTypeError()
+            try:
+                bcp47_type = BCP47Type(type_match.group(1))
+            except ValueError as e:
+                raise UnexpectedBCP47ValueError(type_match.group(1), 'bcp_type') from e
+            key = key_match.group(1) if (key_match := self._ITEM_KEY_REGEX.search(item)) else ''
+            raw_items_by_type[bcp47_type].raw_items.setdefault(key, item)
+        return _SymbolTable(items=raw_items_by_type)
+
+    def _iter_raw_items(self, source: LanguageSubtagRegistrySource) -> Iterator[str]:
+        """Yield the raw text of each item of a "Language subtag registry" while it is read in chunks. The first one is
+        the header that contains the 'File-Date'. Only the chunk and the pending item are held in memory."""
+        pending = ''
+        for chunk in self._iter_chunks(source):
+            *items, pending = (pending + chunk).split(self._ITEM_SEPARATOR)
+            yield from items
+        yield pending
+
+    def _iter_chunks(self, source: LanguageSubtagRegistrySource) -> Iterator[str]:
+        """Yield text chunks of a file path or a text or binary stream, like stdin, a gzip file or an HTTP response.
+        Binary chunks are decoded incrementally. Newlines of streams are translated to '\\n' like files opened in text
+        mode, even if a CRLF is split between two chunks. Streams are not closed, the caller owns them."""
+        if isinstance(source, (str, os.PathLike)):
+            with open(source, 'r', encoding=self._LANGUAGE_SUBTAG_REGISTRY_ENCODING) as f:
+                while chunk := f.read(self._CHUNK_SIZE):
+                    yield chunk
+            return
+
+        bytes_decoder = codecs.getincrementaldecoder(self._LANGUAGE_SUBTAG_REGISTRY_ENCODING)()
+        decoder = io.IncrementalNewlineDecoder(None, translate=True)
+        while chunk := source.read(self._CHUNK_SIZE):
+            yield decoder.decode(bytes_decoder.decode(chunk) if isinstance(chunk, bytes) else chunk)
+        yield decoder.decode(bytes_decoder.decode(b'', final=True), final=True)
+
+    def _get_file_date(self, text: str) -> datetime:
+        """Return the 'File-Date' that is the version date from the "Language Subtag registry".
+
+        :raise exceptions.unexpected_bcp47_missing_file_date_error.UnexpectedBCP47MissingFileDateError:
+        :raise exceptions.invalid.invalid_registry_file_date_error.InvalidRegistryFileDate:"""
+        if not text.startswith(self._FILE_HEADER):
+            raise UnexpectedBCP47MissingFileDateError()
+        try:
+            return datetime.fromisoformat(text[len(self._FILE_HEADER):].strip())
+        except ValueError as e:
+            raise InvalidRegistryFileDate(text) from e
+
+    def _parse_item(self, item: str, updated_at: datetime) -> Dict[str, Any]:
+        """Parse an item from the "Language Subtag registry". It gets the field value pairs and return a dict. Also
+        include the current version of "Language Subtag registry" (updated_at).
+
+        :raise exceptions.unexpected_bcp47_no_previous_key_error.UnexpectedBCP47NoPreviousKeyError:
+        :raise exceptions.unexpected_previous_data_type_error.UnexpectedBCP47PreviousDataTypeError:
+        :raise exceptions.unexpected_bcp47_key_error.UnexpectedBCP47KeyError:
+        :raise exceptions.unexpected_bcp47_duplicated_key.UnexpectedBCP47DuplicatedKeyError:
+        :raise exceptions.unexpected_bcp47_value_error.UnexpectedBCP47ValueError:
+        :raise exceptions.unexpected_bcp47_key_type_error.UnexpectedBCP47KeyTypeError:"""
+        if self._trusted:
+            return self._parse_trusted_item(item, updated_at)
+        data = {'updated_at': updated_at}
+        previous_key: Optional[str] = None
+
+        for value in item.strip().split("\n"):
+            if value.startswith(' '):
+                data = self._append_data(previous_key, data, value)
+            else:
+                add_new_data_return = self._add_new_data(data, value)
+                data = add_new_data_return.data_dict
+                previous_key = add_new_data_return.previous_key
+
+        return data
+
+    def _parse_trusted_item(self, item: str, updated_at: datetime) -> Dict[str, Any]:
+        """Case of :func:bcp47_repository.Repository._parse_item when _trusted is enabled. Keys and values are not
+        checked, so unknown keys raise KeyError and duplicated keys keep the last value."""
+        data: Dict[str, Any] = {'updated_at': updated_at}
+        previous_key = ''
+        for value in item.strip().split('\n'):
+            if value.startswith(' '):
+                if isinstance(previous_value := data[previous_key], list):
+                    previous_value[-1] += value[1:]
+                else:
+                    data[previous_key] = previous_value + value[1:]
+                continue
+            key, value = value.split(self._KEY_VALUE_SEPARATOR, 1)
+            value_type = self._BCP47_KEY_VALUE_TYPE_MAPPING[key]
+            previous_key = value_type.internal_name
+            if value_type.value_type is str:
+                data[previous_key] = value
+            elif value_type.value_type is list:
+                data.setdefault(previous_key, []).append(value)
+            elif value_type.value_type is datetime:
+                data[previous_key] = datetime.fromisoformat(value)
+            else:
+                data[previous_key] = value_type.value_type(value)
+        return data
+
+    @staticmethod
+    def _append_data(previous_key: Optional[str], data: Dict[str, Any], value: str) -> Dict[str, Any]:
+        """Case of :func:bcp47_repository.Repository._parse_item when a new line start with space. It occurs when the
+        data surpasses the max column size and requires to break the line. If previous key is a list it should be
+        concatenated with the last value of the list. If is string it is only required to be concatenated with the
+        value of previous key.
+
+        :raise exceptions.unexpected_bcp47_no_previous_key_error.UnexpectedBCP47NoPreviousKeyError:
+
+        :raise exceptions.unexpected_bcp47_previous_data_type_error.UnexpectedBCP47PreviousDataTypeError:"""
+        if not previous_key:
+            raise UnexpectedBCP47NoPreviousKeyError()
+        previous_data_type = type(data[previous_key])
+        if previous_data_type == list:
+            data[previous_key][-1] += value[1:]
+        elif previous_data_type == str:
+            data[previous_key] += value[1:]
+        else:
+            raise UnexpectedBCP47PreviousDataTypeError(previous_data_type)
+        return data
+
+    def _add_new_data(self, data_dict: Dict[str, Any], value: str) -> _AddNewDataReturn:
+        """Case of :func:bcp47_repository.Repository._parse_item when it is required to parse a new key value.
+
+        :raise exceptions.unexpected_bcp47_key_error.UnexpectedBCP47KeyError:
+        :raise exceptions.unexpected_bcp47_duplicated_key.UnexpectedBCP47DuplicatedKeyError:
+        :raise exceptions.unexpected_bcp47_value_error.UnexpectedBCP47ValueError:
+        :raise exceptions.unexpected_bcp47_key_type_error.UnexpectedBCP47KeyTypeError:
+        """
+        key, value = value.split(self._KEY_VALUE_SEPARATOR, 1)
+        if not (value_type := self._BCP47_KEY_VALUE_TYPE_MAPPING.get(key)):
+            raise UnexpectedBCP47KeyError(key)
+
+        previous_key = value_type.internal_name
+
+        if data_dict.get(value_type.internal_name) is not None and value_type.value_type != list:
+            raise UnexpectedBCP47DuplicatedKeyError(key)
+
+        if value_type.value_type == list:
+            if data_dict_value := data_dict.get(value_type.internal_name):
+                data_dict_value.append(value)
+            else:
+                data_dict[value_type.internal_name] = [value]
+        elif value_type.value_type == datetime:
+            data_dict[value_type.internal_name] = datetime.fromisoformat(value)
+        elif value_type.value_type == str:
+            data_dict[value_type.internal_name] = value
+        elif value_type.value_type in (BCP47Type, LanguageScopeEnum):
+            try:
+                data_dict[value_type.internal_name] = value_type.value_type(value)
+            except ValueError as e:
+                raise UnexpectedBCP47ValueError(value, value_type.internal_name) from e
+        else:
+            raise UnexpectedBCP47KeyTypeError(value_type.value_type)
+        return _AddNewDataReturn(data_dict=data_dict, previous_key=previous_key)
+
+    @staticmethod
+    def _register_item(symbol_table: _SymbolTable, data_dict: Dict[str, Any]) -> Tuple[BCP47Type, str]:
+        """First phase of the load. Register a dict item in the symbol table with his type and subtag or tag as key and
+        return that key. If an item with the same key is already registered, the first one is kept.
+
+        :raise exceptions.missing_bcp_type_error.MissingBCPTypeError:"""
+        try:
+            bcp47_type: BCP47Type = data_dict.pop('bcp_type')
+        except KeyError:
+            raise UnexpectedBCP47MissingTypeError() from KeyError
+
+        key = data_dict.get('tag', data_dict.get('subtag', ''))
+        symbol_table.items[bcp47_type].setdefault(key, data_dict)
+        return bcp47_type, key
+
+    def _link_item(self, symbol_table: _SymbolTable, bcp47_type: BCP47Type, key: str) -> TagsOrSubtagType:
+        """Second phase of the load. Return the object of a registered item. If the object is not created yet, the
+        items that it references are linked first and then the object is created.
+
+        :raise exceptions.not_found.tag_or_subtag_not_found_error.TagOrSubtagNotFoundError:
+        :raise exceptions.unexpected_bcp47.unexpected_bcp47_circular_reference_error.\
+            UnexpectedBCP47CircularReferenceError:
+        :raise exceptions.unexpected_bcp47_type_error.UnexpectedBCP47TypeError:
+        :raise exceptions.invalid.invalid_language_data_error.InvalidLanguageDataError:
+        :raise exceptions.invalid.invalid_ext_lang_error.InvalidExtLanguageDataError:
+        :raise exceptions.invalid.invalid_script_data_error.InvalidScriptDataError:
+        :raise exceptions.invalid.invalid_region_data_error.InvalidRegionDataError:
+        :raise exceptions.invalid.invalid_variant_data_error.InvalidVariantDataError
+        :raise exceptions.invalid.invalid_grandfathered_data_error.InvalidGrandfatheredDataError:
+        :raise exceptions.invalid.invalid_redundant_data_error.InvalidRedundantDataError:"""
+        if tag_or_subtag := symbol_table.objects[bcp47_type].get(key):
+            return tag_or_subtag
+
+        try:
+            data_dict = symbol_table.items[bcp47_type][key]
+        except KeyError as e:
+            raise TagOrSubtagNotFoundError(f'{bcp47_type.value} "{key}" is not found.') from e
+
+        if (bcp47_type, key) in symbol_table.in_progress:
+            raise UnexpectedBCP47CircularReferenceError(bcp47_type, key)
+        symbol_table.in_progress.add((bcp47_type, key))
+        try:
+            tag_or_subtag = self._create_item(symbol_table, data_dict, bcp47_type)
+        finally:
+            # Items that could not be created are not in progress anymore, so accessing them again in lazy mode
+            # raises the same error instead of a circular reference.
+            symbol_table.in_progress.remove((bcp47_type, key))
+
+        symbol_table.objects[bcp47_type][key] = tag_or_subtag
+        return tag_or_subtag
+
+    def _create_item(self, symbol_table: _SymbolTable, data_dict: Dict[str, Any],
+                     bcp47_type: BCP47Type) -> TagsOrSubtagType:
+        """From a dict item check the type and convert to a dataclass.
+
+        :raise exceptions.unexpected_bcp47_type_error.UnexpectedBCP47TypeError:
+        :raise exceptions.invalid.invalid_language_data_error.InvalidLanguageDataError:
+        :raise exceptions.invalid.invalid_ext_lang_error.InvalidExtLanguageDataError:
+        :raise exceptions.invalid.invalid_script_data_error.InvalidScriptDataError:
+        :raise exceptions.invalid.invalid_region_data_error.InvalidRegionDataError:
+        :raise exceptions.invalid.invalid_variant_data_error.InvalidVariantDataError
+        :raise exceptions.invalid.invalid_grandfathered_data_error.InvalidGrandfatheredDataError:
+        :raise exceptions.invalid.invalid_redundant_data_error.InvalidRedundantDataError:"""
+        data_dict = self._replace_to_object(symbol_table, data_dict, bcp47_type)
+
+        if self._use_records:
+            return self._create_record(data_dict, bcp47_type)
+        if self._trusted:
+            return self._construct_model(data_dict, bcp47_type)
+        return self._validate_item(data_dict, bcp47_type)
+
+    def _validate_item(self, data_dict: Dict[str, Any], bcp47_type: BCP47Type) -> TagsOrSubtagType:
+        """From a dict item with linked objects check the type and convert to a validated dataclass.
+
+        :raise exceptions.unexpected_bcp47_type_error.UnexpectedBCP47TypeError:
+        :raise exceptions.invalid.invalid_language_data_error.InvalidLanguageDataError:
+        :raise exceptions.invalid.invalid_ext_lang_error.InvalidExtLanguageDataError:
+        :raise exceptions.invalid.invalid_script_data_error.InvalidScriptDataError:
+        :raise exceptions.invalid.invalid_region_data_error.InvalidRegionDataError:
+        :raise exceptions.invalid.invalid_variant_data_error.InvalidVariantDataError
+        :raise exceptions.invalid.invalid_grandfathered_data_error.InvalidGrandfatheredDataError:
+        :raise exceptions.invalid.invalid_redundant_data_error.InvalidRedundantDataError:"""
+        if bcp47_type == BCP47Type.LANGUAGE:
+            return self._create_language(data_dict)
+        if bcp47_type == BCP47Type.EXTLANG:
+            return self._create_ext_lang(data_dict)
+        if bcp47_type == BCP47Type.SCRIPT:
+            return self._create_script(data_dict)
+        if bcp47_type == BCP47Type.REGION:
+            return self._create_region(data_dict)
+        if bcp47_type == BCP47Type.VARIANT:
+            return self._create_variant(data_dict)
+        if bcp47_type == BCP47Type.GRANDFATHERED:
+            return self._create_grandfathered(data_dict)
+        if bcp47_type == BCP47Type.REDUNDANT:
+            return self._create_redundant(data_dict)
+        raise UnexpectedBCP47TypeError(bcp47_type)
+
+    def _create_record(self, data_dict: Dict[str, Any], bcp47_type: BCP47Type) -> Record:
+        """Get dict data and loads to the :class:`records.record.Record` of the type. Linked tags are loaded to
+        :class:`records.subtags_record.SubtagsRecord`.
+
+        :raise exceptions.unexpected_bcp47_type_error.UnexpectedBCP47TypeError:"""
+        record_type = self._get_record_type(bcp47_type)
+        return record_type(**self._create_nested(data_dict, record_type, SubtagsRecord))
+
+    def _construct_model(self, data_dict: Dict[str, Any], bcp47_type: BCP47Type) -> TagsOrSubtagType:
+        """Get dict data and loads to the dataclass of the type without validation. Linked tags are loaded to their
+        dataclasses without validation too.
+
+        :raise exceptions.unexpected_bcp47_type_error.UnexpectedBCP47TypeError:"""
+        record_type = self._get_record_type(bcp47_type)
+        data_dict = self._create_nested(data_dict, record_type, lambda model_type, **fields: model_type.model_construct(
+            **fields))
+        return record_type._MODEL.model_construct(**data_dict)  # pylint: disable=protected-access
+
+    def _get_record_type(self, bcp47_type: BCP47Type) -> Type[Record]:
+        """Return the record type of a type, it also describes the dataclass of the type and his linked tags.
+
+        :raise exceptions.unexpected_bcp47_type_error.UnexpectedBCP47TypeError:"""
+        if not (record_type := self._RECORD_TYPES.get(bcp47_type)):
+            raise UnexpectedBCP47TypeError(bcp47_type)
+        return record_type
+
+    @staticmethod
+    def _create_nested(data_dict: Dict[str, Any], record_type: Type[Record],
+                       factory: Callable[..., Any]) -> Dict[str, Any]:
+        """Replace the dicts of linked tags, like preferred values or prefixes, by the result of the factory. The
+        factory is called with the dataclass of the field and the linked objects as keyword arguments."""
+        for field_name, model_type in record_type._NESTED_MODELS.items():  # pylint: disable=protected-access
+            if isinstance(value := data_dict.get(field_name), dict):
+                data_dict[field_name] = factory(model_type, **value)
+            elif isinstance(value, list):
+                data_dict[field_name] = [factory(model_type, **item) for item in value]
+        return data_dict
+
+    @staticmethod
+    def _create_language(data_dict: Dict[str, Any]) -> Language:
+        """Get dict data and loads to :class:`schemas.language.Language` dataclass.
+
+        :raise exceptions.invalid.invalid_language_data_error.InvalidLanguageDataError:"""
+        try:
+            return Language(**data_dict)
+        except ValidationError as e:
+            raise InvalidLanguageDataError(data_dict) from e
+
+    @staticmethod
+    def _create_ext_lang(data_dict: Dict[str, Any]) -> ExtLang:
+        """Get dict data and loads to :class:`schemas.ext_lang.ExtLang`.
+
+        :raise exceptions.invalid.invalid_ext_lang_error.InvalidExtLanguageDataError:"""
+        try:
+            return ExtLang(**data_dict)
+        except ValidationError as e:
+            raise InvalidExtLanguageDataError(data_dict) from e
+
+    @staticmethod
+    def _create_script(data_dict: Dict[str, Any]) -> Script:
+        """Get dict data and loads to :class:`schemas.script.Script`.
+
+        :raise exceptions.invalid.invalid_script_data_error.InvalidScriptDataError:"""
+        try:
+            return Script(**data_dict)
+        except ValidationError as e:
+            raise InvalidScriptDataError(data_dict) from e
+
+    @staticmethod
+    def _create_region(data_dict: Dict[str, Any]) -> Region:
+        """Get dict data and loads to :class:`schemas.region.Region`.
+
+        :raise exceptions.invalid.invalid_region_data_error.InvalidRegionDataError:"""
+        try:
+            return Region(**data_dict)
+        except ValidationError as e:
+            raise InvalidRegionDataError(data_dict) from e
+
+    @staticmethod
+    def _create_variant(data_dict: Dict[str, Any]) -> Variant:
+        """Get dict data and loads to :class:`schemas.variant.Variant`.
+
+        :raise exceptions.invalid.invalid_variant_data_error.InvalidVariantDataError:"""
+        try:
+            return Variant(**data_dict)
+        except ValidationError as e:
+            raise InvalidVariantDataError(data_dict) from e
+
+    @staticmethod
+    def _create_grandfathered(data_dict: Dict[str, Any]) -> Grandfathered:
+        """Get dict data and loads to :class:`schemas.grandfathered.Grandfathered`.
+
+        :raise exceptions.invalid.invalid_grandfathered_data_error.InvalidGrandfatheredDataError:"""
+        try:
+            return Grandfathered(**data_dict)
+        except ValidationError as e:
+            raise InvalidGrandfatheredDataError(data_dict) from e
+
+    @staticmethod
+    def _create_redundant(data_dict: Dict[str, Any]) -> Redundant:
+        """Get dict data and loads to :class:`schemas.redundant.Redundant`.
+
+        :raise exceptions.invalid.invalid_redundant_data_error.InvalidRedundantDataError:"""
+        try:
+            return Redundant(**data_dict)
+        except ValidationError as e:
+            raise InvalidRedundantDataError(data_dict) from e
+
+    def _replace_to_object(self, symbol_table: _SymbolTable, data_dict: Dict[str, Any],
+                           bcp47_type: BCP47Type) -> Dict[str, Any]:
+        """From dict data replace string values that should be references to objects. References are linked through
+        the symbol table.
+
+        :raise exceptions.not_found.tag_or_subtag_not_found_error.TagOrSubtagNotFoundError:
+        :raise exceptions.not_found.script_subtag_not_found_error.ScriptSubtagNotFoundError:
+        :raise exceptions.not_found.language_subtag_not_found_error.LanguageSubtagNotFoundError:
+        :raise exceptions.not_found.language_scope_not_found_error.LanguageScopeNotFoundError:"""
+        if preferred_value := data_dict.pop('preferred_value', None):
+            data_dict['preferred_value'] = self._link_tag(symbol_table, preferred_value)
+
+        if suppress_script := data_dict.pop('suppress_script', None):
+            try:
+                data_dict['suppress_script'] = self._link_item(symbol_table, BCP47Type.SCRIPT, suppress_script)
+            except TagOrSubtagNotFoundError as e:
+                raise ScriptSubtagNotFoundError(suppress_script) from e
+
+        if macro_language := data_dict.pop('macro_language', None):
+            try:
+                data_dict['macro_language'] = self._link_item(symbol_table, BCP47Type.LANGUAGE, macro_language)
+            except TagOrSubtagNotFoundError as e:
+                raise LanguageSubtagNotFoundError(macro_language) from e
+
+        if langauge_scope := data_dict.pop('scope', None):
+            data_dict['scope'] = self.get_language_scope_by_name(langauge_scope)
+
+        if prefix_s := data_dict.pop('prefix', None):
+            data_dict['prefix'] = [self._link_tag(symbol_table, prefix) for prefix in prefix_s]
+
+        if bcp47_type == BCP47Type.REDUNDANT:
+            data_dict['subtags'] = self._link_tag(symbol_table, data_dict.pop('tag'))
+
+        return data_dict
+
+    @staticmethod
+    def _get_referenced_subtags(data_dict: Dict[str, Any], bcp47_type: BCP47Type) -> Set[str]:
+        """Return the subtag strings that a dict item references, the ones that are linked by
+        :func:`LanguageSubtagRegistryMixin._replace_to_object`."""
+        tags = [data_dict.get('preferred_value'), data_dict.get('suppress_script'), data_dict.get('macro_language'),
+                *data_dict.get('prefix', ())]
+        if bcp47_type == BCP47Type.REDUNDANT:
+            tags.append(data_dict.get('tag'))
+        return {subtag for tag in tags if tag for subtag in tag.split('-')}
+
+    def _link_tag(self, symbol_table: _SymbolTable, tag: str) -> Dict[str, Union[SubtagType, List[SubtagType]]]:
+        """Parse a string tag and return a dict with the linked objects of all subtags contained in the string tag.
+        Each subtag is resolved to the first subtag type of _TAG_SUBTAG_TYPES that it is not exhausted and that contains
+        the subtag.
+
+        :raise exceptions.not_found.tag_or_subtag_not_found_error.TagOrSubtagNotFoundError:"""
+        tag_parsed_data: Dict[str, Union[SubtagType, List[SubtagType]]] = {}
+        tag_subtag_type_index = 0
+        repetitions = 0
+
+        for subtag in tag.split('-'):
+            while True:
+                if tag_subtag_type_index >= len(self._TAG_SUBTAG_TYPES):
+                    raise TagOrSubtagNotFoundError(f"Subtag {subtag} of {tag} is not found.")
+                tag_subtag_type = self._TAG_SUBTAG_TYPES[tag_subtag_type_index]
+                if repetitions < tag_subtag_type.max_subtags and subtag in symbol_table.items[
+                        tag_subtag_type.bcp47_type]:
+                    break
+                tag_subtag_type_index += 1
+                repetitions = 0
+
+            value = self._link_item(symbol_table, tag_subtag_type.bcp47_type, subtag)
+            if tag_subtag_type.max_subtags == 1:
+                tag_parsed_data[tag_subtag_type.bcp47_type.value] = value
+            else:
+                tag_parsed_data.setdefault(tag_subtag_type.bcp47_type.value, []).append(value)
+            repetitions += 1
+        return tag_parsed_data
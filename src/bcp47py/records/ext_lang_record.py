@@ -0,0 +1,21 @@
+"""Module related with ExtLangRecord class."""
+from records.record import Record
+from schemas.ext_lang import ExtLang, ExtLangPreferredValue, ExtLangPrefix
+
+
+class ExtLangRecord(Record):
+    """Record of a :class:`schemas.ext_lang.ExtLang`. Check :class:`records.record.Record` for more information."""
+    _FIELDS = tuple(ExtLang.model_fields)
+    __slots__ = _FIELDS
+    _MODEL = ExtLang
+    _NESTED_MODELS = {
+        'preferred_value': ExtLangPreferredValue,
+        'prefix': ExtLangPrefix,
+    }
+
+    @property
+    def tag_str(self) -> str:
+        return self.subtag
+
+    def to_model(self) -> ExtLang:
+        return super().to_model()
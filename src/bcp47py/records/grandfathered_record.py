@@ -0,0 +1,21 @@
+"""Module related with GrandfatheredRecord class."""
+from records.record import Record
+from schemas.grandfathered import Grandfathered, GrandfatheredPreferredValue
+
+
+class GrandfatheredRecord(Record):
+    """Record of a :class:`schemas.grandfathered.Grandfathered`. Check :class:`records.record.Record` for more
+    information."""
+    _FIELDS = tuple(Grandfathered.model_fields)
+    __slots__ = _FIELDS
+    _MODEL = Grandfathered
+    _NESTED_MODELS = {
+        'preferred_value': GrandfatheredPreferredValue,
+    }
+
+    @property
+    def tag_str(self) -> str:
+        return self.tag
+
+    def to_model(self) -> Grandfathered:
+        return super().to_model()
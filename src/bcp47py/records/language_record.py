@@ -0,0 +1,20 @@
+"""Module related with LanguageRecord class."""
+from records.record import Record
+from schemas.language import Language, LanguagePreferredValue
+
+
+class LanguageRecord(Record):
+    """Record of a :class:`schemas.language.Language`. Check :class:`records.record.Record` for more information."""
+    _FIELDS = tuple(Language.model_fields)
+    __slots__ = _FIELDS
+    _MODEL = Language
+    _NESTED_MODELS = {
+        'preferred_value': LanguagePreferredValue,
+    }
+
+    @property
+    def tag_str(self) -> str:
+        return self.subtag
+
+    def to_model(self) -> Language:
+        return super().to_model()
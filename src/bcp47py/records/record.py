@@ -0,0 +1,94 @@
+"""Module related with Record class."""
+import abc
+import sys
+from abc import ABC
+from datetime import datetime
+from typing import Any, Dict, Tuple, Type
+
+from pydantic import BaseModel
+
+_TUPLE_FIELDS = frozenset({'description', 'comments', 'prefix', 'extlang', 'variant'})
+_DATETIMES: Dict[datetime, datetime] = {}
+
+
+class Record(ABC):
+    """Lightweight and immutable representation of a BCP47 type that could be used instead of a pydantic model. Records
+    have the same attribute names than the pydantic model that they represent, but they are slotted classes without
+    validation: strings are interned, equal datetimes are shared and lists are stored as tuples.
+
+    The pydantic model is only created when :func:`records.record.Record.to_model` is called, and it is kept by the
+    record. Nested records are also converted to pydantic models."""
+    __slots__ = ('_model',)
+    _FIELDS: Tuple[str, ...] = ()
+    _MODEL: Type[BaseModel]
+    _NESTED_MODELS: Dict[str, Type[BaseModel]] = {}
+    """Pydantic models of the fields that contain a :class:`records.subtags_record.SubtagsRecord`."""
+
+    def __init__(self, **fields: Any):
+        """Set the value of each field. Missing fields are None or an empty tuple if the field is a list.
+
+        :raise TypeError: some field is not a field of the record."""
+        for name in self._FIELDS:
+            value = fields.pop(name, None)
+            object.__setattr__(self, name, self._intern(value, name in _TUPLE_FIELDS))
+        if fields:
+            raise TypeError(f'{type(self).__name__} got unexpected fields: {", ".join(fields)}')
+        object.__setattr__(self, '_model', None)
+
+    @property
+    @abc.abstractmethod
+    def tag_str(self) -> str:
+        """Return the string tag. If only have a subtag return the subtag."""
+
+    def to_model(self) -> BaseModel:
+        """Return the pydantic model of the record. It is created and validated the first time that it is requested.
+
+        :raise pydantic.ValidationError: data of the record is not valid for the pydantic model."""
+        if (model := self._model) is None:
+            model = self._get_model_type()(**{name: self._to_model_value(value)
+                                              for name in self._FIELDS
+                                              if (value := getattr(self, name)) is not None and value != ()})
+            object.__setattr__(self, '_model', model)
+        return model
+
+    def _get_model_type(self) -> Type[BaseModel]:
+        return self._MODEL
+
+    @classmethod
+    def _to_model_value(cls, value: Any) -> Any:
+        if isinstance(value, Record):
+            return value.to_model()
+        if isinstance(value, tuple):
+            return [cls._to_model_value(item) for item in value]
+        return value
+
+    @staticmethod
+    def _intern(value: Any, is_tuple: bool) -> Any:
+        """Return the value with interned strings and shared datetimes. Lists are converted to tuples, but their strings
+        are not interned because descriptions and comments are rarely repeated and the intern table would only add
+        memory."""
+        if isinstance(value, str):
+            return sys.intern(value)
+        if isinstance(value, datetime):
+            return _DATETIMES.setdefault(value, value)
+        if isinstance(value, (list, tuple)) or (is_tuple and value is None):
+            return tuple(value or ())
+        return value
+
+    def __setattr__(self, name: str, value: Any):
+        raise AttributeError(f'{type(self).__name__} is immutable')
+
+    def __delattr__(self, name: str):
+        raise AttributeError(f'{type(self).__name__} is immutable')
+
+    def __getstate__(self) -> Dict[str, Any]:
+        return {name: getattr(self, name) for cls in type(self).__mro__ for name in getattr(cls, '__slots__', ())
+                if name != '_model'}
+
+    def __setstate__(self, state: Dict[str, Any]):
+        for name, value in state.items():
+            object.__setattr__(self, name, value)
+        object.__setattr__(self, '_model', None)
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}({self.tag_str!r})'
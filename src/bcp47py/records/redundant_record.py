@@ -0,0 +1,25 @@
+"""Module related with RedundantRecord class."""
+from records.record import Record
+from schemas.redundant import Redundant, RedundantPreferredValue, RedundantSubtags
+
+
+class RedundantRecord(Record):
+    """Record of a :class:`schemas.redundant.Redundant`. Check :class:`records.record.Record` for more information."""
+    _FIELDS = tuple(Redundant.model_fields)
+    __slots__ = _FIELDS
+    _MODEL = Redundant
+    _NESTED_MODELS = {
+        'preferred_value': RedundantPreferredValue,
+        'subtags': RedundantSubtags,
+    }
+
+    @property
+    def tag(self) -> str:
+        return self.subtags.tag
+
+    @property
+    def tag_str(self) -> str:
+        return self.tag
+
+    def to_model(self) -> Redundant:
+        return super().to_model()
@@ -0,0 +1,20 @@
+"""Module related with RegionRecord class."""
+from records.record import Record
+from schemas.region import Region, RegionPreferredValue
+
+
+class RegionRecord(Record):
+    """Record of a :class:`schemas.region.Region`. Check :class:`records.record.Record` for more information."""
+    _FIELDS = tuple(Region.model_fields)
+    __slots__ = _FIELDS
+    _MODEL = Region
+    _NESTED_MODELS = {
+        'preferred_value': RegionPreferredValue,
+    }
+
+    @property
+    def tag_str(self) -> str:
+        return self.subtag
+
+    def to_model(self) -> Region:
+        return super().to_model()
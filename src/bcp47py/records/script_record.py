@@ -0,0 +1,17 @@
+"""Module related with ScriptRecord class."""
+from records.record import Record
+from schemas.script import Script
+
+
+class ScriptRecord(Record):
+    """Record of a :class:`schemas.script.Script`. Check :class:`records.record.Record` for more information."""
+    _FIELDS = tuple(Script.model_fields)
+    __slots__ = _FIELDS
+    _MODEL = Script
+
+    @property
+    def tag_str(self) -> str:
+        return self.subtag
+
+    def to_model(self) -> Script:
+        return super().to_model()
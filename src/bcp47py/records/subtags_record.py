@@ -0,0 +1,30 @@
+"""Module related with SubtagsRecord class."""
+from typing import Any, Type
+
+from pydantic import BaseModel
+
+from records.record import Record
+
+
+class SubtagsRecord(Record):
+    """Record of a tag that references subtag records, like preferred values, prefixes and subtags of redundant tags.
+    The pydantic model depends on the field that contains the record, so it is provided when the record is created."""
+    _FIELDS = ('language', 'extlang', 'script', 'region', 'variant')
+    __slots__ = _FIELDS + ('_model_type',)
+
+    def __init__(self, model_type: Type[BaseModel], **fields: Any):
+        object.__setattr__(self, '_model_type', model_type)
+        super().__init__(**fields)
+
+    @property
+    def tag(self) -> str:
+        """Return a tag in string format."""
+        return '-'.join(subtag.subtag
+                        for subtag in (self.language, *self.extlang, self.script, self.region, *self.variant) if subtag)
+
+    @property
+    def tag_str(self) -> str:
+        return self.tag
+
+    def _get_model_type(self) -> Type[BaseModel]:
+        return self._model_type
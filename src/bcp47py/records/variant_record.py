@@ -0,0 +1,21 @@
+"""Module related with VariantRecord class."""
+from records.record import Record
+from schemas.variant import Variant, VariantPreferredValue, VariantPrefix
+
+
+class VariantRecord(Record):
+    """Record of a :class:`schemas.variant.Variant`. Check :class:`records.record.Record` for more information."""
+    _FIELDS = tuple(Variant.model_fields)
+    __slots__ = _FIELDS
+    _MODEL = Variant
+    _NESTED_MODELS = {
+        'preferred_value': VariantPreferredValue,
+        'prefix': VariantPrefix,
+    }
+
+    @property
+    def tag_str(self) -> str:
+        return self.subtag
+
+    def to_model(self) -> Variant:
+        return super().to_model()
@@ -1,88 +1,74 @@
 """Repository that provides all data from BCP47."""
-
 import dataclasses
-import functools
-from datetime import datetime
-from typing import Optional, Dict, Any, Type, List, Union
-
-from pydantic import ValidationError
+import os
+import threading
+from typing import Optional, Dict, Any, List, Tuple, Union, Set, Sequence
 
 from abstract.bcp47_repository.in_memory_bcp47_repository_abstract import InMemoryBCP47RepositoryAbstract
 from enums.bcp47_type import BCP47Type
 from enums.language_scope import LanguageScopeEnum
-from exceptions.invalid.invalid_ext_lang_data_error import InvalidExtLanguageDataError
-from exceptions.invalid.invalid_grandfathered_data_error import InvalidGrandfatheredDataError
-from exceptions.invalid.invalid_language_data_error import InvalidLanguageDataError
-from exceptions.invalid.invalid_redundant_data_error import InvalidRedundantDataError
-from exceptions.invalid.invalid_region_data_error import InvalidRegionDataError
-from exceptions.invalid.invalid_registry_file_date_error import InvalidRegistryFileDate
-from exceptions.invalid.invalid_script_data_error import InvalidScriptDataError
-from exceptions.invalid.invalid_variant_data_error import InvalidVariantDataError
-from exceptions.unexpected_bcp47.unexpected_bcp47_duplicated_key import UnexpectedBCP47DuplicatedKeyError
-from exceptions.unexpected_bcp47.unexpected_bcp47_key_error import UnexpectedBCP47KeyError
-from exceptions.unexpected_bcp47.unexpected_bcp47_key_type_error import UnexpectedBCP47KeyTypeError
-from exceptions.unexpected_bcp47.unexpected_bcp47_missing_file_date_error import UnexpectedBCP47MissingFileDateError
-from exceptions.unexpected_bcp47.unexpected_bcp47_missing_type_error import UnexpectedBCP47MissingTypeError
-from exceptions.unexpected_bcp47.unexpected_bcp47_no_previous_key_error import UnexpectedBCP47NoPreviousKeyError
-from exceptions.unexpected_bcp47.unexpected_bcp47_previous_data_type_error import UnexpectedBCP47PreviousDataTypeError
-from exceptions.unexpected_bcp47.unexpected_bcp47_type_error import UnexpectedBCP47TypeError
-from exceptions.unexpected_bcp47.unexpected_bcp47_value_error import UnexpectedBCP47ValueError
-from mixin.base import Base
-from schemas.ext_lang import ExtLang
-from schemas.grandfathered import Grandfathered
-from schemas.language import Language
+from exceptions.read_only_repository_error import ReadOnlyRepositoryError
+from mixin.language_subtag_registry_mixin import LanguageSubtagRegistryMixin, _SymbolTable
+from records.record import Record
 from schemas.language_scope import LanguageScope
-from schemas.redundant import Redundant
-from schemas.region import Region
-from schemas.script import Script
-from schemas.variant import Variant
-
-
-@dataclasses.dataclass
-class _BCP47ValueType:
-    """Helper dataclass that it structures the value of _BCP47_KEY_VALUE_TYPE_MAPPING dict."""
-    value_type: Type
-    internal_name: str
+from schemas.registry_diff import RegistryDiff
+from snapshot_service import SnapshotService
+from type_aliases import TagsOrSubtagType, LanguageSubtagRegistrySource, RegistryDiffItems, TagOrSubtagChanges
 
 
 @dataclasses.dataclass
-class _AddNewDataReturn:
-    """Helper dataclass that it structures the return data from "_add_new_data" method."""
-    data_dict: Dict[str, Any]
-    previous_key: str
+class _SharedInstance:
+    """Helper dataclass that holds a shared repository, the modification time and size of his language subtag registry
+    when it was loaded and the lock that serializes his load."""
+    lock: threading.Lock = dataclasses.field(default_factory=threading.Lock)
+    file_stat: Optional[Tuple[int, int]] = None
+    repository: Optional['Repository'] = None
 
 
-class Repository(InMemoryBCP47RepositoryAbstract, Base):
+class Repository(InMemoryBCP47RepositoryAbstract, LanguageSubtagRegistryMixin):
     """Repository that provides all data from the BCP47 specification in several dataclasses."""
-    _BCP47_TYPE_PROCESSING_ORDER = [
-        BCP47Type.SCRIPT, BCP47Type.LANGUAGE, BCP47Type.REGION, BCP47Type.EXTLANG, BCP47Type.VARIANT,
-        BCP47Type.GRANDFATHERED, BCP47Type.REDUNDANT
-    ]
-    _BCP47_DEPENDENCY_FIELDS = [
-        'macro_language',
-        'preferred_value',
-    ]
-    _ITEM_SEPARATOR = '%%'
-    _KEY_VALUE_SEPARATOR = ': '
-    _FILE_HEADER = 'File-Date: '
-    _BCP47_KEY_VALUE_TYPE_MAPPING: Dict[str, _BCP47ValueType] = {
-        'Type': _BCP47ValueType(value_type=BCP47Type, internal_name='bcp_type'),
-        'Subtag': _BCP47ValueType(value_type=str, internal_name='subtag'),
-        'Description': _BCP47ValueType(value_type=list, internal_name='description'),
-        'Suppress-Script': _BCP47ValueType(value_type=str, internal_name='suppress_script'),
-        'Scope': _BCP47ValueType(value_type=str, internal_name='scope'),
-        'Added': _BCP47ValueType(value_type=datetime, internal_name='added'),
-        'Macrolanguage': _BCP47ValueType(value_type=str, internal_name='macro_language'),
-        'Comments': _BCP47ValueType(value_type=list, internal_name='comments'),
-        'Preferred-Value': _BCP47ValueType(value_type=str, internal_name='preferred_value'),
-        'Deprecated': _BCP47ValueType(value_type=datetime, internal_name='deprecated'),
-        'Prefix': _BCP47ValueType(value_type=list, internal_name='prefix'),
-        'Tag': _BCP47ValueType(value_type=str, internal_name='tag'),
-    }
-
-    def __init__(self, language_subtag_registry_file_path: Optional[str] = None):
+    _SNAPSHOT_LANGUAGES_SCOPES_KEY = 'languages_scopes'
+    _SNAPSHOT_RECORDS_KEY_SUFFIX = '-records'
+    _SNAPSHOT_TRUSTED_KEY_SUFFIX = '-trusted'
+    _shared_instances: Dict[Tuple[Any, ...], _SharedInstance] = {}
+    _shared_instances_lock = threading.Lock()
+
+    def __init__(self,
+                 language_subtag_registry_file_path: Optional[LanguageSubtagRegistrySource] = None,
+                 snapshot_dir_path: Optional[str] = None,
+                 tag_parser_cache_size: Optional[int] = None,
+                 use_records: bool = False,
+                 lazy: bool = False,
+                 trusted: bool = False):
         """Main constructor also call a method that load all the data in this instance.
 
+        The language subtag registry could be a file path or a text or binary stream, like stdin, a gzip file or an
+        HTTP response. It is read line by line and the stream is not closed.
+
+        If a snapshot directory path is provided, the fully loaded data is stored as a snapshot in that directory the
+        first time that the language subtag registry is loaded and following instances restore it from the snapshot
+        instead of parsing and validating the language subtag registry again. Check
+        :class:`snapshot_service.SnapshotService` for more information.
+
+        If a tag parser cache size is provided, results of :func:`repository.Repository.tag_parser` are cached. Check
+        :class:`abstract.bcp47_repository.in_memory_bcp47_repository_abstract.InMemoryBCP47RepositoryAbstract` for
+        more information.
+
+        If use_records is enabled, tags and subtags are loaded as lightweight :class:`records.record.Record` instances
+        instead of pydantic models. Records have the same attributes, use less memory and they are converted to pydantic
+        models on demand with :func:`records.record.Record.to_model`.
+
+        If lazy is enabled, the language subtag registry is only indexed by type and subtag or tag when the repository
+        is created. Each type is parsed and loaded the first time that it is accessed, and only the objects that it
+        references from other types are created, so errors in the data of a type are raised when that type is
+        accessed. The tag parser loads all subtag types and canonicalization loads all types. Snapshots are not used in
+        lazy mode or when the language subtag registry is a stream.
+
+        If trusted is enabled, items are parsed without checks and dataclasses are built without validation, so it
+        should only be used with language subtag registries that are already validated, like the bundled one.
+        Validation could be run later, for example in a background thread or in CI, with
+        :func:`repository.Repository.validate`.
+
         :raise exceptions.unexpected_bcp47_missing_file_date_error.UnexpectedBCP47MissingFileDateError:
         :raise exceptions.invalid.invalid_registry_file_date_error.InvalidRegistryFileDate:
         :raise exceptions.unexpected_bcp47_no_previous_key_error.UnexpectedBCP47NoPreviousKeyError:
@@ -100,9 +86,78 @@ class Repository(InMemoryBCP47RepositoryAbstract, Base):
         :raise exceptions.invalid.invalid_variant_data_error.InvalidVariantDataError:
         :raise exceptions.invalid.invalid_grandfathered_data_error.InvalidGrandfatheredDataError:
         :raise exceptions.invalid.invalid_redundant_data_error.InvalidRedundantDataError:"""
-        self._language_subtag_registry_file_path = (language_subtag_registry_file_path
-                                                    or self._LANGUAGE_SUBTAG_REGISTRY_FILE_PATH)
-        super().__init__()
+        self._language_subtag_registry_source = (language_subtag_registry_file_path
+                                                 or self._LANGUAGE_SUBTAG_REGISTRY_FILE_PATH)
+        self._snapshot_service = SnapshotService(snapshot_dir_path) if snapshot_dir_path else None
+        self._use_records = use_records
+        self._lazy = lazy
+        self._trusted = trusted
+        self._symbol_table: Optional[_SymbolTable] = None
+        self._read_only = False
+        self._read_only_tags_or_subtags: Dict[BCP47Type, Tuple[TagsOrSubtagType, ...]] = {}
+        super().__init__(tag_parser_cache_size=tag_parser_cache_size)
+
+    @classmethod
+    def get_shared(cls,
+                   language_subtag_registry_file_path: Optional[Union[str, 'os.PathLike[str]']] = None,
+                   snapshot_dir_path: Optional[str] = None,
+                   tag_parser_cache_size: Optional[int] = None,
+                   use_records: bool = False,
+                   lazy: bool = False,
+                   trusted: bool = False) -> 'Repository':
+        """Return the instance of the language subtag registry that is shared by the whole process. It is keyed by the
+        resolved path of the language subtag registry and the rest of arguments of the constructor, so libraries of
+        the same process that request the same data get the same instance and it is only loaded once, even if the
+        first calls are concurrent. If the modification time or the size of the language subtag registry change, a
+        new instance is loaded.
+
+        Shared instances are read-only: :func:`repository.Repository.apply_diff` raises an error and the lists of tags
+        and subtags are returned as tuples. The tag and subtag objects are shared by all callers too, but pydantic models
+        are not frozen, so callers must not modify them. Records, loaded with use_records, are immutable.
+
+        :raise FileNotFoundError: the language subtag registry does not exist.
+        :raise exceptions.unexpected_bcp47_missing_file_date_error.UnexpectedBCP47MissingFileDateError:
+        :raise exceptions.invalid.invalid_registry_file_date_error.InvalidRegistryFileDate:
+        :raise exceptions.unexpected_bcp47_key_error.UnexpectedBCP47KeyError:
+        :raise exceptions.unexpected_bcp47_value_error.UnexpectedBCP47ValueError:
+        :raise exceptions.invalid.invalid_language_data_error.InvalidLanguageDataError:"""
+        file_path = os.path.realpath(language_subtag_registry_file_path or cls._LANGUAGE_SUBTAG_REGISTRY_FILE_PATH)
+        key = (cls, file_path, snapshot_dir_path, tag_parser_cache_size, use_records, lazy, trusted)
+        with cls._shared_instances_lock:
+            shared_instance = cls._shared_instances.setdefault(key, _SharedInstance())
+
+        with shared_instance.lock:
+            stat = os.stat(file_path)
+            if shared_instance.repository is None or shared_instance.file_stat != (stat.st_mtime_ns, stat.st_size):
+                shared_instance.repository = cls(file_path, snapshot_dir_path=snapshot_dir_path,
+                                                 tag_parser_cache_size=tag_parser_cache_size, use_records=use_records,
+                                                 lazy=lazy, trusted=trusted)
+                shared_instance.repository._read_only = True  # pylint: disable=protected-access
+                shared_instance.file_stat = (stat.st_mtime_ns, stat.st_size)
+            return shared_instance.repository
+
+    @classmethod
+    def drop_shared(cls, language_subtag_registry_file_path: Optional[Union[str, 'os.PathLike[str]']] = None):
+        """Drop the shared instances of a language subtag registry with any arguments, so the next call to
+        :func:`repository.Repository.get_shared` loads it again. Instances that are already returned are not changed.
+        If the language subtag registry is not provided, the shared instances of the bundled one are dropped."""
+        file_path = os.path.realpath(language_subtag_registry_file_path or cls._LANGUAGE_SUBTAG_REGISTRY_FILE_PATH)
+        with cls._shared_instances_lock:
+            for key in [key for key in cls._shared_instances if key[0] is cls and key[1] == file_path]:
+                del cls._shared_instances[key]
+
+    @property
+    def languages_scopes(self) -> Sequence[LanguageScope]:
+        return tuple(self._languages_scopes) if self._read_only else self._languages_scopes
+
+    def _get_tags_or_subtags(self, bcp47_type: BCP47Type) -> Sequence[TagsOrSubtagType]:
+        if not self._read_only:
+            return super()._get_tags_or_subtags(bcp47_type)
+        # Tables of read-only instances are never replaced, so the tuple of each type is only created once.
+        if (tags_or_subtags := self._read_only_tags_or_subtags.get(bcp47_type)) is None:
+            tags_or_subtags = self._read_only_tags_or_subtags[bcp47_type] = tuple(
+                super()._get_tags_or_subtags(bcp47_type))
+        return tags_or_subtags
 
     def _load_data(self):
         """Main function that is responsible to load all data in the instance.
@@ -124,18 +179,56 @@ class Repository(InMemoryBCP47RepositoryAbstract, Base):
         :raise exceptions.invalid.invalid_variant_data_error.InvalidVariantDataError
         :raise exceptions.invalid.invalid_grandfathered_data_error.InvalidGrandfatheredDataError:
         :raise exceptions.invalid.invalid_redundant_data_error.InvalidRedundantDataError:"""
-        self._load_languages_scopes()
-        self._load_bcp47()
-
-    def _load_languages_scopes(self):
-        """Function that create :class:`schemas.language_scope.LanguageScope` instances for each value of
-        :class:`enums.language_scope.LanguageScopeEnum` enum."""
-        for language_scope in LanguageScopeEnum:
-            self._languages_scopes.append(LanguageScope(scope=language_scope))
+        if self._lazy:
+            self._load_languages_scopes()
+            self._symbol_table = self._index_items(self._language_subtag_registry_source)
+            self._unloaded_types.update(self._tags_or_subtags)
+            return
+
+        if not self._snapshot_service or not isinstance(self._language_subtag_registry_source, (str, os.PathLike)):
+            self._load_languages_scopes()
+            self._load_bcp47()
+            return
+
+        snapshot_key = self._snapshot_service.get_key(self._language_subtag_registry_source)
+        if self._use_records:
+            snapshot_key += self._SNAPSHOT_RECORDS_KEY_SUFFIX
+        elif self._trusted:
+            snapshot_key += self._SNAPSHOT_TRUSTED_KEY_SUFFIX
+        snapshot = self._snapshot_service.load(snapshot_key)
+        if not snapshot or not self._load_snapshot(snapshot):
+            self._load_languages_scopes()
+            self._load_bcp47()
+            self._snapshot_service.dump(snapshot_key, self._get_snapshot())
+
+    def validate(self):
+        """Validate all tags and subtags. It is intended for repositories that are loaded in trusted mode, where
+        dataclasses are not validated when they are created, but it could be used in any mode. Records are validated
+        converting them to pydantic models. Types that are not loaded yet in lazy mode are loaded.
 
-    def _load_bcp47(self):
-        """Main function that is responsible to parse a "language subtag registry" file and load data into the
-        instance.
+        :raise exceptions.invalid.invalid_language_data_error.InvalidLanguageDataError:
+        :raise exceptions.invalid.invalid_ext_lang_error.InvalidExtLanguageDataError:
+        :raise exceptions.invalid.invalid_script_data_error.InvalidScriptDataError:
+        :raise exceptions.invalid.invalid_region_data_error.InvalidRegionDataError:
+        :raise exceptions.invalid.invalid_variant_data_error.InvalidVariantDataError
+        :raise exceptions.invalid.invalid_grandfathered_data_error.InvalidGrandfatheredDataError:
+        :raise exceptions.invalid.invalid_redundant_data_error.InvalidRedundantDataError:
+        :raise pydantic.ValidationError: some record is not valid."""
+        self._ensure_loaded(self._tags_or_subtags)
+        for bcp47_type, tags_or_subtags in self._tags_or_subtags.items():
+            for tag_or_subtag in tags_or_subtags:
+                if isinstance(tag_or_subtag, Record):
+                    tag_or_subtag.to_model()
+                else:
+                    self._validate_item(tag_or_subtag.model_dump(), bcp47_type)
+
+    def diff(self, new_language_subtag_registry: LanguageSubtagRegistrySource,
+             old_language_subtag_registry: Optional[LanguageSubtagRegistrySource] = None) -> RegistryDiff:
+        """Return the differences between two versions of a "Language subtag registry" keyed by type and subtag or tag.
+        The diff could be applied to repositories that are loaded from the old version with
+        :func:`repository.Repository.apply_diff`. If the old version is not provided, it is the language subtag registry
+        that this repository was loaded from, so it must be a file path. Both versions are parsed in the same mode as
+        this repository.
 
         :raise exceptions.unexpected_bcp47_missing_file_date_error.UnexpectedBCP47MissingFileDateError:
         :raise exceptions.invalid.invalid_registry_file_date_error.InvalidRegistryFileDate:
@@ -145,7 +238,49 @@ class Repository(InMemoryBCP47RepositoryAbstract, Base):
         :raise exceptions.unexpected_bcp47_duplicated_key.UnexpectedBCP47DuplicatedKeyError:
         :raise exceptions.unexpected_bcp47_value_error.UnexpectedBCP47ValueError:
         :raise exceptions.unexpected_bcp47_key_type_error.UnexpectedBCP47KeyTypeError:
-        :raise exceptions.missing_bcp_type_error.MissingBCPTypeError:
+        :raise exceptions.missing_bcp_type_error.MissingBCPTypeError:"""
+        old_items = self._read_symbol_table(old_language_subtag_registry
+                                            or self._language_subtag_registry_source).items
+        new_items = self._read_symbol_table(new_language_subtag_registry).items
+        added: RegistryDiffItems = {}
+        removed: RegistryDiffItems = {}
+        modified: RegistryDiffItems = {}
+        for bcp47_type in BCP47Type:
+            old_type_items, new_type_items = old_items[bcp47_type], new_items[bcp47_type]
+            if type_added := {key: data_dict for key, data_dict in new_type_items.items() if key not in old_type_items}:
+                added[bcp47_type] = type_added
+            if type_removed := {key: data_dict for key, data_dict in old_type_items.items()
+                                if key not in new_type_items}:
+                removed[bcp47_type] = type_removed
+            # The 'File-Date' of each version is the 'updated_at' of all his items, so it is not compared.
+            if type_modified := {key: data_dict for key, data_dict in new_type_items.items()
+                                 if key in old_type_items
+                                 and {**data_dict, 'updated_at': None} != {**old_type_items[key], 'updated_at': None}}:
+                modified[bcp47_type] = type_modified
+
+        relinked = self._get_relinked_items(new_items, added, removed, modified)
+        return RegistryDiff(added=added, removed=removed, modified=modified, relinked=relinked)
+
+    def apply_diff(self, diff: RegistryDiff):
+        """Apply the differences between two versions of a "Language subtag registry", returned by
+        :func:`repository.Repository.diff`, to this repository, that must be loaded from the old version. Only the
+        objects of the added, modified and relinked items are created, and only the indexes of the changed types and
+        tags or subtags are updated, so it is much faster than loading the new version.
+
+        Objects of modified and relinked items keep the position of the old ones in the list of their type, objects of
+        added items are appended at the end of the list of their type and objects that are not changed keep their
+        'updated_at'. All objects are created before the repository is updated, so if some of them could not be created
+        the repository is not changed. Types that are not loaded yet in lazy mode are loaded.
+
+        The repository could be used by other threads meanwhile: the changes are applied to a copy of the tables that
+        replaces the current ones in a single step, so readers see either the old or the new version, and the caches are
+        invalidated once. Concurrent calls are serialized. Shared instances, returned by
+        :func:`repository.Repository.get_shared`, could not be modified.
+
+        :raise exceptions.read_only_repository_error.ReadOnlyRepositoryError: the repository is a shared instance.
+        :raise exceptions.not_found.tag_or_subtag_not_found_error.TagOrSubtagNotFoundError:
+        :raise exceptions.unexpected_bcp47.unexpected_bcp47_circular_reference_error.\
+            UnexpectedBCP47CircularReferenceError:
         :raise exceptions.unexpected_bcp47_type_error.UnexpectedBCP47TypeError:
         :raise exceptions.invalid.invalid_language_data_error.InvalidLanguageDataError:
         :raise exceptions.invalid.invalid_ext_lang_error.InvalidExtLanguageDataError:
@@ -154,144 +289,120 @@ class Repository(InMemoryBCP47RepositoryAbstract, Base):
         :raise exceptions.invalid.invalid_variant_data_error.InvalidVariantDataError
         :raise exceptions.invalid.invalid_grandfathered_data_error.InvalidGrandfatheredDataError:
         :raise exceptions.invalid.invalid_redundant_data_error.InvalidRedundantDataError:"""
-        with open(self._language_subtag_registry_file_path, 'r', encoding=self._LANGUAGE_SUBTAG_REGISTRY_ENCODING) as f:
-            items = f.read().split(self._ITEM_SEPARATOR)
-
-        updated_at = self._get_file_date(items.pop(0))
-        items = [self._parse_item(item, updated_at) for item in items]
-        items.sort(key=functools.cmp_to_key(self._sort_bcp47_items))
-
-        for item in items:
-            self._add_item(item)
-
-    def _sort_bcp47_items(self, a: Dict[str, Any], b: Dict[str, Any]) -> int:
-        """Comparison function to sort items of a "Language subtag registry". It is very important to sort the items due
-        the processing could require other previous item."""
-        if a['bcp_type'] != b['bcp_type']:
-            a_index = self._BCP47_TYPE_PROCESSING_ORDER.index(a['bcp_type'])
-            b_index = self._BCP47_TYPE_PROCESSING_ORDER.index(b['bcp_type'])
-            sort_order = a_index - b_index
-        elif a.get('preferred_value') is not None and b.get('preferred_value') is None:
-            sort_order = 1
-        elif a.get('preferred_value') is None and b.get('preferred_value') is not None:
-            sort_order = -1
-        elif a.get('prefix') is not None and b.get('prefix') is None:
-            sort_order = 1
-        elif a.get('prefix') is None and b.get('prefix') is not None:
-            sort_order = -1
-        elif a.get('scope') is not None and b.get('scope') is None:
-            sort_order = -1
-        elif a.get('scope') is None and b.get('scope') is not None:
-            sort_order = 1
-        elif a.get('prefix') is not None and a.get('prefix') is not None:
-            if a.get('prefix') > b.get('prefix'):
-                sort_order = 1
-            elif a.get('prefix') < b.get('prefix'):
-                sort_order = -1
-            else:
-                sort_order = 0
-        elif a.get('added') < b.get('added'):
-            sort_order = 1
-        elif a.get('added') > b.get('added'):
-            sort_order = -1
-        else:
-            sort_order = 0
-        return sort_order
-
-    def _get_file_date(self, text: str) -> datetime:
-        """Return the 'File-Date' that is the version date from the "Language Subtag registry".
-
-        :raise exceptions.unexpected_bcp47_missing_file_date_error.UnexpectedBCP47MissingFileDateError:
-        :raise exceptions.invalid.invalid_registry_file_date_error.InvalidRegistryFileDate:"""
-        if not text.startswith(self._FILE_HEADER):
-            raise UnexpectedBCP47MissingFileDateError()
+        if self._read_only:
+            raise ReadOnlyRepositoryError(str(self._language_subtag_registry_source))
+        self._ensure_loaded(self._tags_or_subtags)
+        with self._unloaded_types_lock:
+            self._update_tags_or_subtags(self._get_diff_changes(diff))
+
+    def _get_diff_changes(self, diff: RegistryDiff) -> TagOrSubtagChanges:
+        """Create the objects of the added, modified and relinked items of a diff and return the changes that apply it,
+        as pairs of the old and the new object of each type. The repository is not changed."""
+        created_items = (diff.added, diff.modified, diff.relinked)
+        symbol_table = _SymbolTable()
+        for bcp47_type, index in self._indexes.items():
+            replaced_keys = {key for items in (diff.removed, *created_items) for key in items.get(bcp47_type, ())}
+            symbol_table.objects[bcp47_type] = {key: tag_or_subtag
+                                                for key, tag_or_subtag in index.case_sensitive.items()
+                                                if key not in replaced_keys}
+            # Objects that are kept are already linked, their keys are only needed to resolve the subtags of tags.
+            symbol_table.items[bcp47_type] = dict.fromkeys(symbol_table.objects[bcp47_type])
+            for items in created_items:
+                symbol_table.items[bcp47_type].update(
+                    (key, dict(data_dict)) for key, data_dict in items.get(bcp47_type, {}).items())
+
+        changes: TagOrSubtagChanges = {}
+        for bcp47_type, items in diff.removed.items():
+            changes[bcp47_type] = [(old, None) for key in items
+                                   if (old := self._indexes[bcp47_type].case_sensitive.get(key)) is not None]
+        for items in created_items:
+            for bcp47_type, type_items in items.items():
+                changes.setdefault(bcp47_type, []).extend(
+                    (self._indexes[bcp47_type].case_sensitive.get(key), self._link_item(symbol_table, bcp47_type, key))
+                    for key in type_items)
+        return changes
+
+    def _read_symbol_table(self, source: LanguageSubtagRegistrySource) -> _SymbolTable:
+        """Read a "Language subtag registry" and return a symbol table with all his items registered.
+
+        :raise exceptions.missing_bcp_type_error.MissingBCPTypeError:"""
+        symbol_table = _SymbolTable()
+        for data_dict in self._read_items(source):
+            self._register_item(symbol_table, data_dict)
+        return symbol_table
+
+    def _get_relinked_items(self, items: RegistryDiffItems, added: RegistryDiffItems,
+                            removed: RegistryDiffItems, modified: RegistryDiffItems) -> RegistryDiffItems:
+        """Return the items of a registry that are not added or modified but that reference, directly or through other
+        items, a subtag that is added, removed or modified. References are followed by subtag string regardless of his
+        type, so some items could be relinked without need, but never the opposite."""
+        referrers: Dict[str, List[Tuple[BCP47Type, str]]] = {}
+        for bcp47_type, type_items in items.items():
+            for key, data_dict in type_items.items():
+                for subtag in self._get_referenced_subtags(data_dict, bcp47_type):
+                    referrers.setdefault(subtag, []).append((bcp47_type, key))
+
+        visited: Set[Tuple[BCP47Type, str]] = {(bcp47_type, key) for changed_items in (added, modified)
+                                               for bcp47_type, type_items in changed_items.items()
+                                               for key in type_items}
+        pending = [key for changed_items in (added, removed, modified)
+                   for type_items in changed_items.values() for key in type_items]
+        relinked_keys: Set[Tuple[BCP47Type, str]] = set()
+        while pending:
+            for referrer in referrers.get(pending.pop(), ()):
+                if referrer not in visited:
+                    visited.add(referrer)
+                    relinked_keys.add(referrer)
+                    pending.append(referrer[1])
+
+        relinked: RegistryDiffItems = {}
+        for bcp47_type, type_items in items.items():
+            if type_relinked := {key: data_dict for key, data_dict in type_items.items()
+                                 if (bcp47_type, key) in relinked_keys}:
+                relinked[bcp47_type] = type_relinked
+        return relinked
+
+    def _get_snapshot(self) -> Dict[str, Any]:
+        """Return all loaded data in a dict that could be stored as a snapshot. All data is included in the same dict
+        to keep the references between objects when it is restored."""
+        snapshot: Dict[str, Any] = {self._SNAPSHOT_LANGUAGES_SCOPES_KEY: self._languages_scopes}
+        for bcp47_type, tags_or_subtags in self._tags_or_subtags.items():
+            snapshot[bcp47_type.value] = tags_or_subtags
+        return snapshot
+
+    def _load_snapshot(self, snapshot: Dict[str, Any]) -> bool:
+        """Load data from a snapshot that is generated by :func:`repository.Repository._get_snapshot`. The snapshot is
+        checked before anything is loaded, and False is returned if it is incomplete, so the caller could treat it as a
+        cache miss."""
         try:
-            return datetime.fromisoformat(text[11:-1])
-        except ValueError as e:
-            raise InvalidRegistryFileDate(text) from e
+            languages_scopes = list(snapshot[self._SNAPSHOT_LANGUAGES_SCOPES_KEY])
+            tags_or_subtags = {bcp47_type: list(snapshot[bcp47_type.value]) for bcp47_type in self._tags_or_subtags}
+        except (KeyError, TypeError):
+            return False
+        self._languages_scopes.extend(languages_scopes)
+        for bcp47_type, bcp47_type_tags_or_subtags in tags_or_subtags.items():
+            for tag_or_subtag in bcp47_type_tags_or_subtags:
+                self._add_tag_or_subtag(bcp47_type, tag_or_subtag)
+        return True
 
-    def _parse_item(self, item: str, updated_at: datetime) -> Dict[str, Any]:
-        """Parse an item from the "Language Subtag registry". It gets the field value pairs and return a dict. Also
-        include the current version of "Language Subtag registry" (updated_at).
+    def _load_languages_scopes(self):
+        """Function that create :class:`schemas.language_scope.LanguageScope` instances for each value of
+        :class:`enums.language_scope.LanguageScopeEnum` enum."""
+        for language_scope in LanguageScopeEnum:
+            self._languages_scopes.append(LanguageScope(scope=language_scope))
 
-        :raise exceptions.unexpected_bcp47_no_previous_key_error.UnexpectedBCP47NoPreviousKeyError:
-        :raise exceptions.unexpected_previous_data_type_error.UnexpectedBCP47PreviousDataTypeError:
-        :raise exceptions.unexpected_bcp47_key_error.UnexpectedBCP47KeyError:
-        :raise exceptions.unexpected_bcp47_duplicated_key.UnexpectedBCP47DuplicatedKeyError:
-        :raise exceptions.unexpected_bcp47_value_error.UnexpectedBCP47ValueError:
-        :raise exceptions.unexpected_bcp47_key_type_error.UnexpectedBCP47KeyTypeError:"""
-        data = {'updated_at': updated_at}
-        previous_key: Optional[str] = None
-
-        for value in item.strip().split("\n"):
-            if value.startswith(' '):
-                data = self._append_data(previous_key, data, value)
-            else:
-                add_new_data_return = self._add_new_data(data, value)
-                data = add_new_data_return.data_dict
-                previous_key = add_new_data_return.previous_key
-
-        return data
-
-    @staticmethod
-    def _append_data(previous_key: Optional[str], data: Dict[str, Any], value: str) -> Dict[str, Any]:
-        """Case of :func:bcp47_repository.Repository._parse_item when a new line start with space. It occurs when the
-        data surpasses the max column size and requires to break the line. If previous key is a list it should be
-        concatenated with the last value of the list. If is string it is only required to be concatenated with the
-        value of previous key.
+    def _load_bcp47(self):
+        """Main function that is responsible to parse a "language subtag registry" file and load data into the
+        instance.
 
+        :raise exceptions.unexpected_bcp47_missing_file_date_error.UnexpectedBCP47MissingFileDateError:
+        :raise exceptions.invalid.invalid_registry_file_date_error.InvalidRegistryFileDate:
         :raise exceptions.unexpected_bcp47_no_previous_key_error.UnexpectedBCP47NoPreviousKeyError:
-
-        :raise exceptions.unexpected_bcp47_previous_data_type_error.UnexpectedBCP47PreviousDataTypeError:"""
-        if not previous_key:
-            raise UnexpectedBCP47NoPreviousKeyError()
-        previous_data_type = type(data[previous_key])
-        if previous_data_type == list:
-            data[previous_key][-1] += value[1:]
-        elif previous_data_type == str:
-            data[previous_key] += value[1:]
-        else:
-            raise UnexpectedBCP47PreviousDataTypeError(previous_data_type)
-        return data
-
-    def _add_new_data(self, data_dict: Dict[str, Any], value: str) -> _AddNewDataReturn:
-        """Case of :func:bcp47_repository.Repository._parse_item when it is required to parse a new key value.
-
+        :raise exceptions.unexpected_bcp47_previous_data_type_error.UnexpectedBCP47PreviousDataTypeError:
         :raise exceptions.unexpected_bcp47_key_error.UnexpectedBCP47KeyError:
         :raise exceptions.unexpected_bcp47_duplicated_key.UnexpectedBCP47DuplicatedKeyError:
         :raise exceptions.unexpected_bcp47_value_error.UnexpectedBCP47ValueError:
         :raise exceptions.unexpected_bcp47_key_type_error.UnexpectedBCP47KeyTypeError:
-        """
-        key, value = value.split(self._KEY_VALUE_SEPARATOR, 1)
-        if not (value_type := self._BCP47_KEY_VALUE_TYPE_MAPPING.get(key)):
-            raise UnexpectedBCP47KeyError(key)
-
-        previous_key = value_type.internal_name
-
-        if data_dict.get(value_type.internal_name) is not None and value_type.value_type != list:
-            raise UnexpectedBCP47DuplicatedKeyError(key)
-
-        if value_type.value_type == list:
-            if data_dict_value := data_dict.get(value_type.internal_name):
-                data_dict_value.append(value)
-            else:
-                data_dict[value_type.internal_name] = [value]
-        elif value_type.value_type == datetime:
-            data_dict[value_type.internal_name] = datetime.fromisoformat(value)
-        elif value_type.value_type == str:
-            data_dict[value_type.internal_name] = value
-        elif value_type.value_type in (BCP47Type, LanguageScopeEnum):
-            try:
-                data_dict[value_type.internal_name] = value_type.value_type(value)
-            except ValueError as e:
-                raise UnexpectedBCP47ValueError(value, value_type.internal_name) from e
-        else:
-            raise UnexpectedBCP47KeyTypeError(value_type.value_type)
-        return _AddNewDataReturn(data_dict=data_dict, previous_key=previous_key)
-
-    def _add_item(self, data_dict: Dict[str, Any]):
-        """From a dict item check the type and convert to a dataclass and loads in this object class.
-
         :raise exceptions.missing_bcp_type_error.MissingBCPTypeError:
         :raise exceptions.unexpected_bcp47_type_error.UnexpectedBCP47TypeError:
         :raise exceptions.invalid.invalid_language_data_error.InvalidLanguageDataError:
@@ -301,131 +412,22 @@ class Repository(InMemoryBCP47RepositoryAbstract, Base):
         :raise exceptions.invalid.invalid_variant_data_error.InvalidVariantDataError
         :raise exceptions.invalid.invalid_grandfathered_data_error.InvalidGrandfatheredDataError:
         :raise exceptions.invalid.invalid_redundant_data_error.InvalidRedundantDataError:"""
-        try:
-            bcp47_type: BCP47Type = data_dict.pop('bcp_type')
-        except KeyError:
-            raise UnexpectedBCP47MissingTypeError() from KeyError
-
-        data_dict = self._replace_to_object(data_dict, bcp47_type)
-
-        if bcp47_type == BCP47Type.LANGUAGE:
-            self._load_language(data_dict)
-        elif bcp47_type == BCP47Type.EXTLANG:
-            self._load_ext_lang(data_dict)
-        elif bcp47_type == BCP47Type.SCRIPT:
-            self._load_script(data_dict)
-        elif bcp47_type == BCP47Type.REGION:
-            self._load_region(data_dict)
-        elif bcp47_type == BCP47Type.VARIANT:
-            self._load_variant(data_dict)
-        elif bcp47_type == BCP47Type.GRANDFATHERED:
-            self._load_grandfathered(data_dict)
-        elif bcp47_type == BCP47Type.REDUNDANT:
-            self._load_redundant(data_dict)
-        else:
-            raise UnexpectedBCP47TypeError(bcp47_type)
-
-    def _load_language(self, data_dict: Dict[str, Any]):
-        """Get dict data and loads to :class:`schemas.language.Language` dataclass. Finally append to the languages
-        list.
-
-        :raise exceptions.invalid.invalid_language_data_error.InvalidLanguageDataError:"""
-        try:
-            self._languages.append(Language(**data_dict))
-        except ValidationError as e:
-            raise InvalidLanguageDataError(data_dict) from e
-
-    def _load_ext_lang(self, data_dict: Dict[str, Any]):
-        """Get dict data and loads to :class:`schemas.ext_lang.ExtLang`. Finally append to the ext languages list.
-
-        :raise exceptions.invalid.invalid_ext_lang_error.InvalidExtLanguageDataError:"""
-        try:
-            self._ext_langs.append(ExtLang(**data_dict))
-        except ValidationError as e:
-            raise InvalidExtLanguageDataError(data_dict) from e
-
-    def _load_script(self, data_dict: Dict[str, Any]):
-        """Get dict data and loads to :class:`schemas.script.Script`. Finally append to the scripts list.
-
-        :raise exceptions.invalid.invalid_script_data_error.InvalidScriptDataError:"""
-        try:
-            self._scripts.append(Script(**data_dict))
-        except ValidationError as e:
-            raise InvalidScriptDataError(data_dict) from e
-
-    def _load_region(self, data_dict: Dict[str, Any]):
-        """Get dict data and loads to :class:`schemas.region.Region`. Finally append to the region list.
-
-        :raise exceptions.invalid.invalid_region_data_error.InvalidRegionDataError:"""
-        try:
-            self._regions.append(Region(**data_dict))
-        except ValidationError as e:
-            raise InvalidRegionDataError(data_dict) from e
-
-    def _load_variant(self, data_dict: Dict[str, Any]):
-        """Get dict data and loads to :class:`schemas.variant.Variant`. Finally append to the variants list.
-
-        :raise exceptions.invalid.invalid_variant_data_error.InvalidVariantDataError:"""
-        try:
-            self._variants.append(Variant(**data_dict))
-        except ValidationError as e:
-            raise InvalidVariantDataError(data_dict) from e
-
-    def _load_grandfathered(self, data_dict: Dict[str, Any]):
-        """Get dict data and loads to :class:`schemas.grandfathered.Grandfathered`. Finally append to the grandfathered
-        list.
-
-        :raise exceptions.invalid.invalid_grandfathered_data_error.InvalidGrandfatheredDataError:"""
-        try:
-            self._grandfathered.append(Grandfathered(**data_dict))
-        except ValidationError as e:
-            raise InvalidGrandfatheredDataError(data_dict) from e
-
-    def _load_redundant(self, data_dict: Dict[str, Any]):
-        """Get dict data and loads to :class:`schemas.redundant.Redundant`. Finally append to the redundant list.
-
-        :raise exceptions.invalid.invalid_redundant_data_error.InvalidRedundantDataError:"""
-        try:
-            self._redundant.append(Redundant(**data_dict))
-        except ValidationError as e:
-            raise InvalidRedundantDataError(data_dict) from e
-
-    def _replace_to_object(self, data_dict: Dict[str, Any], bcp47_type: BCP47Type) -> Dict[str, Any]:
-        """From dict data replace string values that should be references to objects.
-
-        :raise exceptions.not_found.tag_or_subtag_not_found_error.TagOrSubtagNotFoundError:
-        :raise exceptions.not_found.script_subtag_not_found_error.ScriptSubtagNotFoundError:
-        :raise exceptions.not_found.language_subtag_not_found_error.LanguageSubtagNotFoundError:
-        :raise exceptions.not_found.language_scope_not_found_error.LanguageScopeNotFoundError:
-        :raise exceptions.not_found.language_subtag_not_found_error.LanguageSubtagNotFoundError:"""
-        if preferred_value := data_dict.pop('preferred_value', None):
-            data_dict['preferred_value'] = self._tag_parser(preferred_value, case_sensitive=True)
-
-        if suppress_script := data_dict.pop('suppress_script', None):
-            data_dict['suppress_script'] = self.get_script_by_subtag(suppress_script, case_sensitive=True)
-
-        if macro_language := data_dict.pop('macro_language', None):
-            data_dict['macro_language'] = self.get_language_by_subtag(macro_language, case_sensitive=True)
-
-        if langauge_scope := data_dict.pop('scope', None):
-            data_dict['scope'] = self.get_language_scope_by_name(langauge_scope)
-
-        if prefix_s := data_dict.pop('prefix', None):
-            data_dict['prefix'] = self._parse_prefix(prefix_s)
-
-        if bcp47_type == BCP47Type.REDUNDANT:
-            data_dict['subtags'] = self._tag_parser(data_dict.pop('tag'), case_sensitive=True)
-
-        return data_dict
-
-    def _parse_prefix(
-            self,
-            prefix_list: List[str]) -> List[Dict[str, Union[Language, ExtLang, Script, Region, Variant, ExtLang]]]:
-        """Parse a list of string subtags to a dict of name of va
-        :raise exceptions.not_found.tag_or_subtag_not_found_error.TagOrSubtagNotFoundError:"""
-
-        prefix_f = []
-
-        for prefix in prefix_list:
-            prefix_f.append(self._tag_parser(prefix, True))
-        return prefix_f
+        symbol_table = _SymbolTable()
+        keys = [
+            self._register_item(symbol_table, data_dict)
+            for data_dict in self._read_items(self._language_subtag_registry_source)
+        ]
+
+        for bcp47_type, key in keys:
+            self._add_tag_or_subtag(bcp47_type, self._link_item(symbol_table, bcp47_type, key))
+
+    def _load_tags_or_subtags(self, bcp47_type: BCP47Type) -> List[TagsOrSubtagType]:
+        """Link all indexed items of a type in lazy mode. Objects of other types that are referenced are created too and
+        they are reused when their type is loaded. The symbol table is released once all types are loaded."""
+        tags_or_subtags = [
+            self._link_item(self._symbol_table, bcp47_type, key)
+            for key in self._symbol_table.items[bcp47_type]
+        ]
+        if self._unloaded_types == {bcp47_type}:
+            self._symbol_table = None
+        return tags_or_subtags
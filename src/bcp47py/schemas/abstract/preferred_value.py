@@ -2,7 +2,7 @@
 
 import abc
 from abc import ABC
-from typing import Annotated
+from typing import Annotated, Any
 
 from pydantic import BaseModel, ConfigDict
 
@@ -25,3 +25,20 @@ class PreferredValue(BaseModel, ABC):
     def tag(self) -> Annotated[str, TAG_FIELD_INFO]:
         """Returns preferred_value tag in string format. It will contain all subtags of the preferred value. Must
         return the same data that language-subtag-registry Preferred-Value field provides."""
+
+    @staticmethod
+    def format_tag(preferred_value: Any) -> str:
+        """Return a preferred value in string format from his subtag attributes, so it also works with records of
+        preferred values and with models created without validation. Subtags are sorted by the order of the subtag
+        types in a tag."""
+        subtags = []
+        for field_name in _SUBTAG_FIELDS:
+            value = getattr(preferred_value, field_name, None)
+            if isinstance(value, (list, tuple)):
+                subtags.extend(subtag.subtag for subtag in value)
+            elif value is not None:
+                subtags.append(value.subtag)
+        return '-'.join(subtags)
+
+
+_SUBTAG_FIELDS = ('language', 'extlang', 'script', 'region', 'variant')
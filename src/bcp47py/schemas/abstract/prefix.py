@@ -2,12 +2,14 @@ import abc
 from abc import ABC
 from typing import Annotated
 
-from pydantic import BaseModel, ConfigDict, Field
+from pydantic import ConfigDict, Field
+
+from schemas.mixin.cached_properties import CachedProperties
 
 _TAG_FIELD_INFO = Field(examples=['ar', 'zh-Latn'])
 
 
-class Prefix(ABC, BaseModel):
+class Prefix(ABC, CachedProperties):
     """The field 'Prefix' contains a valid language tag that is RECOMMENDED as one possible prefix to this record's
     subtag, perhaps with other subtags. Classes that inherits from this class must have attributes for each subtag that
     could be used.
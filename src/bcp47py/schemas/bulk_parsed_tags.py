@@ -0,0 +1,25 @@
+"""Module related with BulkParsedTags class."""
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict
+
+
+class BulkParsedTags(BaseModel):
+    """Result of :func:`bulk_tag_parser.BulkTagParser.parse`. All fields are NumPy arrays. Arrays of the tags are
+    parallel to the parsed array of tags:
+
+    - valid: bool mask of the tags that could be parsed.
+    - language_ids, script_ids and region_ids: dense IDs of the language, script and region of each tag, or 0 if the
+      tag is not valid or it does not have that subtag. The dense ID n is the subtag at the position n - 1 of the list
+      of his type in the repository.
+    - canonical_indices: position of the canonical form of each tag in canonical_tags, or -1 if the tag is not valid.
+
+    canonical_tags contains the distinct canonical forms sorted."""
+    valid: Any
+    language_ids: Any
+    script_ids: Any
+    region_ids: Any
+    canonical_indices: Any
+    canonical_tags: Any
+
+    model_config = ConfigDict(extra='forbid', frozen=True)
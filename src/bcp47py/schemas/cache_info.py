@@ -0,0 +1,13 @@
+"""Module related with CacheInfo class."""
+from pydantic import BaseModel, ConfigDict
+
+
+class CacheInfo(BaseModel):
+    """Statistics of a cache: number of hits, misses and evictions, the max size and the current size of the cache."""
+    hits: int
+    misses: int
+    evictions: int
+    max_size: int
+    current_size: int
+
+    model_config = ConfigDict(extra='forbid', frozen=True)
@@ -2,9 +2,11 @@
 import abc
 from abc import ABC
 from datetime import datetime
-from typing import List, Annotated
+from typing import Any, List, Annotated
 
-from pydantic import ConfigDict, BaseModel, Field
+from pydantic import ConfigDict, Field
+
+from schemas.mixin.cached_properties import CachedProperties
 
 _DESCRIPTION_FIELD_INFO = Field(
     title="description",
@@ -27,7 +29,7 @@ _UPDATED_AT_FIELD_INFO = Field(
 )
 
 
-class BaseType(BaseModel, ABC):
+class BaseType(CachedProperties, ABC):
     """Mixin that must be used by all BCP47 types. Only contains fields that are common between all BCP47 types."""
     description: Annotated[List[str], _DESCRIPTION_FIELD_INFO]
     added: Annotated[datetime, _ADDED_FIELD_INFO]
@@ -38,4 +40,16 @@ class BaseType(BaseModel, ABC):
     def tag_str(self) -> str:
         """Return the string tag. If only have a subtag return the subtag."""
 
+    def __eq__(self, other: Any) -> bool:
+        """Tags and subtags are equal if they are the same object or they have the same type and tag. Other fields are
+        not compared, the registry only have one tag or subtag for each type and tag."""
+        if self is other:
+            return True
+        if type(other) is not type(self):
+            return NotImplemented
+        return self.tag_str == other.tag_str
+
+    def __hash__(self) -> int:
+        return hash((type(self), self.tag_str))
+
     model_config = ConfigDict(extra='forbid')
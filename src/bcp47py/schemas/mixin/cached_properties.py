@@ -0,0 +1,35 @@
+"""Module that contains CachedProperties mixin."""
+import functools
+from typing import Any, Dict, Optional, Tuple
+
+from pydantic import BaseModel
+
+
+class CachedProperties(BaseModel):
+    """Mixin for models with :class:`functools.cached_property` values that are computed from their fields, like the
+    tag of a parsed tag. Cached values are stored in the __dict__ of the instance, so they are removed whenever a field
+    is assigned or the model is copied with updated fields, and they are computed again the next time that they are
+    requested. Changes inside nested models are not detected, the nested model must be assigned again."""
+
+    def __setattr__(self, name: str, value: Any):
+        super().__setattr__(name, value)
+        self._clear_cached_properties()
+
+    def model_copy(self, *, update: Optional[Dict[str, Any]] = None, deep: bool = False) -> 'CachedProperties':
+        copied = super().model_copy(update=update, deep=deep)
+        if update:
+            copied._clear_cached_properties()  # pylint: disable=protected-access
+        return copied
+
+    def _clear_cached_properties(self):
+        for name in _get_cached_property_names(type(self)):
+            self.__dict__.pop(name, None)
+
+
+@functools.lru_cache(maxsize=None)
+def _get_cached_property_names(model_type: type) -> Tuple[str, ...]:
+    """Return the names of the cached properties of a model type and his parents."""
+    return tuple({name
+                  for cls in model_type.__mro__
+                  for name, value in vars(cls).items()
+                  if isinstance(value, functools.cached_property)})
@@ -1,7 +1,4 @@
 """Module that contains Tag abstract class."""
-from abc import abstractmethod
-from typing import Annotated
-
 from pydantic import Field
 
 from schemas.mixin.base_type import BaseType
@@ -17,11 +14,9 @@ _TAG_FIELD_INFO = Field(
 
 class Tag(BaseType):
     """Mixin that must be used by tag types (only :class:`from exceptions.invalid.mixin.invalid_data_error import InvalidDataErrorschemas.redundant.Redundant` and
-    :class:`from exceptions.invalid.mixin.invalid_data_error import InvalidDataErrorschemas.grandfathered.Grandfathered` types)."""
-
-    @property
-    def tag(self) -> Annotated[str, _TAG_FIELD_INFO]:
-        raise NotImplementedError
+    :class:`from exceptions.invalid.mixin.invalid_data_error import InvalidDataErrorschemas.grandfathered.Grandfathered` types).
+    Classes that inherits from this class must provide a "tag" field or property. It is not declared here due to a
+    property in this class would shadow the "tag" field of subclasses."""
 
     @property
     def tag_str(self) -> str:
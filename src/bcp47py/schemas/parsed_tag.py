@@ -1,20 +1,23 @@
 """Module related with Subtags wrapper class."""
-from typing import Optional, List
+from functools import cached_property
+from typing import Any, Optional, List
 
-from pydantic import ConfigDict, BaseModel
+from pydantic import ConfigDict, model_validator
 
 from schemas.ext_lang import ExtLang
 from schemas.grandfathered import Grandfathered
 from schemas.language import Language
+from schemas.mixin.cached_properties import CachedProperties
 from schemas.redundant import Redundant
 from schemas.region import Region
 from schemas.script import Script
 from schemas.variant import Variant
 
 
-class ParsedTag(BaseModel):
-    """Helper that have attributes for each subtag of a Tag."""
-    language: Language
+class ParsedTag(CachedProperties):
+    """Helper that have attributes for each subtag of a Tag. Grandfathered tags are not decomposed in subtags, so only
+    grandfathered is set. The rest of tags must have a language."""
+    language: Optional[Language] = None
     ext_lang: List[ExtLang] = []
     script: Optional[Script] = None
     region: Optional[Region] = None
@@ -22,17 +25,30 @@ class ParsedTag(BaseModel):
     grandfathered: Optional[Grandfathered] = None
     redundant: Optional[Redundant] = None
 
-    @property
+    @model_validator(mode='after')
+    def language_validator(self) -> 'ParsedTag':
+        """Validate that language is set in all cases except grandfathered tags."""
+        if self.language is None and self.grandfathered is None:
+            raise ValueError('Language is not set and the tag is not grandfathered')
+        return self
+
+    @cached_property
     def tag(self) -> str:
-        """Return a tag in string format."""
+        """Return a tag in string format. It is computed the first time that it is requested."""
+        if self.grandfathered:
+            return self.grandfathered.tag
         return '-'.join((subtag.subtag
                          for subtag in (self.language, *self.ext_lang, self.script, self.region, *self.variant)
                          if subtag))
 
     def __hash__(self):
-        return hash(str(self.tag))
+        return hash(self.tag)
 
-    def __eq__(self, other: 'ParsedTag'):
+    def __eq__(self, other: Any):
+        if self is other:
+            return True
+        if not isinstance(other, ParsedTag):
+            return NotImplemented
         return self.tag == other.tag
 
     model_config = ConfigDict(extra='forbid')
@@ -1,13 +1,15 @@
 """Module related with Redundant classes."""
 from datetime import datetime
+from functools import cached_property
 from typing import Optional, Annotated, List
 
-from pydantic import BaseModel, ConfigDict
+from pydantic import ConfigDict
 
 from schemas.abstract.preferred_value import PreferredValue
 from schemas.ext_lang import ExtLang
 from schemas.field_info import TAG_FIELD_INFO
 from schemas.language import Language
+from schemas.mixin.cached_properties import CachedProperties
 from schemas.mixin.preferred_value_validator import PreferredValueValidator
 from schemas.mixin.tag import Tag, _TAG_FIELD_INFO
 from schemas.region import Region
@@ -15,7 +17,7 @@ from schemas.script import Script
 from schemas.variant import Variant
 
 
-class RedundantSubtags(BaseModel):
+class RedundantSubtags(CachedProperties):
     language: Language
     extlang: List[ExtLang] = []
     script: Optional[Script] = None
@@ -24,9 +26,9 @@ class RedundantSubtags(BaseModel):
 
     model_config = ConfigDict(extra='forbid')
 
-    @property
+    @cached_property
     def tag(self) -> str:
-        """Return a tag in string format."""
+        """Return a tag in string format. It is computed the first time that it is requested."""
         return '-'.join((subtag.subtag
                          for subtag in (self.language, *self.extlang, self.script, self.region, *self.variant)
                          if subtag))
@@ -54,6 +56,6 @@ class Redundant(Tag, PreferredValueValidator):
     deprecated: Optional[datetime] = None
     subtags: RedundantSubtags
 
-    @property
+    @cached_property
     def tag(self) -> Annotated[str, _TAG_FIELD_INFO]:
         return self.subtags.tag
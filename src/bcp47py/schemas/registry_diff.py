@@ -0,0 +1,27 @@
+"""Module related with RegistryDiff class."""
+from pydantic import BaseModel, ConfigDict
+
+from type_aliases import RegistryDiffItems
+
+
+class RegistryDiff(BaseModel):
+    """Differences between two versions of a "Language subtag registry", returned by
+    :func:`repository.Repository.diff`. Items are keyed by type and subtag or tag, and only types with items are
+    included:
+
+    - added: items of the new version that are not in the old version.
+    - removed: items of the old version that are not in the new version.
+    - modified: items of the new version whose data is different in the old version. The 'File-Date' of the registry is
+      not compared.
+    - relinked: items of the new version that are not modified but that reference, directly or through other items, a
+      subtag that is added, removed or modified. Their objects are created again when the diff is applied, so they
+      reference the new objects."""
+    added: RegistryDiffItems
+    removed: RegistryDiffItems
+    modified: RegistryDiffItems
+    relinked: RegistryDiffItems
+
+    model_config = ConfigDict(extra='forbid', frozen=True)
+
+    def __bool__(self) -> bool:
+        return bool(self.added or self.removed or self.modified)
@@ -0,0 +1,31 @@
+"""Module related with TagCodeLayout class."""
+from typing import Optional, Tuple
+
+from pydantic import BaseModel, ConfigDict
+
+from enums.bcp47_type import BCP47Type
+from schemas.tag_code_slot import TagCodeSlot
+
+
+class TagCodeLayout(BaseModel):
+    """Layout of the tag codes returned by
+    :func:`interface.bcp47_repository.bcp47_repository_interface.BCP47RepositoryInterface.encode_tag`: the slots that
+    contain the dense IDs of the subtags, from the highest to the lowest bits, and the flags of the codes of
+    grandfathered tags and of the overflow table. The slots of these codes do not contain dense IDs of subtags."""
+    slots: Tuple[TagCodeSlot, ...]
+    grandfathered_flag: int
+    overflow_flag: int
+
+    model_config = ConfigDict(extra='forbid', frozen=True)
+
+    def get_slot(self, bcp47_type: BCP47Type, index: int = 0) -> Optional[TagCodeSlot]:
+        """Return the slot of a subtag type and index or None if the tag codes do not have that slot."""
+        return next((slot for slot in self.slots if slot.bcp47_type == bcp47_type and slot.index == index), None)
+
+    def is_grandfathered(self, code: int) -> bool:
+        """Return if a tag code is the code of a grandfathered tag."""
+        return bool(code & self.grandfathered_flag)
+
+    def is_overflow(self, code: int) -> bool:
+        """Return if a tag code is a code of the overflow table."""
+        return bool(code & self.overflow_flag)
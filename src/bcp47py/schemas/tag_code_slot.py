@@ -0,0 +1,22 @@
+"""Module related with TagCodeSlot class."""
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict
+
+from enums.bcp47_type import BCP47Type
+
+
+class TagCodeSlot(BaseModel):
+    """Bits of a tag code that contain the dense ID of a subtag: the subtag type, the index of the subtag in his type,
+    the position of the lowest bit and the number of bits."""
+    bcp47_type: BCP47Type
+    index: int
+    shift: int
+    width: int
+
+    model_config = ConfigDict(extra='forbid', frozen=True)
+
+    def get_dense_id(self, code: Any) -> Any:
+        """Return the dense ID stored in this slot of a tag code, or 0 if the tag has no subtag for this slot. The code
+        could be an integer or a NumPy array of integers, so the dense IDs of many codes are extracted at once."""
+        return code >> self.shift & (1 << self.width) - 1
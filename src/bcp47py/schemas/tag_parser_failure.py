@@ -0,0 +1,12 @@
+"""Module related with TagParserFailure class."""
+from pydantic import BaseModel, ConfigDict
+
+
+class TagParserFailure(BaseModel):
+    """Structured result of a tag that could not be parsed. It is returned instead of raising an exception by batch
+    methods. It contains the tag, the name of the exception that was raised by the tag parser and his message."""
+    tag: str
+    error: str
+    message: str
+
+    model_config = ConfigDict(extra='forbid', frozen=True)
@@ -1,5 +1,6 @@
 """Module related with Variant classes."""
 from datetime import datetime
+from functools import cached_property
 from typing import List, Optional, Annotated
 
 from schemas.abstract.preferred_value import PreferredValue
@@ -36,7 +37,7 @@ class VariantPrefix(ExtLangPrefix):
     region: Optional[Region] = None
     variant: List['Variant'] = []
 
-    @property
+    @cached_property
     def tag(self) -> str:
         return '-'.join(subtag.subtag
                         for subtag in (self.language, *self.extlang, self.script, self.region, *self.variant) if subtag)
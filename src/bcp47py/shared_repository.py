@@ -0,0 +1,541 @@
+"""Repository that provides data from BCP47 stored in a flat read-only buffer that could be shared between processes."""
+import bisect
+import dataclasses
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import threading
+from datetime import datetime
+from multiprocessing.shared_memory import SharedMemory
+from typing import Optional, Dict, Any, List, Tuple, Iterator, Sequence, Union, FrozenSet
+
+from abstract.bcp47_repository.bcp47_repository_abstract import BCP47RepositoryAbstract, _CanonicalizationTables, \
+    _SubtagCandidate, _SUBTAG_TYPES, _WholeTag, _WHOLE_TAG_TYPES, _ReverseIndexes, _LanguageIndexes, \
+    _VariantPrefixes, _DenseIds
+from cache.lru_cache import LRUCache
+from enums.bcp47_type import BCP47Type
+from enums.language_scope import LanguageScopeEnum
+from exceptions.invalid.invalid_shared_registry_error import InvalidSharedRegistryError
+from exceptions.not_found.language_scope_not_found_error import LanguageScopeNotFoundError
+from mixin.language_subtag_registry_mixin import LanguageSubtagRegistryMixin, _SymbolTable
+from schemas.ext_lang import ExtLang
+from schemas.grandfathered import Grandfathered
+from schemas.language import Language
+from schemas.language_scope import LanguageScope
+from schemas.redundant import Redundant
+from schemas.region import Region
+from schemas.script import Script
+from schemas.variant import Variant
+from type_aliases import TagsOrSubtagType
+
+BufferType = Union[bytes, bytearray, memoryview, mmap.mmap]
+
+
+class SharedRepository(BCP47RepositoryAbstract, LanguageSubtagRegistryMixin):
+    """Repository that reads the data of a "Language subtag registry" from a flat read-only buffer. The buffer is
+    generated once by :func:`shared_repository.SharedRepository.encode` and could be placed in a
+    :class:`multiprocessing.shared_memory.SharedMemory` block or in a file that is mapped in memory, so all processes
+    that attach to it share the same physical pages instead of loading their own copy of the registry.
+
+    The buffer contains, for each type, the items of the registry in file order and a sorted index of fixed size entries
+    that is searched with a binary search. Objects are only created when they are requested and they are kept by the
+    instance, so each process only holds the objects that it uses.
+
+    Check :class:`abstract.bcp47_repository.bcp47_repository_abstract.BCP47RepositoryAbstract` for more information
+    about the tag parser cache."""
+    _SUBTAG_CANDIDATES_CACHE_SIZE = 4096
+
+    def __init__(self, buffer: BufferType, tag_parser_cache_size: Optional[int] = None):
+        """Attach to a buffer generated by :func:`shared_repository.SharedRepository.encode`. The buffer is not
+        copied, so it must be kept alive and unchanged while the instance is used.
+
+        :raise exceptions.invalid.invalid_shared_registry_error.InvalidSharedRegistryError:"""
+        super().__init__(tag_parser_cache_size=tag_parser_cache_size)
+        self._registry_buffer = _SharedRegistryBuffer.attach(
+            buffer,
+            frozenset(value_type.internal_name
+                      for value_type in self._BCP47_KEY_VALUE_TYPE_MAPPING.values()
+                      if value_type.value_type == datetime))
+        self._symbol_table = _SymbolTable(items={
+            bcp47_type: _SharedItems(self._registry_buffer, bcp47_type)
+            for bcp47_type in BCP47Type
+        })
+        self._languages_scopes = [LanguageScope(scope=language_scope) for language_scope in LanguageScopeEnum]
+        self._canonicalization_tables = _CanonicalizationTables(
+            **self._registry_buffer.directory[_SharedRegistryBuffer.CANONICALIZATION_TABLES_KEY])
+        self._referrers: Dict[Tuple[str, str], Tuple[TagsOrSubtagType, ...]] = {}
+        self._language_indexes: Optional[_LanguageIndexes] = None
+        self._variant_prefixes: Dict[str, Optional[_VariantPrefixes]] = {}
+        self._language_keys: List[str] = []
+        self._dense_ids: Dict[BCP47Type, _DenseIds] = {}
+        self._tags_or_subtags: Dict[BCP47Type, List[TagsOrSubtagType]] = {}
+        self._subtag_candidates_cache: LRUCache[str, Tuple[_SubtagCandidate, ...]] = LRUCache(
+            self._SUBTAG_CANDIDATES_CACHE_SIZE)
+        self._lock = threading.RLock()
+        self._shared_memory: Optional[SharedMemory] = None
+        self._mmap: Optional[mmap.mmap] = None
+
+    @classmethod
+    def encode(cls, language_subtag_registry_file_path: Optional[str] = None) -> bytes:
+        """Parse a "Language subtag registry" and return the flat buffer that contains all his data.
+
+        :raise exceptions.unexpected_bcp47_missing_file_date_error.UnexpectedBCP47MissingFileDateError:
+        :raise exceptions.invalid.invalid_registry_file_date_error.InvalidRegistryFileDate:
+        :raise exceptions.unexpected_bcp47_missing_type_error.UnexpectedBCP47MissingTypeError:
+        :raise exceptions.invalid.invalid_language_data_error.InvalidLanguageDataError:"""
+        return _SharedRegistryEncoder().encode(language_subtag_registry_file_path
+                                               or cls._LANGUAGE_SUBTAG_REGISTRY_FILE_PATH)
+
+    @classmethod
+    def create_shared_memory(cls,
+                             language_subtag_registry_file_path: Optional[str] = None,
+                             name: Optional[str] = None) -> SharedMemory:
+        """Encode a "Language subtag registry" in a new shared memory block. The caller owns the block: it must call
+        close and unlink when the block is not needed anymore."""
+        buffer = cls.encode(language_subtag_registry_file_path)
+        shared_memory = SharedMemory(name=name, create=True, size=len(buffer))
+        shared_memory.buf[:len(buffer)] = buffer
+        return shared_memory
+
+    @classmethod
+    def dump(cls, file_path: str, language_subtag_registry_file_path: Optional[str] = None):
+        """Encode a "Language subtag registry" in a file. The buffer is written to a temporary file that is renamed at
+        the end, so processes never map a half-written file."""
+        buffer = cls.encode(language_subtag_registry_file_path)
+        file_descriptor, tmp_file_path = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(file_path)),
+                                                          suffix='.tmp')
+        try:
+            with os.fdopen(file_descriptor, 'wb') as f:
+                f.write(buffer)
+            os.replace(tmp_file_path, file_path)
+        except BaseException:
+            os.remove(tmp_file_path)
+            raise
+
+    @classmethod
+    def from_shared_memory(cls, name: str, tag_parser_cache_size: Optional[int] = None) -> 'SharedRepository':
+        """Attach to a shared memory block created by :func:`shared_repository.SharedRepository.create_shared_memory`.
+
+        Before Python 3.13, processes that are not started by :mod:`multiprocessing` from the creator register the
+        block in their own resource tracker, which unlinks it when they exit. Already attached processes are not
+        affected, but the creator should attach new processes by file instead in that case.
+
+        :raise exceptions.invalid.invalid_shared_registry_error.InvalidSharedRegistryError:"""
+        if sys.version_info >= (3, 13):
+            shared_memory = SharedMemory(name=name, track=False)  # pylint: disable=unexpected-keyword-arg
+        else:
+            shared_memory = SharedMemory(name=name)
+        try:
+            repository = cls(shared_memory.buf, tag_parser_cache_size=tag_parser_cache_size)
+        except BaseException:
+            shared_memory.close()
+            raise
+        repository._shared_memory = shared_memory  # pylint: disable=protected-access
+        return repository
+
+    @classmethod
+    def from_file(cls, file_path: str, tag_parser_cache_size: Optional[int] = None) -> 'SharedRepository':
+        """Map in memory a file created by :func:`shared_repository.SharedRepository.dump` and attach to it.
+
+        :raise exceptions.invalid.invalid_shared_registry_error.InvalidSharedRegistryError:"""
+        with open(file_path, 'rb') as f:
+            mapped_file = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        try:
+            repository = cls(mapped_file, tag_parser_cache_size=tag_parser_cache_size)
+        except BaseException:
+            mapped_file.close()
+            raise
+        repository._mmap = mapped_file  # pylint: disable=protected-access
+        return repository
+
+    def close(self):
+        """Detach from the buffer. Objects that are already created could still be used, but the repository could not
+        be used anymore."""
+        self._registry_buffer.release()
+        if self._shared_memory:
+            self._shared_memory.close()
+        if self._mmap:
+            self._mmap.close()
+
+    def __enter__(self) -> 'SharedRepository':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    @property
+    def languages(self) -> List[Language]:
+        return self._get_tags_or_subtags(BCP47Type.LANGUAGE)
+
+    @property
+    def languages_scopes(self) -> List[LanguageScope]:
+        return self._languages_scopes
+
+    @property
+    def ext_langs(self) -> List[ExtLang]:
+        return self._get_tags_or_subtags(BCP47Type.EXTLANG)
+
+    @property
+    def scripts(self) -> List[Script]:
+        return self._get_tags_or_subtags(BCP47Type.SCRIPT)
+
+    @property
+    def regions(self) -> List[Region]:
+        return self._get_tags_or_subtags(BCP47Type.REGION)
+
+    @property
+    def variants(self) -> List[Variant]:
+        return self._get_tags_or_subtags(BCP47Type.VARIANT)
+
+    @property
+    def grandfathered(self) -> List[Grandfathered]:
+        return self._get_tags_or_subtags(BCP47Type.GRANDFATHERED)
+
+    @property
+    def redundant(self) -> List[Redundant]:
+        return self._get_tags_or_subtags(BCP47Type.REDUNDANT)
+
+    def _get_tags_or_subtags(self, bcp47_type: BCP47Type) -> List[TagsOrSubtagType]:
+        """Return all objects of a type in the order of the registry. All of them are created the first time and the
+        list is kept, so the items of the buffer are only read once."""
+        if (tags_or_subtags := self._tags_or_subtags.get(bcp47_type)) is not None:
+            return tags_or_subtags
+        with self._lock:
+            if (tags_or_subtags := self._tags_or_subtags.get(bcp47_type)) is None:
+                tags_or_subtags = [self._get_object(bcp47_type, key)
+                                   for key in self._registry_buffer.iter_keys(bcp47_type)]
+                self._tags_or_subtags[bcp47_type] = tags_or_subtags
+        return tags_or_subtags
+
+    def _get_object(self, bcp47_type: BCP47Type, key: str) -> TagsOrSubtagType:
+        """Return the object of an item of the buffer. The object and the objects that it references are created the
+        first time."""
+        if tag_or_subtag := self._symbol_table.objects[bcp47_type].get(key):
+            return tag_or_subtag
+        with self._lock:
+            return self._link_item(self._symbol_table, bcp47_type, key)
+
+    def _find_tag_or_subtag(self, bcp47_type: BCP47Type, tag_str: str,
+                            case_sensitive: bool) -> Optional[TagsOrSubtagType]:
+        if (key := self._registry_buffer.find(bcp47_type, tag_str, case_sensitive)) is None:
+            return None
+        return self._get_object(bcp47_type, key)
+
+    def _get_subtag_candidates(self, subtag: str) -> Sequence[_SubtagCandidate]:
+        if (candidates := self._subtag_candidates_cache.get(subtag)) is not None:
+            return candidates
+        candidates = tuple(
+            _SubtagCandidate(subtag_type, tag_or_subtag)
+            for subtag_type in sorted(_SUBTAG_TYPES.values(), key=lambda subtag_type: subtag_type.position)
+            if (tag_or_subtag := self._find_tag_or_subtag(subtag_type.bcp47_type, subtag, False)) is not None)
+        self._subtag_candidates_cache.put(subtag, candidates)
+        return candidates
+
+    def _find_whole_tag(self, tag: str) -> Optional[_WholeTag]:
+        for bcp47_type in _WHOLE_TAG_TYPES:
+            if (tag_or_subtag := self._find_tag_or_subtag(bcp47_type, tag, False)) is not None:
+                return _WholeTag(bcp47_type, tag_or_subtag)
+        return None
+
+    def _find_referrers(self, reverse_index: str, tag_str: str) -> Tuple[TagsOrSubtagType, ...]:
+        if (referrers := self._referrers.get((reverse_index, tag_str))) is not None:
+            return referrers
+        reverse_indexes = self._registry_buffer.directory[_SharedRegistryBuffer.REVERSE_INDEXES_KEY]
+        if not (keys := reverse_indexes[reverse_index].get(tag_str)):
+            return ()
+        referrers = tuple(self._get_object(BCP47Type(bcp47_type), key) for bcp47_type, key in keys)
+        self._referrers[(reverse_index, tag_str)] = referrers
+        return referrers
+
+    def _get_variant_prefixes(self, variant: Variant) -> Optional[_VariantPrefixes]:
+        if (key := variant.subtag.lower()) not in self._variant_prefixes:
+            self._variant_prefixes[key] = _VariantPrefixes.from_variant(variant)
+        return self._variant_prefixes[key]
+
+    def _get_language_indexes(self) -> _LanguageIndexes:
+        """Return the secondary indexes of the languages. They are built from the items of the buffer the first time,
+        without creating the languages."""
+        if self._language_indexes is not None:
+            return self._language_indexes
+        with self._lock:
+            if self._language_indexes is None:
+                language_indexes = _LanguageIndexes()
+                for data_dict in self._registry_buffer.iter_records(BCP47Type.LANGUAGE):
+                    scope = data_dict.get('scope')
+                    language_indexes.add(LanguageScopeEnum(scope) if scope else None,
+                                         data_dict.get('deprecated') is not None, data_dict['added'])
+                    self._language_keys.append(_SharedRegistryBuffer.get_key(data_dict))
+                self._language_indexes = language_indexes
+        return self._language_indexes
+
+    def _get_language_by_position(self, position: int) -> Language:
+        return self._get_object(BCP47Type.LANGUAGE, self._language_keys[position])
+
+    def _get_dense_ids(self, bcp47_type: BCP47Type) -> _DenseIds:
+        """Return the dense IDs of a type. They are assigned to the keys of the buffer the first time, without creating
+        the objects."""
+        if (dense_ids := self._dense_ids.get(bcp47_type)) is not None:
+            return dense_ids
+        with self._lock:
+            if (dense_ids := self._dense_ids.get(bcp47_type)) is None:
+                dense_ids = _DenseIds()
+                for key in self._registry_buffer.iter_keys(bcp47_type):
+                    dense_ids.add(key)
+                self._dense_ids[bcp47_type] = dense_ids
+        return dense_ids
+
+    def _get_canonicalization_tables(self) -> _CanonicalizationTables:
+        return self._canonicalization_tables
+
+
+class _SharedRegistryEncoder(LanguageSubtagRegistryMixin):
+    """Helper class that parses a "Language subtag registry" once and generates the buffer of
+    :func:`shared_repository.SharedRepository.encode`. Items are stored in the buffer as they are parsed, and copies of
+    them are linked and validated to build the canonicalization tables and the reverse indexes."""
+
+    def __init__(self):
+        self._languages_scopes = {language_scope.value: LanguageScope(scope=language_scope)
+                                  for language_scope in LanguageScopeEnum}
+
+    def get_language_scope_by_name(self, name: str) -> LanguageScope:
+        """Return the language scope of a name.
+
+        :raise exceptions.not_found.language_scope_not_found_error.LanguageScopeNotFoundError:"""
+        try:
+            return self._languages_scopes[name]
+        except KeyError as e:
+            raise LanguageScopeNotFoundError(name) from e
+
+    def encode(self, language_subtag_registry_file_path: str) -> bytes:
+        """Parse a "Language subtag registry" and return the flat buffer that contains all his data.
+
+        :raise exceptions.unexpected_bcp47_missing_file_date_error.UnexpectedBCP47MissingFileDateError:
+        :raise exceptions.invalid.invalid_registry_file_date_error.InvalidRegistryFileDate:
+        :raise exceptions.unexpected_bcp47_missing_type_error.UnexpectedBCP47MissingTypeError:
+        :raise exceptions.invalid.invalid_language_data_error.InvalidLanguageDataError:"""
+        data_dicts_by_type: Dict[BCP47Type, List[Dict[str, Any]]] = {bcp47_type: [] for bcp47_type in BCP47Type}
+        updated_at: Optional[datetime] = None
+        symbol_table = _SymbolTable()
+        keys = []
+        for data_dict in self._read_items(language_subtag_registry_file_path):
+            # Objects are linked from a copy, because linking replaces the references of the dict by objects.
+            keys.append(self._register_item(symbol_table, dict(data_dict)))
+            bcp47_type: BCP47Type = data_dict.pop('bcp_type')
+            updated_at = data_dict.pop('updated_at')
+            data_dicts_by_type[bcp47_type].append(data_dict)
+
+        canonicalization_tables = _CanonicalizationTables()
+        repository_reverse_indexes = _ReverseIndexes()
+        bcp47_types: Dict[int, str] = {}
+        for bcp47_type, key in keys:
+            tag_or_subtag = self._link_item(symbol_table, bcp47_type, key)
+            canonicalization_tables.add(bcp47_type, tag_or_subtag)
+            repository_reverse_indexes.add(bcp47_type, tag_or_subtag)
+            bcp47_types[id(tag_or_subtag)] = bcp47_type.value
+        reverse_indexes = {
+            field.name: {tag_str: [(bcp47_types[id(referrer)], referrer.tag_str) for referrer in referrers]
+                         for tag_str, referrers in getattr(repository_reverse_indexes, field.name).items()}
+            for field in dataclasses.fields(_ReverseIndexes)
+        }
+        return _SharedRegistryBuffer.encode(data_dicts_by_type, updated_at, dataclasses.asdict(canonicalization_tables),
+                                            reverse_indexes)
+
+
+@dataclasses.dataclass
+class _SharedRegistrySection:
+    """Dataclass that contains the offsets of the items and of the index of a type in the buffer."""
+    records_offset: int
+    index_offset: int
+    count: int
+
+
+@dataclasses.dataclass
+class _SharedRegistryBuffer:
+    """Dataclass that reads a shared registry buffer. The layout of the buffer is:
+
+    - Magic bytes and the length of the directory.
+    - Directory: JSON document with the 'File-Date', the key size, the sections of each type, the canonicalization
+      tables and the reverse indexes, that contain the type and the key of the referrers.
+    - For each type, the records in file order, each one is the length and the JSON document of an item, followed by
+      the index: entries with the lower case key, the key and the offset of the record, sorted by lower case key and
+      file order. Keys are padded with null bytes to the key size."""
+    MAGIC = b'BCP47SR\x02'
+    CANONICALIZATION_TABLES_KEY = 'canonicalization_tables'
+    REVERSE_INDEXES_KEY = 'reverse_indexes'
+    _HEADER = struct.Struct('<8sI')
+    _RECORD_LENGTH = struct.Struct('<I')
+
+    buffer: memoryview
+    directory: Dict[str, Any]
+    body_offset: int
+    sections: Dict[BCP47Type, _SharedRegistrySection]
+    key_size: int
+    entry: struct.Struct
+    updated_at: Optional[datetime]
+    datetime_fields: FrozenSet[str]
+
+    @classmethod
+    def encode(cls, data_dicts_by_type: Dict[BCP47Type, List[Dict[str, Any]]], updated_at: Optional[datetime],
+               canonicalization_tables: Dict[str, Any], reverse_indexes: Dict[str, Any]) -> bytes:
+        """Return the buffer that contains the items of each type, the canonicalization tables and the reverse
+        indexes."""
+        key_size = max((len(cls.get_key(data_dict).encode('ascii'))
+                        for data_dicts in data_dicts_by_type.values()
+                        for data_dict in data_dicts),
+                       default=1)
+        entry = struct.Struct(f'<{key_size}s{key_size}sI')
+        body = bytearray()
+        sections = {}
+        for bcp47_type, data_dicts in data_dicts_by_type.items():
+            records_offset = len(body)
+            entries = []
+            for position, data_dict in enumerate(data_dicts):
+                key = cls.get_key(data_dict)
+                entries.append((key.lower(), position, key, len(body)))
+                record = json.dumps(data_dict, default=datetime.isoformat, separators=(',', ':')).encode()
+                body += cls._RECORD_LENGTH.pack(len(record)) + record
+            index_offset = len(body)
+            for folded_key, _, key, record_offset in sorted(entries):
+                body += entry.pack(folded_key.encode('ascii'), key.encode('ascii'), record_offset)
+            sections[bcp47_type.value] = [records_offset, index_offset, len(entries)]
+
+        directory = json.dumps({
+            'updated_at': updated_at.isoformat() if updated_at else None,
+            'key_size': key_size,
+            'sections': sections,
+            cls.CANONICALIZATION_TABLES_KEY: canonicalization_tables,
+            cls.REVERSE_INDEXES_KEY: reverse_indexes,
+        }).encode()
+        return cls._HEADER.pack(cls.MAGIC, len(directory)) + directory + bytes(body)
+
+    @classmethod
+    def attach(cls, buffer: BufferType, datetime_fields: FrozenSet[str]) -> '_SharedRegistryBuffer':
+        """Read the directory of a buffer without copying the buffer. Fields of the items that are datetimes are
+        converted when the items are read.
+
+        :raise exceptions.invalid.invalid_shared_registry_error.InvalidSharedRegistryError:"""
+        buffer = memoryview(buffer)
+        try:
+            magic, directory_length = cls._HEADER.unpack_from(buffer)
+        except struct.error as e:
+            raise InvalidSharedRegistryError('buffer is too small') from e
+        if magic != cls.MAGIC:
+            raise InvalidSharedRegistryError('magic bytes do not match')
+        try:
+            directory = json.loads(bytes(buffer[cls._HEADER.size:cls._HEADER.size + directory_length]))
+            body_offset = cls._HEADER.size + directory_length
+            sections = {
+                bcp47_type: _SharedRegistrySection(*(body_offset + offset
+                                                     for offset in directory['sections'][bcp47_type.value][:2]),
+                                                   directory['sections'][bcp47_type.value][2])
+                for bcp47_type in BCP47Type
+            }
+            key_size = directory['key_size']
+            updated_at = datetime.fromisoformat(directory['updated_at']) if directory['updated_at'] else None
+        except (ValueError, KeyError, TypeError) as e:
+            raise InvalidSharedRegistryError('directory is corrupted') from e
+        return cls(buffer, directory, body_offset, sections, key_size, struct.Struct(f'<{key_size}s{key_size}sI'),
+                   updated_at, datetime_fields)
+
+    def release(self):
+        """Release the view of the buffer."""
+        self.buffer.release()
+
+    def find(self, bcp47_type: BCP47Type, tag_str: str, case_sensitive: bool) -> Optional[str]:
+        """Return the key of the first item of a type whose key is the tag or subtag string or None if it is not found.
+        The key is compared in lower case if it is not case-sensitive."""
+        if (entry := self._find_entry(bcp47_type, tag_str, case_sensitive)) is None:
+            return None
+        return entry[0]
+
+    def get_record(self, bcp47_type: BCP47Type, key: str) -> Dict[str, Any]:
+        """Return the first item of a type whose key is the key as a new dict.
+
+        :raise KeyError:"""
+        if (entry := self._find_entry(bcp47_type, key, True)) is None:
+            raise KeyError(key)
+        return self._read_record(entry[1])
+
+    def iter_keys(self, bcp47_type: BCP47Type) -> Iterator[str]:
+        """Iterate over the keys of all items of a type in file order."""
+        for data_dict in self.iter_records(bcp47_type):
+            yield self.get_key(data_dict)
+
+    def iter_records(self, bcp47_type: BCP47Type) -> Iterator[Dict[str, Any]]:
+        """Iterate over all items of a type in file order, each one as a new dict."""
+        section = self.sections[bcp47_type]
+        record_offset = section.records_offset
+        while record_offset < section.index_offset:
+            yield self._read_record(record_offset)
+            record_offset += self._RECORD_LENGTH.size + self._RECORD_LENGTH.unpack_from(self.buffer, record_offset)[0]
+
+    def get_folded_key(self, section: _SharedRegistrySection, index: int) -> bytes:
+        """Return the lower case key of an entry of the index of a section."""
+        return self.entry.unpack_from(self.buffer, section.index_offset + index * self.entry.size)[0]
+
+    def _find_entry(self, bcp47_type: BCP47Type, tag_str: str, case_sensitive: bool) -> Optional[Tuple[str, int]]:
+        """Return the key and the absolute offset of the record of the first entry that matches the tag or subtag
+        string. Entries with the same lower case key are sorted by file order."""
+        if not tag_str.isascii() or len(tag_str) > self.key_size:
+            return None
+        section = self.sections[bcp47_type]
+        folded_key = tag_str.lower().encode('ascii').ljust(self.key_size, b'\0')
+        index = bisect.bisect_left(_SharedRegistryIndexKeys(self, section), folded_key)
+        while index < section.count:
+            entry_folded_key, entry_key, record_offset = self.entry.unpack_from(
+                self.buffer, section.index_offset + index * self.entry.size)
+            if entry_folded_key != folded_key:
+                return None
+            key = entry_key.rstrip(b'\0').decode('ascii')
+            if not case_sensitive or key == tag_str:
+                return key, self.body_offset + record_offset
+            index += 1
+        return None
+
+    def _read_record(self, record_offset: int) -> Dict[str, Any]:
+        """Return the item stored at an absolute offset as a new dict."""
+        record_length = self._RECORD_LENGTH.unpack_from(self.buffer, record_offset)[0]
+        record_offset += self._RECORD_LENGTH.size
+        data_dict = json.loads(bytes(self.buffer[record_offset:record_offset + record_length]))
+        for field_name in self.datetime_fields.intersection(data_dict):
+            data_dict[field_name] = datetime.fromisoformat(data_dict[field_name])
+        if self.updated_at:
+            data_dict['updated_at'] = self.updated_at
+        return data_dict
+
+    @staticmethod
+    def get_key(data_dict: Dict[str, Any]) -> str:
+        """Return the key of an item, that is his tag or subtag."""
+        return data_dict.get('tag', data_dict.get('subtag', ''))
+
+
+@dataclasses.dataclass
+class _SharedRegistryIndexKeys(Sequence[bytes]):
+    """Dataclass that exposes the lower case keys of the index of a section as a sequence, so the index could be
+    searched with :func:`bisect.bisect_left`."""
+    registry_buffer: _SharedRegistryBuffer
+    section: _SharedRegistrySection
+
+    def __len__(self) -> int:
+        return self.section.count
+
+    def __getitem__(self, index):
+        return self.registry_buffer.get_folded_key(self.section, index)
+
+
+@dataclasses.dataclass
+class _SharedItems:
+    """Dataclass that exposes the items of a type of the buffer with the interface of the items of a symbol table, so
+    they are linked by :class:`mixin.language_subtag_registry_mixin.LanguageSubtagRegistryMixin`. Keys are compared
+    case-sensitively."""
+    registry_buffer: _SharedRegistryBuffer
+    bcp47_type: BCP47Type
+
+    def __contains__(self, key: str) -> bool:
+        return self.registry_buffer.find(self.bcp47_type, key, True) is not None
+
+    def __getitem__(self, key: str) -> Dict[str, Any]:
+        return self.registry_buffer.get_record(self.bcp47_type, key)
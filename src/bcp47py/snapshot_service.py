@@ -0,0 +1,103 @@
+"""Utility module that stores and restores snapshots of the fully loaded data of a language subtag registry."""
+import functools
+import hashlib
+import importlib.metadata
+import os
+import pickle
+import tempfile
+from typing import Optional, Dict, Any
+
+from mixin.base import Base
+
+
+class SnapshotService(Base):
+    """Utility class that stores and restores snapshots of the fully loaded data of a language subtag registry in a
+    directory. Each snapshot is identified by the 'File-Date' and the content hash of the language subtag registry, so a
+    snapshot is invalidated automatically when the language subtag registry changes. The key also contains the version
+    of the package and a hash of the source of the pickled classes, so snapshots written by other versions are not
+    restored into incompatible objects.
+
+    Snapshots are pickle files, only use directories that are not writable by untrusted users."""
+    _SNAPSHOT_FORMAT_VERSION = 2
+    _SNAPSHOT_EXTENSION = '.pickle'
+    _FILE_HEADER = b'File-Date: '
+
+    def __init__(self, snapshot_dir_path: str):
+        self._snapshot_dir_path = snapshot_dir_path
+
+    def get_key(self, language_subtag_registry_file_path: str) -> str:
+        """Return the key that identifies the snapshot of a language subtag registry. It contains the snapshot format
+        version, the package version, the schema hash, the 'File-Date' and the SHA-256 of the content of the language
+        subtag registry."""
+        digest = hashlib.sha256()
+        file_date = ''
+        with open(language_subtag_registry_file_path, 'rb') as f:
+            first_line = f.readline()
+            if first_line.startswith(self._FILE_HEADER):
+                file_date = first_line[len(self._FILE_HEADER):].strip().decode(self._LANGUAGE_SUBTAG_REGISTRY_ENCODING)
+            digest.update(first_line)
+            for chunk in iter(lambda: f.read(1 << 16), b''):
+                digest.update(chunk)
+        return f'v{self._SNAPSHOT_FORMAT_VERSION}-{_get_package_version()}-{_get_schema_hash()}-{file_date}-' \
+            f'{digest.hexdigest()}'
+
+    def load(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the data of the snapshot identified by the key. If the snapshot does not exist or it could not be
+        restored for any reason, None is returned."""
+        try:
+            with open(self._get_snapshot_file_path(key), 'rb') as f:
+                snapshot = pickle.load(f)
+        except Exception:  # pylint: disable=broad-exception-caught
+            return None
+
+        if not isinstance(snapshot, dict) or snapshot.get('key') != key or not isinstance(snapshot.get('data'), dict):
+            return None
+        return snapshot['data']
+
+    def dump(self, key: str, data: Dict[str, Any]):
+        """Store the data as the snapshot identified by the key. The snapshot is written to a temporary file that is
+        renamed at the end, so readers never see a half-written snapshot."""
+        os.makedirs(self._snapshot_dir_path, exist_ok=True)
+        file_descriptor, tmp_file_path = tempfile.mkstemp(dir=self._snapshot_dir_path,
+                                                          suffix=self._SNAPSHOT_EXTENSION + '.tmp')
+        try:
+            with os.fdopen(file_descriptor, 'wb') as f:
+                pickle.dump({'key': key, 'data': data}, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_file_path, self._get_snapshot_file_path(key))
+        except BaseException:
+            os.remove(tmp_file_path)
+            raise
+
+    def _get_snapshot_file_path(self, key: str) -> str:
+        return os.path.join(self._snapshot_dir_path, key + self._SNAPSHOT_EXTENSION)
+
+
+_SCHEMA_PACKAGES = ('enums', 'records', 'schemas')
+"""Packages of the classes that are pickled in a snapshot."""
+
+
+@functools.lru_cache(maxsize=None)
+def _get_package_version() -> str:
+    """Return the installed version of the package or 'dev' if it is not installed."""
+    try:
+        return importlib.metadata.version('bcp47py')
+    except importlib.metadata.PackageNotFoundError:
+        return 'dev'
+
+
+@functools.lru_cache(maxsize=None)
+def _get_schema_hash() -> str:
+    """Return a short SHA-256 of the source of the packages of the pickled classes. It changes whenever a model or a
+    record changes, even without a new version of the package."""
+    digest = hashlib.sha256()
+    base_dir_path = os.path.dirname(os.path.abspath(__file__))
+    for package in _SCHEMA_PACKAGES:
+        for dir_path, dir_names, file_names in os.walk(os.path.join(base_dir_path, package)):
+            dir_names.sort()
+            for file_name in sorted(file_names):
+                if file_name.endswith('.py'):
+                    file_path = os.path.join(dir_path, file_name)
+                    digest.update(os.path.relpath(file_path, base_dir_path).encode())
+                    with open(file_path, 'rb') as f:
+                        digest.update(f.read())
+    return digest.hexdigest()[:16]
@@ -1,6 +1,9 @@
 """Common aliases of from exceptions.invalid.mixin.invalid_data_error import InvalidDataError"""
 
-from typing import Union
+import os
+from typing import Any, Dict, List, Optional, Tuple, Union, IO
+
+from enums.bcp47_type import BCP47Type
 
 from schemas.ext_lang import ExtLang, ExtLangPreferredValue
 from schemas.grandfathered import Grandfathered, GrandfatheredPreferredValue
@@ -17,3 +20,6 @@ TagsOrSubtagType = Union[TagsType, SubtagType]
 MainDataObjects = Union[TagsOrSubtagType, LanguageScope]
 PreferredValuesType = Union[LanguagePreferredValue, RegionPreferredValue, ExtLangPreferredValue, VariantPreferredValue,
                             GrandfatheredPreferredValue, RedundantPreferredValue]
+LanguageSubtagRegistrySource = Union[str, 'os.PathLike[str]', IO[str], IO[bytes]]
+RegistryDiffItems = Dict[BCP47Type, Dict[str, Dict[str, Any]]]
+TagOrSubtagChanges = Dict[BCP47Type, List[Tuple[Optional[TagsOrSubtagType], Optional[TagsOrSubtagType]]]]
@@ -1,13 +1,487 @@
+import gc
+import time
+from datetime import datetime
+
 import pytest
 
+from enums.bcp47_type import BCP47Type
 from enums.language_scope import LanguageScopeEnum
+from exceptions.invalid.invalid_tag_code_error import InvalidTagCodeError
+from exceptions.invalid.invalid_variant_prefix_error import InvalidVariantPrefixError
+from exceptions.not_found.grandfathered_tag_not_found_error import GrandfatheredTagNotFoundError
+from exceptions.not_found.language_scope_not_found_error import LanguageScopeNotFoundError
+from exceptions.not_found.language_subtag_not_found_error import LanguageSubtagNotFoundError
+from exceptions.not_found.region_subtag_not_found_error import RegionSubtagNotFoundError
+from exceptions.not_found.tag_or_subtag_not_found_error import TagOrSubtagNotFoundError
 from interface.bcp47_repository.bcp47_repository_interface import BCP47RepositoryInterface
 from repository import Repository
 from schemas.ext_lang import ExtLang
 from schemas.grandfathered import Grandfathered
 from schemas.language import Language
 from schemas.language_scope import LanguageScope
+from schemas.parsed_tag import ParsedTag
 from schemas.redundant import Redundant
 from schemas.region import Region
 from schemas.script import Script
+from schemas.tag_parser_failure import TagParserFailure
 from schemas.variant import Variant
+
+
+def test_get_by_subtag_case_insensitive(repository: BCP47RepositoryInterface):
+    assert repository.get_language_by_subtag('EN') is repository.get_language_by_subtag('en')
+    assert repository.get_script_by_subtag('latn') is repository.get_script_by_subtag('Latn')
+    assert repository.get_region_by_subtag('gb') is repository.get_region_by_subtag('GB')
+    assert repository.get_variant_by_subtag('OXENDICT') is repository.get_variant_by_subtag('oxendict')
+    assert repository.get_redundant_by_tag('F1') is repository.get_redundant_by_tag('f1')
+
+
+def test_get_by_subtag_case_sensitive(repository: BCP47RepositoryInterface):
+    assert repository.get_region_by_subtag('GB', case_sensitive=True).subtag == 'GB'
+    with pytest.raises(RegionSubtagNotFoundError):
+        repository.get_region_by_subtag('gb', case_sensitive=True)
+
+
+def test_get_by_subtag_not_found(repository: BCP47RepositoryInterface):
+    with pytest.raises(LanguageSubtagNotFoundError) as exc_info:
+        repository.get_language_by_subtag('zz')
+    assert isinstance(exc_info.value.__cause__, TagOrSubtagNotFoundError)
+
+
+def test_get_grandfathered_by_tag():
+    repository = Repository()
+    assert repository.get_grandfathered_by_tag('I-KLINGON').tag == 'i-klingon'
+    with pytest.raises(GrandfatheredTagNotFoundError):
+        repository.get_grandfathered_by_tag('i-klingon-fake')
+
+
+def test_tag_parser(repository: BCP47RepositoryInterface):
+    parsed_tag = repository.tag_parser('en-en-f1-latn-gb-fake1-oxendict')
+    assert parsed_tag.language is repository.get_language_by_subtag('en')
+    assert parsed_tag.ext_lang == [repository.get_ext_lang_by_subtag('en'), repository.get_ext_lang_by_subtag('f1')]
+    assert parsed_tag.script is repository.get_script_by_subtag('Latn')
+    assert parsed_tag.region is repository.get_region_by_subtag('GB')
+    assert parsed_tag.variant == [
+        repository.get_variant_by_subtag('fake1'),
+        repository.get_variant_by_subtag('oxendict'),
+    ]
+    assert parsed_tag.redundant is None
+    assert parsed_tag.tag == 'en-en-f1-Latn-GB-fake1-oxendict'
+
+
+def test_tag_parser_redundant(repository: BCP47RepositoryInterface):
+    parsed_tag = repository.tag_parser('F1')
+    assert parsed_tag.language is repository.get_language_by_subtag('f1')
+    assert parsed_tag.redundant is repository.get_redundant_by_tag('f1')
+
+
+@pytest.mark.parametrize('tag', ['i-klingon', 'EN-gb-OED', 'zh-min-nan'])
+def test_tag_parser_grandfathered(tag: str):
+    repository = Repository()
+    parsed_tag = repository.tag_parser(tag)
+    assert parsed_tag.grandfathered is repository.get_grandfathered_by_tag(tag)
+    assert parsed_tag.language is None
+    assert parsed_tag.tag == parsed_tag.grandfathered.tag
+    assert repository.is_valid(tag)
+    assert repository.is_valid(parsed_tag.tag, case_sensitive=True)
+    assert not repository.is_valid(tag.upper(), case_sensitive=True)
+
+
+@pytest.mark.parametrize('tag', ['US', 'Latn', '1994', 'US-1994', 'klingon'])
+def test_tag_parser_without_language(tag: str):
+    repository = Repository()
+    with pytest.raises(TagOrSubtagNotFoundError):
+        repository.tag_parser(tag)
+    with pytest.raises(TagOrSubtagNotFoundError):
+        repository.tag_parser(tag, strict=True)
+
+
+@pytest.mark.parametrize('tag', ['en-gb-en', 'en-Latn-Fake', 'zz', 'en--GB', 'en-GB-', 'en-ñ', 'en-fake1fake1', 'GB',
+                                 'Latn-GB'])
+def test_tag_parser_not_found(repository: BCP47RepositoryInterface, tag: str):
+    with pytest.raises(TagOrSubtagNotFoundError):
+        repository.tag_parser(tag)
+
+
+def test_tag_parser_case_sensitive(repository: BCP47RepositoryInterface):
+    assert repository.tag_parser('en-Latn-GB', case_sensitive=True).tag == 'en-Latn-GB'
+    with pytest.raises(TagOrSubtagNotFoundError):
+        repository.tag_parser('en-latn-GB', case_sensitive=True)
+
+
+def test_tag_parser_strict():
+    repository = Repository(tag_parser_cache_size=16)
+    for tag, expected in [('de-CH-1901', True), ('de-1901', True), ('en-1901', False), ('sl-rozaj-biske-1994', True),
+                          ('sl-IT-rozaj-biske', True), ('sl-biske', False), ('sl-biske-rozaj', False),
+                          ('sr-Latn-ekavsk', True), ('sr-Cyrl-ekavsk', True), ('de-Latn-ekavsk', False),
+                          ('en-fonipa', True), ('en-GB', True)]:
+        assert repository.tag_parser(tag).tag == tag
+        assert repository.is_valid(tag)
+        assert repository.is_valid(tag, strict=True) is expected
+        if expected:
+            assert repository.tag_parser(tag, strict=True).tag == tag
+        else:
+            with pytest.raises(InvalidVariantPrefixError):
+                repository.tag_parser(tag, strict=True)
+            assert isinstance(next(repository.parse_many([tag], strict=True)), TagParserFailure)
+
+
+def test_tag_parser_strict_without_language():
+    repository = Repository()
+    variant = repository.get_variant_by_subtag('1994')
+    assert repository._find_variant_without_prefix({'variant': [variant]}) is variant  # pylint: disable=protected-access
+    with pytest.raises(TagOrSubtagNotFoundError):
+        repository.tag_parser('1994', strict=True)
+    assert not repository.is_valid('1994', strict=True)
+    assert isinstance(next(repository.parse_many(['1994'], strict=True)), TagParserFailure)
+
+
+def _exception_driven_tag_parser(repository: BCP47RepositoryInterface, tag: str) -> dict:
+    """Previous tag parser implementation that try each subtag type until the subtag is found."""
+    finders = [(repository.get_language_by_subtag, 'language', 1), (repository.get_ext_lang_by_subtag, 'ext_lang', 3),
+               (repository.get_script_by_subtag, 'script', 1), (repository.get_region_by_subtag, 'region', 1),
+               (repository.get_variant_by_subtag, 'variant', 999)]
+    tag_parsed_data = {}
+    try:
+        tag_parsed_data['redundant'] = repository.get_redundant_by_tag(tag)
+    except TagOrSubtagNotFoundError:
+        pass
+    finder_index = 0
+    repetitions = 0
+    for subtag in tag.split('-'):
+        while True:
+            if finder_index >= len(finders):
+                raise TagOrSubtagNotFoundError(subtag)
+            finder, field_name, max_subtags = finders[finder_index]
+            if repetitions < max_subtags:
+                try:
+                    value = finder(subtag)
+                    break
+                except TagOrSubtagNotFoundError:
+                    pass
+            finder_index += 1
+            repetitions = 0
+        repetitions += 1
+        if max_subtags == 1:
+            tag_parsed_data[field_name] = value
+        else:
+            tag_parsed_data.setdefault(field_name, []).append(value)
+    if 'language' not in tag_parsed_data:
+        raise TagOrSubtagNotFoundError(tag)
+    return tag_parsed_data
+
+
+@pytest.mark.benchmark
+def test_tag_parser_benchmark():
+    repository = Repository()
+    tags = ['zh-Hant-TW', 'en-GB', 'sl-rozaj-biske', 'de-CH-1901', 'zh-yue-HK', 'sr-Latn-RS', 'es-419', 'en'] * 500
+
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        expected = [_exception_driven_tag_parser(repository, tag) for tag in tags]
+        exception_driven_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        parsed = [repository._tag_parser(tag, False, False) for tag in tags]  # pylint: disable=protected-access
+        table_driven_time = time.perf_counter() - start
+    finally:
+        gc.enable()
+
+    print(f'Exception driven tag parser: {exception_driven_time:.3f}s, '
+          f'table driven tag parser: {table_driven_time:.3f}s')
+    assert parsed == expected
+    assert table_driven_time * 3 < exception_driven_time
+
+
+def test_tag_parser_cache(mocked_data_path: str):
+    repository = Repository(mocked_data_path, tag_parser_cache_size=2)
+    parsed_tag = repository.tag_parser('en-GB')
+    assert repository.tag_parser('en-GB') is parsed_tag
+    assert repository.tag_parser('en-GB', case_sensitive=True) is not parsed_tag
+    repository.tag_parser('en-Latn')
+
+    cache_info = repository.tag_parser_cache_info()
+    assert (cache_info.hits, cache_info.misses, cache_info.evictions) == (1, 3, 1)
+
+    repository.clear_tag_parser_cache()
+    assert repository.tag_parser_cache_info().current_size == 0
+    assert repository.tag_parser_cache_info().misses == 0
+
+
+def test_tag_parser_cache_disabled(repository: BCP47RepositoryInterface):
+    assert repository.tag_parser_cache_info() is None
+    assert repository.tag_parser('en-GB') is not repository.tag_parser('en-GB')
+
+
+def test_tag_parser_cache_invalidated_when_data_changes(mocked_data_path: str):
+    repository = Repository(mocked_data_path, tag_parser_cache_size=10)
+    parsed_tag = repository.tag_parser('en-GB')
+
+    region = repository.get_region_by_subtag('GB').model_copy(update={'subtag': 'ZZ'})
+    repository._add_tag_or_subtag(BCP47Type.REGION, region)  # pylint: disable=protected-access
+    repository._invalidate_caches()  # pylint: disable=protected-access
+
+    assert repository.tag_parser_cache_info().current_size == 0
+    assert repository.tag_parser('en-GB') is not parsed_tag
+    assert repository.tag_parser('en-ZZ').region is region
+
+
+@pytest.mark.parametrize('lazy', [False, True])
+def test_caches_invalidated_once_per_load(mocked_data_path: str, lazy: bool, monkeypatch: pytest.MonkeyPatch):
+    invalidations = []
+    monkeypatch.setattr(Repository, '_invalidate_caches', lambda self: invalidations.append(self))
+    repository = Repository(mocked_data_path, lazy=lazy)
+    assert len(invalidations) == 1
+
+    repository.tag_parser('en-GB')
+    assert len(invalidations) == (1 + len(BCP47Type) if lazy else 1)
+
+
+@pytest.mark.parametrize('tag, canonical_tag, extlang_form_tag', [
+    ('en', 'en', 'f1-en'),
+    ('F1', 'en', 'f1-en'),
+    ('f1-f1-latn-fk', 'en-Latn-GB', 'f1-en-Latn-GB'),
+    ('aav-Fake-FK-oxendict', 'aav-Fake-GB-fake1', 'aav-Fake-GB-fake1'),
+])
+def test_canonicalize(repository: BCP47RepositoryInterface, tag: str, canonical_tag: str, extlang_form_tag: str):
+    assert repository.canonicalize(tag) == canonical_tag
+    assert repository.canonicalize_extlang_form(tag) == extlang_form_tag
+
+
+@pytest.mark.parametrize('tag, canonical_tag, extlang_form_tag', [
+    ('zh-cmn-Hans', 'cmn-Hans', 'zh-cmn-Hans'),
+    ('zh-yue-HK', 'yue-HK', 'zh-yue-HK'),
+    ('zh-cmn-yue-HK', 'cmn-yue-HK', 'zh-cmn-yue-HK'),
+    ('IW-bu', 'he-MM', 'he-MM'),
+    ('en-GB-oed', 'en-GB-oxendict', 'en-GB-oxendict'),
+    ('i-klingon', 'tlh', 'tlh'),
+    ('i-default', 'i-default', 'i-default'),
+    ('sgn-BR', 'bzs', 'sgn-bzs'),
+    ('ja-Latn-hepburn-heploc', 'ja-Latn-hepburn-alalc97', 'ja-Latn-hepburn-alalc97'),
+])
+def test_canonicalize_registry(tag: str, canonical_tag: str, extlang_form_tag: str):
+    repository = Repository()
+    assert repository.canonicalize(tag) == canonical_tag
+    assert repository.canonicalize_extlang_form(tag) == extlang_form_tag
+
+
+def test_canonicalize_not_found(repository: BCP47RepositoryInterface):
+    with pytest.raises(TagOrSubtagNotFoundError):
+        repository.canonicalize('en-gb-en')
+
+
+def test_canonicalize_without_language():
+    repository = Repository()
+    for tag in ['US', 'Latn', '1994']:
+        with pytest.raises(TagOrSubtagNotFoundError):
+            repository.canonicalize(tag)
+        with pytest.raises(TagOrSubtagNotFoundError):
+            repository.canonicalize_extlang_form(tag)
+
+
+def test_canonicalize_cache_invalidated_when_data_changes(mocked_data_path: str):
+    repository = Repository(mocked_data_path)
+    canonicalize_cache = repository._canonicalize_cache  # pylint: disable=protected-access
+    assert repository.canonicalize('f1-GB') == 'en-GB'
+    assert canonicalize_cache.cache_info().current_size == 1
+
+    language = repository.get_language_by_subtag('f1').model_copy(update={'subtag': 'zz'})
+    repository._add_tag_or_subtag(BCP47Type.LANGUAGE, language)  # pylint: disable=protected-access
+    repository._invalidate_caches()  # pylint: disable=protected-access
+
+    assert canonicalize_cache.cache_info().current_size == 0
+    assert repository.canonicalize('zz-GB') == 'en-GB'
+
+
+def test_parse_many(repository: BCP47RepositoryInterface):
+    results = list(repository.parse_many(['en-GB', 'zz', 'en-GB', 'en-Latn', 'zz']))
+
+    assert [result.tag for result in results] == ['en-GB', 'zz', 'en-GB', 'en-Latn', 'zz']
+    assert isinstance(results[0], ParsedTag)
+    assert results[0] is results[2]
+    assert isinstance(results[1], TagParserFailure)
+    assert results[1].error == 'TagOrSubtagNotFoundError'
+    assert results[1] is results[4]
+
+
+def test_parse_many_without_language():
+    repository = Repository()
+    results = list(repository.parse_many(['US', 'en-US', 'zz', 'Latn', '1994', 'i-klingon', 'US']))
+
+    assert [type(result) for result in results] == [TagParserFailure, ParsedTag, TagParserFailure, TagParserFailure,
+                                                    TagParserFailure, ParsedTag, TagParserFailure]
+    assert all(result.error == 'TagOrSubtagNotFoundError'
+               for result in results if isinstance(result, TagParserFailure))
+    assert [result.tag for result in results] == ['US', 'en-US', 'zz', 'Latn', '1994', 'i-klingon', 'US']
+    assert results[0] is results[6]
+
+
+def test_parse_many_parses_each_distinct_tag_once(repository: BCP47RepositoryInterface,
+                                                   monkeypatch: pytest.MonkeyPatch):
+    parsed_tags = []
+    tag_parser = repository.tag_parser
+
+    def _tag_parser(tag: str, case_sensitive: bool = False, strict: bool = False) -> ParsedTag:
+        parsed_tags.append(tag)
+        return tag_parser(tag, case_sensitive, strict)
+
+    monkeypatch.setattr(repository, 'tag_parser', _tag_parser)
+    results = repository.parse_many(tag for _ in range(1000) for tag in ('en', 'en-GB', 'f1'))
+
+    assert next(results).tag == 'en'
+    assert parsed_tags == ['en']
+    assert len(list(results)) == 2999
+    assert parsed_tags == ['en', 'en-GB', 'f1']
+
+
+def test_try_get(repository: BCP47RepositoryInterface):
+    assert repository.try_get_language_by_subtag('EN') is repository.get_language_by_subtag('en')
+    assert repository.try_get_language_by_subtag('EN', case_sensitive=True) is None
+    assert repository.try_get_ext_lang_by_subtag('f1') is repository.get_ext_lang_by_subtag('f1')
+    assert repository.try_get_script_by_subtag('Latn') is repository.get_script_by_subtag('Latn')
+    assert repository.try_get_region_by_subtag('GB') is repository.get_region_by_subtag('GB')
+    assert repository.try_get_variant_by_subtag('fake1') is repository.get_variant_by_subtag('fake1')
+    assert repository.try_get_redundant_by_tag('f1') is repository.get_redundant_by_tag('f1')
+    assert repository.try_get_grandfathered_by_tag('i-klingon') is None
+    for try_get in (repository.try_get_language_by_subtag, repository.try_get_ext_lang_by_subtag,
+                    repository.try_get_script_by_subtag, repository.try_get_region_by_subtag,
+                    repository.try_get_variant_by_subtag, repository.try_get_redundant_by_tag):
+        assert try_get('zzzz') is None
+
+
+def test_reverse_indexes(repository: BCP47RepositoryInterface):
+    assert repository.get_languages_by_macro_language('AAV') == (repository.get_language_by_subtag('f1'),)
+    assert repository.get_languages_by_suppress_script('latn') == (repository.get_language_by_subtag('en'),
+                                                                   repository.get_language_by_subtag('aav'))
+    assert repository.get_tags_or_subtags_by_preferred_value('en') == (repository.get_language_by_subtag('f1'),
+                                                                       repository.get_ext_lang_by_subtag('en'),
+                                                                       repository.get_redundant_by_tag('f1'))
+    assert repository.get_tags_or_subtags_by_preferred_value('gb') == (repository.get_region_by_subtag('FK'),)
+    assert repository.get_languages_by_macro_language('en') == ()
+    assert repository.get_languages_by_suppress_script('zzzz') == ()
+
+
+def test_reverse_indexes_lazy(mocked_data_path: str):
+    repository = Repository(mocked_data_path, lazy=True)
+    assert [language.subtag for language in repository.get_languages_by_suppress_script('Latn')] == ['en', 'aav']
+    assert BCP47Type.REGION in repository._unloaded_types
+    assert repository.get_tags_or_subtags_by_preferred_value('GB') == (repository.get_region_by_subtag('FK'),)
+
+
+@pytest.mark.parametrize('criteria, expected', [
+    ({}, ['en', 'aav', 'f1']),
+    ({'scope': 'macrolanguage'}, ['aav']),
+    ({'scope': LanguageScopeEnum.MACRO_LANGUAGE, 'deprecated': True}, []),
+    ({'deprecated': True}, ['f1']),
+    ({'deprecated': False}, ['en', 'aav']),
+    ({'added_from': datetime(2005, 10, 16)}, ['en', 'aav', 'f1']),
+    ({'added_from': datetime(2005, 10, 17), 'added_to': datetime(2010, 1, 1)}, ['aav']),
+    ({'added_to': datetime(2005, 10, 16), 'deprecated': False}, ['en']),
+    ({'scope': 'collection'}, []),
+])
+def test_find_languages(repository: BCP47RepositoryInterface, criteria: dict, expected: list):
+    assert [language.subtag for language in repository.find_languages(**criteria)] == expected
+
+
+def test_find_languages_registry():
+    repository = Repository()
+    criteria = {'scope': 'macrolanguage', 'deprecated': False, 'added_from': datetime(2009, 1, 1),
+                'added_to': datetime(2010, 1, 1)}
+    assert list(repository.find_languages(**criteria)) == [
+        language for language in repository.languages
+        if language.scope and language.scope.scope is LanguageScopeEnum.MACRO_LANGUAGE and not language.deprecated
+        and criteria['added_from'] <= language.added <= criteria['added_to']]
+    with pytest.raises(LanguageScopeNotFoundError):
+        repository.find_languages('individual')
+
+
+def test_encode_tag():
+    repository = Repository()
+    tags = ['en', 'en-GB', 'zh-cmn-Hans-CN', 'sl-rozaj-biske', 'de-CH-1901', 'zh-yue', 'i-klingon', 'en-GB-oed',
+            'sl-IT-rozaj-biske-1994', 'zh-cmn-yue']
+    codes = [repository.encode_tag(tag) for tag in tags]
+    assert all(0 <= code < 2 ** 63 for code in codes)
+    assert len(set(codes)) == len(tags)
+    assert [repository.decode_tag(code).tag for code in codes] == tags
+    assert [repository.decode_tag(code) for code in codes] == [repository.tag_parser(tag) for tag in tags]
+    assert repository.decode_tag(repository.encode_tag('zh-yue')).redundant.tag == 'zh-yue'
+    assert repository.encode_tag('EN-gb') == codes[1]
+    assert repository.encode_tag('en-GB-oed') != repository.encode_tag('en-GB')
+    assert repository.encode_tag('sl-IT-rozaj-biske-1994') == codes[8]
+    assert sorted(['en-GB', 'de-CH-1901', 'en', 'de'], key=repository.encode_tag) == ['de', 'de-CH-1901', 'en', 'en-GB']
+
+
+def test_tag_code_layout():
+    repository = Repository()
+    tag_code_layout = repository.tag_code_layout
+    code = repository.encode_tag('zh-cmn-Hans-CN')
+    for bcp47_type, subtags, subtag in [(BCP47Type.LANGUAGE, repository.languages, 'zh'),
+                                        (BCP47Type.EXTLANG, repository.ext_langs, 'cmn'),
+                                        (BCP47Type.SCRIPT, repository.scripts, 'Hans'),
+                                        (BCP47Type.REGION, repository.regions, 'CN')]:
+        assert subtags[tag_code_layout.get_slot(bcp47_type).get_dense_id(code) - 1].subtag == subtag
+    assert tag_code_layout.get_slot(BCP47Type.VARIANT).get_dense_id(code) == 0
+    assert tag_code_layout.get_slot(BCP47Type.VARIANT, 2) is None
+    assert tag_code_layout.is_grandfathered(repository.encode_tag('i-klingon'))
+    assert tag_code_layout.is_overflow(repository.encode_tag('sl-IT-rozaj-biske-1994'))
+    assert not tag_code_layout.is_grandfathered(code) and not tag_code_layout.is_overflow(code)
+
+
+def test_encode_tag_overflow_table_is_bounded(monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(Repository, '_OVERFLOW_TABLE_SIZE', 2)
+    repository = Repository()
+    tags = ['sl-rozaj-biske-1994', 'sl-IT-rozaj-biske-1994', 'sl-SI-rozaj-biske-1994']
+    codes = [repository.encode_tag(tag) for tag in tags]
+
+    assert len(repository._overflow_tags) == 2  # pylint: disable=protected-access
+    with pytest.raises(InvalidTagCodeError):
+        repository.decode_tag(codes[0])
+    assert [repository.decode_tag(code).tag for code in codes[1:]] == tags[1:]
+    assert repository.encode_tag(tags[0]) not in codes
+
+
+@pytest.mark.parametrize('code', [-1, 0, 1, 3 << 59, 1 << 59, (1 << 59) + 10 ** 6, 2 << 59, 1 << 8])
+def test_decode_tag_invalid(repository: BCP47RepositoryInterface, code: int):
+    with pytest.raises(InvalidTagCodeError):
+        repository.decode_tag(code)
+
+
+def test_encode_tag_not_found(repository: BCP47RepositoryInterface):
+    with pytest.raises(TagOrSubtagNotFoundError):
+        repository.encode_tag('en-zzzzzz')
+
+
+@pytest.mark.parametrize('tag, expected', [('en-GB', True), ('en-en-f1-Latn-GB-fake1', True), ('EN-latn', True),
+                                           ('en-gb-en', False), ('zz', False), ('en--GB', False), ('', False),
+                                           ('GB', False), ('Latn', False), ('GB-en', False), ('Latn-GB', False)])
+def test_is_valid(repository: BCP47RepositoryInterface, tag: str, expected: bool):
+    assert repository.is_valid(tag) is expected
+
+
+def test_is_valid_without_language():
+    repository = Repository()
+    for tag in ['US', 'Latn', '1994', 'zz', 'Latn-US', 'US-1994']:
+        assert not repository.is_valid(tag)
+        assert not repository.is_valid(tag, strict=True)
+        with pytest.raises(TagOrSubtagNotFoundError):
+            _exception_driven_tag_parser(repository, tag)
+    assert not repository.is_well_formed('1994')
+
+
+def test_is_valid_case_sensitive(repository: BCP47RepositoryInterface):
+    assert repository.is_valid('en-Latn-GB', case_sensitive=True)
+    assert not repository.is_valid('en-latn-GB', case_sensitive=True)
+
+
+@pytest.mark.parametrize('tag', [
+    'en', 'zh-Hant-TW', 'zh-yue-HK', 'sl-rozaj-biske-1994', 'de-CH-1901', 'es-419', 'en-US-u-ca-gregory-x-private',
+    'x-whatever', 'i-klingon', 'EN-GB-OED', 'zh-min-nan', 'qaa-Qaaa-QM-x-southern'
+])
+def test_is_well_formed(repository: BCP47RepositoryInterface, tag: str):
+    assert repository.is_well_formed(tag)
+
+
+@pytest.mark.parametrize('tag', ['', 'e', 'en-', '-en', 'en--GB', 'en-US-u', 'en-x', 'toolonglanguage', 'en-ñ',
+                                 'en-GB-oed-fake', 'en_GB', 'en-a-b', 'i-fake'])
+def test_is_not_well_formed(repository: BCP47RepositoryInterface, tag: str):
+    assert not repository.is_well_formed(tag)
@@ -0,0 +1,82 @@
+import threading
+
+import pytest
+
+from cache.lru_cache import LRUCache
+
+
+def test_lru_cache_hits_and_misses():
+    cache = LRUCache(2)
+    assert cache.get('a') is None
+    cache.put('a', 1)
+    assert cache.get('a') == 1
+
+    cache_info = cache.cache_info()
+    assert cache_info.hits == 1
+    assert cache_info.misses == 1
+    assert cache_info.evictions == 0
+    assert cache_info.max_size == 2
+    assert cache_info.current_size == 1
+
+
+def test_lru_cache_evicts_least_recently_used():
+    cache = LRUCache(2)
+    cache.put('a', 1)
+    cache.put('b', 2)
+    cache.get('a')
+    cache.put('c', 3)
+
+    assert cache.get('b') is None
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+    assert cache.cache_info().evictions == 1
+
+
+def test_lru_cache_invalidate_and_clear():
+    cache = LRUCache(2)
+    cache.put('a', 1)
+    cache.get('a')
+
+    cache.invalidate()
+    assert cache.cache_info().current_size == 0
+    assert cache.cache_info().hits == 1
+
+    cache.clear()
+    assert cache.cache_info().hits == 0
+    assert cache.cache_info().misses == 0
+
+
+def test_lru_cache_put_after_invalidate_is_discarded():
+    cache = LRUCache(2)
+    generation = cache.generation
+    cache.invalidate()
+    cache.put('a', 1, generation)
+    assert cache.get('a') is None
+
+    cache.put('a', 1, cache.generation)
+    assert cache.get('a') == 1
+
+
+def test_lru_cache_invalid_max_size():
+    with pytest.raises(ValueError):
+        LRUCache(0)
+
+
+def test_lru_cache_thread_safe():
+    cache = LRUCache(10)
+
+    def _worker(offset: int):
+        for i in range(1000):
+            cache.put((offset + i) % 50, i)
+            cache.get(i % 50)
+
+    threads = [threading.Thread(target=_worker, args=(offset, )) for offset in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    cache_info = cache.cache_info()
+    assert cache_info.current_size == 10
+    assert cache_info.hits + cache_info.misses == 8000
+    assert cache_info.evictions == 8000 - 10
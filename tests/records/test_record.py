@@ -0,0 +1,134 @@
+import gc
+import pickle
+import time
+import tracemalloc
+from typing import List
+
+import pytest
+
+from records.language_record import LanguageRecord
+from records.record import Record
+from records.redundant_record import RedundantRecord
+from records.variant_record import VariantRecord
+from repository import Repository
+from schemas.language import Language
+from schemas.redundant import Redundant
+
+
+@pytest.fixture(scope='module')
+def record_repository(mocked_data_path: str) -> Repository:
+    return Repository(mocked_data_path, use_records=True)
+
+
+def _get_all(repository: Repository) -> List:
+    return [*repository.languages, *repository.ext_langs, *repository.scripts, *repository.regions,
+            *repository.variants, *repository.grandfathered, *repository.redundant]
+
+
+def test_same_data_as_pydantic_models(record_repository: Repository, repository: Repository):
+    records = _get_all(record_repository)
+    assert all(isinstance(record, Record) for record in records)
+    assert [record.tag_str for record in records] == [model.tag_str for model in _get_all(repository)]
+    assert [record.to_model().model_dump() for record in records] == \
+        [model.model_dump() for model in _get_all(repository)]
+
+
+def test_same_attribute_names(record_repository: Repository):
+    language = record_repository.get_language_by_subtag('f1')
+    assert language.subtag == 'f1'
+    assert language.preferred_value.language is record_repository.get_language_by_subtag('en')
+    assert language.preferred_value.tag == 'en'
+    assert isinstance(language.comments, tuple)
+    assert record_repository.get_language_by_subtag('aav').comments == ()
+    assert record_repository.get_language_by_subtag('en').suppress_script.subtag == 'Latn'
+
+    variant = record_repository.get_variant_by_subtag('oxendict')
+    assert isinstance(variant, VariantRecord)
+    assert [prefix.tag for prefix in variant.prefix] == [prefix.tag for prefix in variant.to_model().prefix]
+
+    redundant = record_repository.get_redundant_by_tag('f1')
+    assert isinstance(redundant, RedundantRecord)
+    assert redundant.tag == redundant.tag_str == 'f1'
+
+
+def test_strings_and_datetimes_are_shared(record_repository: Repository):
+    en, aav = record_repository.get_language_by_subtag('en'), record_repository.get_language_by_subtag('aav')
+    assert en.updated_at is aav.updated_at
+    assert en.subtag is LanguageRecord(subtag='e' + 'n').subtag
+
+
+def test_record_is_immutable(record_repository: Repository):
+    language = record_repository.get_language_by_subtag('en')
+    with pytest.raises(AttributeError):
+        language.subtag = 'es'
+    with pytest.raises(AttributeError):
+        del language.subtag
+    with pytest.raises(AttributeError):
+        language.other = 'value'
+
+
+def test_to_model_is_created_once(record_repository: Repository):
+    redundant = record_repository.get_redundant_by_tag('f1')
+    model = redundant.to_model()
+    assert isinstance(model, Redundant)
+    assert model.tag == 'f1'
+    assert redundant.to_model() is model
+    assert isinstance(model.subtags.language, Language)
+
+
+def test_unexpected_field():
+    with pytest.raises(TypeError):
+        LanguageRecord(subtag='en', tag='en')
+
+
+def test_pickle(record_repository: Repository):
+    languages = pickle.loads(pickle.dumps(record_repository.languages))
+    assert [language.subtag for language in languages] == ['en', 'aav', 'f1']
+    assert languages[2].preferred_value.language is languages[0]
+    assert languages[0].to_model().model_dump() == record_repository.languages[0].to_model().model_dump()
+
+
+def test_parser_and_canonicalize(record_repository: Repository, repository: Repository):
+    for tag in ('en-en-f1-latn-gb-fake1-oxendict', 'f1', 'aav-Fake-FK'):
+        assert record_repository.tag_parser(tag).tag == repository.tag_parser(tag).tag
+    assert record_repository.tag_parser('f1').redundant is record_repository.get_redundant_by_tag('f1')
+    assert record_repository.canonicalize('f1-f1-latn-fk') == repository.canonicalize('f1-f1-latn-fk')
+
+
+def test_snapshot(mocked_data_path: str, tmp_path):
+    Repository(mocked_data_path, snapshot_dir_path=str(tmp_path))
+    record_repository = Repository(mocked_data_path, snapshot_dir_path=str(tmp_path), use_records=True)
+    assert len(list(tmp_path.iterdir())) == 2
+    assert isinstance(record_repository.languages[0], LanguageRecord)
+    restored_repository = Repository(mocked_data_path, snapshot_dir_path=str(tmp_path), use_records=True)
+    assert restored_repository.get_ext_lang_by_subtag('en').prefix[0].tag == 'f1'
+
+
+@pytest.mark.benchmark
+def test_record_benchmark():
+    memory = {}
+    repositories = {}
+    for use_records in (False, True):
+        gc.collect()
+        tracemalloc.start()
+        repositories[use_records] = Repository(use_records=use_records)
+        memory[use_records] = tracemalloc.get_traced_memory()[0]
+        tracemalloc.stop()
+
+    attribute_access_time = {}
+    for use_records, repository in repositories.items():
+        languages = repository.languages
+        gc.disable()
+        try:
+            start = time.perf_counter()
+            for _ in range(20):
+                for language in languages:
+                    _ = (language.subtag, language.scope, language.preferred_value, language.description)
+            attribute_access_time[use_records] = time.perf_counter() - start
+        finally:
+            gc.enable()
+
+    print(f'pydantic models: {memory[False] / 2 ** 20:.1f}MiB {attribute_access_time[False]:.3f}s, '
+          f'records: {memory[True] / 2 ** 20:.1f}MiB {attribute_access_time[True]:.3f}s')
+    assert memory[True] < memory[False] * 0.7
+    assert attribute_access_time[True] < attribute_access_time[False]
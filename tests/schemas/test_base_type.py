@@ -0,0 +1,20 @@
+"""BaseType class tests."""
+from repository import Repository
+
+
+def test_equal_by_type_and_tag(repository: Repository):
+    english = repository.get_language_by_subtag('en')
+    copy = english.model_copy(update={'description': ['Other']})
+    assert copy == english
+    assert hash(copy) == hash(english)
+    assert english != repository.get_ext_lang_by_subtag('en')
+    assert english != 'en'
+    assert len({english, copy, repository.get_ext_lang_by_subtag('en')}) == 2
+
+
+def test_tag_is_cached(repository: Repository):
+    redundant = repository.get_redundant_by_tag('f1')
+    assert redundant.tag == 'f1'
+    assert redundant.__dict__['tag'] == 'f1'
+    assert {redundant: True}[repository.get_redundant_by_tag('F1')]
+    assert redundant.model_dump() == repository.get_redundant_by_tag('f1').model_dump()
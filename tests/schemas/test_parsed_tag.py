@@ -0,0 +1,42 @@
+"""ParsedTag class tests."""
+import pytest
+from pydantic import ValidationError
+
+from repository import Repository
+from schemas.parsed_tag import ParsedTag
+
+
+def test_parsed_tag_equal_by_tag(repository: Repository):
+    parsed_tag = repository.tag_parser('en-latn-gb')
+    assert parsed_tag == repository.tag_parser('EN-Latn-GB')
+    assert parsed_tag != 'en-Latn-GB'
+    assert parsed_tag.__dict__['tag'] == 'en-Latn-GB'
+    assert len({parsed_tag, repository.tag_parser('en-Latn-GB'), repository.tag_parser('en')}) == 2
+
+
+def test_parsed_tag_changes_are_not_cached(repository: Repository):
+    parsed_tag = repository.tag_parser('en-GB')
+    assert parsed_tag.tag == 'en-GB'
+    copied = parsed_tag.model_copy(update={'region': repository.get_region_by_subtag('FK')})
+    assert copied.tag == 'en-FK'
+    assert copied != parsed_tag
+    assert parsed_tag.tag == 'en-GB'
+
+    parsed_tag.region = None
+    assert parsed_tag.tag == 'en'
+    assert parsed_tag == repository.tag_parser('en')
+
+
+def test_redundant_changes_are_not_cached(repository: Repository):
+    redundant = repository.get_redundant_by_tag('f1').model_copy(deep=True)
+    assert redundant.tag == 'f1'
+    redundant.subtags.script = repository.get_script_by_subtag('Latn')
+    assert redundant.subtags.tag == 'f1-Latn'
+    redundant.subtags = redundant.subtags
+    assert redundant.tag == 'f1-Latn'
+
+
+def test_parsed_tag_without_language(repository: Repository):
+    with pytest.raises(ValidationError):
+        ParsedTag(region=repository.get_region_by_subtag('GB'))
+    assert ParsedTag(language=repository.get_language_by_subtag('en')).tag == 'en'
@@ -0,0 +1,21 @@
+"""PreferredValue class tests."""
+import pytest
+
+from repository import Repository
+from schemas.abstract.preferred_value import PreferredValue
+
+
+@pytest.mark.parametrize('kwargs', [{}, {'use_records': True}, {'trusted': True}])
+def test_format_tag(kwargs: dict):
+    repository = Repository(**kwargs)
+    tags = {item.tag_str: PreferredValue.format_tag(item.preferred_value)
+            for items in (repository.languages, repository.ext_langs, repository.regions, repository.variants,
+                          repository.grandfathered, repository.redundant)
+            for item in items if getattr(item, 'preferred_value', None)}
+
+    assert tags['iw'] == 'he'
+    assert tags['BU'] == 'MM'
+    assert tags['heploc'] == 'alalc97'
+    assert tags['i-klingon'] == 'tlh'
+    assert tags['zh-cmn-Hans'] == 'cmn-Hans'
+    assert tags['cmn'] == 'cmn'
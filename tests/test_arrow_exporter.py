@@ -0,0 +1,57 @@
+import os
+
+import pytest
+
+from repository import Repository
+
+pa = pytest.importorskip('pyarrow')
+pq = pytest.importorskip('pyarrow.parquet')
+ArrowExporter = pytest.importorskip('arrow_exporter').ArrowExporter
+
+
+@pytest.fixture(scope='module')
+def tables(repository: Repository) -> dict:
+    return ArrowExporter(repository).get_tables()
+
+
+@pytest.mark.parametrize('name', ['languages', 'ext_langs', 'scripts', 'regions', 'variants', 'grandfathered',
+                                  'redundant'])
+def test_get_tables(repository: Repository, tables: dict, name: str):
+    tags_or_subtags = getattr(repository, name)
+    rows = tables[name].to_pylist()
+    assert [row['id'] for row in rows] == list(range(1, len(tags_or_subtags) + 1))
+    for row, tag_or_subtag in zip(rows, tags_or_subtags):
+        assert row.get('subtag', row.get('tag')) == tag_or_subtag.tag_str
+        assert row['description'] == tag_or_subtag.description
+        assert row['added'] == tag_or_subtag.added
+        assert row['deprecated'] == getattr(tag_or_subtag, 'deprecated', None)
+
+
+def test_foreign_keys(repository: Repository, tables: dict):
+    languages = tables['languages'].to_pylist()
+    for row, language in zip(languages, repository.languages):
+        assert (languages[row['macro_language_id'] - 1]['subtag'] if row['macro_language_id'] else None) == \
+            (language.macro_language.subtag if language.macro_language else None)
+        assert (repository.scripts[row['suppress_script_id'] - 1] if row['suppress_script_id'] else None) == \
+            language.suppress_script
+        assert (repository.languages[row['preferred_value_id'] - 1] if row['preferred_value_id'] else None) == \
+            (language.preferred_value.language if language.preferred_value else None)
+
+    for row, redundant in zip(tables['redundant'].to_pylist(), repository.redundant):
+        assert repository.languages[row['language_id'] - 1] == redundant.subtags.language
+        assert [repository.variants[variant_id - 1] for variant_id in row['variant_ids']] == redundant.subtags.variant
+    for row, ext_lang in zip(tables['ext_langs'].to_pylist(), repository.ext_langs):
+        assert [languages[language_id - 1]['subtag'] for language_id in row['prefix_language_ids']] == \
+            [prefix.language.subtag for prefix in ext_lang.prefix]
+
+
+def test_write_parquet(repository: Repository, tables: dict, tmp_path):
+    file_paths = ArrowExporter(repository).write_parquet(os.path.join(tmp_path, 'registry'))
+    assert sorted(os.path.basename(file_path) for file_path in file_paths.values()) == \
+        sorted(f'{name}.parquet' for name in tables)
+    assert pq.read_table(file_paths['languages']).equals(tables['languages'])
+
+
+def test_records():
+    assert ArrowExporter(Repository(use_records=True)).get_tables()['variants'].equals(
+        ArrowExporter(Repository()).get_tables()['variants'])
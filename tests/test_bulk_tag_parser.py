@@ -0,0 +1,69 @@
+import time
+
+import pytest
+
+from repository import Repository
+
+np = pytest.importorskip('numpy')
+BulkTagParser = pytest.importorskip('bulk_tag_parser').BulkTagParser
+
+
+def test_parse(repository: Repository):
+    tags = ['en-GB', 'EN-gb', None, 'xx-zz', 'aav-Fake-FK', 'f1', float('nan'), 'f1-f1-latn-fk', 'en-GB']
+    bulk_parsed_tags = BulkTagParser(repository).parse(tags)
+
+    assert bulk_parsed_tags.valid.tolist() == [True, True, False, False, True, True, False, True, True]
+    for position, tag in enumerate(tags):
+        language_id = bulk_parsed_tags.language_ids[position]
+        script_id = bulk_parsed_tags.script_ids[position]
+        region_id = bulk_parsed_tags.region_ids[position]
+        canonical_index = bulk_parsed_tags.canonical_indices[position]
+        if not bulk_parsed_tags.valid[position]:
+            assert (language_id, script_id, region_id, canonical_index) == (0, 0, 0, -1)
+            continue
+        parsed_tag = repository.tag_parser(tag)
+        assert (repository.languages[language_id - 1] if language_id else None) == parsed_tag.language
+        assert (repository.scripts[script_id - 1] if script_id else None) == parsed_tag.script
+        assert (repository.regions[region_id - 1] if region_id else None) == parsed_tag.region
+        assert bulk_parsed_tags.canonical_tags[canonical_index] == repository.canonicalize(tag)
+    assert bulk_parsed_tags.canonical_tags.tolist() == ['aav-Fake-GB', 'en', 'en-GB', 'en-Latn-GB']
+
+
+def test_parse_overflow_and_grandfathered():
+    repository = Repository()
+    bulk_parsed_tags = BulkTagParser(repository).parse(np.array(['sl-IT-rozaj-biske-1994', 'i-klingon']))
+    assert bulk_parsed_tags.valid.all()
+    assert repository.languages[bulk_parsed_tags.language_ids[0] - 1].subtag == 'sl'
+    assert repository.regions[bulk_parsed_tags.region_ids[0] - 1].subtag == 'IT'
+    assert bulk_parsed_tags.language_ids[1] == 0
+    assert bulk_parsed_tags.canonical_tags.tolist() == ['sl-IT-rozaj-biske-1994', 'tlh']
+
+
+def test_parse_garbage():
+    repository = Repository()
+    tags = ['en', 'US', '1994', 'Latn-US', '', '-', 'en--GB', 'ñ', None, 'i-klingon', 'en-US', 'US']
+    bulk_parsed_tags = BulkTagParser(repository).parse(tags)
+
+    assert bulk_parsed_tags.valid.tolist() == [True, False, False, False, False, False, False, False, False, True, True,
+                                               False]
+    assert bulk_parsed_tags.canonical_tags.tolist() == ['en', 'en-US', 'tlh']
+    assert not bulk_parsed_tags.language_ids[~bulk_parsed_tags.valid].any()
+    assert (bulk_parsed_tags.canonical_indices[~bulk_parsed_tags.valid] == -1).all()
+
+
+@pytest.mark.benchmark
+def test_parse_benchmark():
+    repository = Repository()
+    tags = ['zh-Hant-TW', 'en-GB', 'sl-rozaj-biske', 'de-CH-1901', 'es-419', 'sr-Latn-RS', 'iw-IL', 'xx'] * 25000
+
+    start = time.perf_counter()
+    parsed_tags = [repository.tag_parser(tag) if repository.is_valid(tag) else None for tag in tags]
+    tag_parser_time = time.perf_counter() - start
+
+    start = time.perf_counter()
+    bulk_parsed_tags = BulkTagParser(repository).parse(tags)
+    bulk_time = time.perf_counter() - start
+
+    print(f'{len(tags)} tags, tag parser: {tag_parser_time:.3f}s, bulk tag parser: {bulk_time:.3f}s')
+    assert bulk_parsed_tags.valid.sum() == sum(parsed_tag is not None for parsed_tag in parsed_tags)
+    assert bulk_time * 5 < tag_parser_time
@@ -1,5 +1,10 @@
 import filecmp
+import gzip
+import os
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
+from typing import Dict, Iterator, List, Type
 
 import pytest
 from _pytest.fixtures import fixture
@@ -31,3 +36,103 @@ def test_downloader_service_check_last_data(last_data_path: Path):
     project_data = Base._LANGUAGE_SUBTAG_REGISTRY_FILE_PATH
 
     assert filecmp.cmp(last_data_path, project_data)
+
+
+class _RegistryServer(ThreadingHTTPServer):
+    """Local stand-in of the IANA server that supports ETag, Last-Modified and gzip encoding."""
+    body = b''
+    etag = '"1"'
+    last_modified = 'Mon, 16 Oct 2023 00:00:00 GMT'
+    requests: List[Dict[str, str]] = []
+
+
+class _RegistryHandler(BaseHTTPRequestHandler):
+    server: _RegistryServer
+
+    def do_GET(self):  # pylint: disable=invalid-name
+        self.server.requests.append(dict(self.headers))
+        if self.headers.get('If-None-Match') == self.server.etag:
+            self.send_response(304)
+            self.end_headers()
+            return
+        body = self.server.body
+        self.send_response(200)
+        if 'gzip' in self.headers.get('Accept-Encoding', ''):
+            body = gzip.compress(body)
+            self.send_header('Content-Encoding', 'gzip')
+        self.send_header('Content-Length', str(len(body)))
+        self.send_header('ETag', self.server.etag)
+        self.send_header('Last-Modified', self.server.last_modified)
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+@fixture
+def registry_server(mocked_data_path: str) -> Iterator[_RegistryServer]:
+    server = _RegistryServer(('127.0.0.1', 0), _RegistryHandler)
+    with open(mocked_data_path, 'rb') as f:
+        server.body = f.read()
+    server.requests = []
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@fixture
+def downloader_service_type(registry_server: _RegistryServer, tmp_path: Path) -> Type[DownloaderService]:
+    class BCP47DownloaderServiceMock(DownloaderService):
+        _LANGUAGE_SUBTAG_REGISTRY_URL = f'http://127.0.0.1:{registry_server.server_address[1]}/registry'
+        _LANGUAGE_SUBTAG_REGISTRY_FILE_PATH = tmp_path / 'language-subtag-registry'
+
+    return BCP47DownloaderServiceMock
+
+
+def test_download_conditional(registry_server: _RegistryServer, downloader_service_type: Type[DownloaderService],
+                              mocked_data_path: str):
+    file_path = downloader_service_type._LANGUAGE_SUBTAG_REGISTRY_FILE_PATH
+
+    assert downloader_service_type().download()
+    assert filecmp.cmp(file_path, mocked_data_path, shallow=False)
+    assert registry_server.requests[0]['Accept-Encoding'] == 'gzip'
+    assert 'If-None-Match' not in registry_server.requests[0]
+
+    assert not downloader_service_type().download()
+    assert registry_server.requests[1]['If-None-Match'] == registry_server.etag
+    assert registry_server.requests[1]['If-Modified-Since'] == registry_server.last_modified
+    assert sorted(os.listdir(file_path.parent)) == ['language-subtag-registry', 'language-subtag-registry.http.json']
+
+
+def test_download_same_file_date(registry_server: _RegistryServer, downloader_service_type: Type[DownloaderService]):
+    file_path = downloader_service_type._LANGUAGE_SUBTAG_REGISTRY_FILE_PATH
+    assert downloader_service_type().download()
+    inode = os.stat(file_path).st_ino
+
+    registry_server.etag = '"2"'
+    registry_server.body += b'%%\n'
+    assert not downloader_service_type().download()
+    assert os.stat(file_path).st_ino == inode
+
+    registry_server.etag = '"3"'
+    registry_server.body = registry_server.body.replace(b'File-Date: ', b'File-Date: 1', 1)
+    assert downloader_service_type().download()
+    assert os.stat(file_path).st_ino != inode
+    assert file_path.read_bytes() == registry_server.body
+    assert registry_server.requests[-1]['If-None-Match'] == '"2"'
+
+
+def test_download_invalid(registry_server: _RegistryServer, downloader_service_type: Type[DownloaderService],
+                          mocked_data_path: str):
+    file_path = downloader_service_type._LANGUAGE_SUBTAG_REGISTRY_FILE_PATH
+    assert downloader_service_type().download()
+
+    registry_server.etag = '"2"'
+    registry_server.body = b'<html>Error</html>'
+    with pytest.raises(RuntimeError):
+        downloader_service_type().download()
+    assert filecmp.cmp(file_path, mocked_data_path, shallow=False)
+    assert sorted(os.listdir(file_path.parent)) == ['language-subtag-registry', 'language-subtag-registry.http.json']
@@ -0,0 +1,153 @@
+import gc
+import itertools
+import time
+
+import pytest
+
+from exceptions.not_found.tag_or_subtag_not_found_error import TagOrSubtagNotFoundError
+from interface.bcp47_repository.bcp47_repository_interface import BCP47RepositoryInterface
+from locale_matcher import LocaleMatcher
+from repository import Repository
+
+_SUPPORTED_TAGS = ['en', 'en-GB', 'de-DE', 'de-Latn-DE', 'he', 'zh-Hant-TW', 'fr-CA', 'yue', 'sl-rozaj-biske']
+
+
+@pytest.fixture(scope='module')
+def locale_matcher() -> LocaleMatcher:
+    return LocaleMatcher(Repository(), _SUPPORTED_TAGS, default='en')
+
+
+@pytest.mark.parametrize('language_priority_list, expected', [
+    (['en-US'], 'en'),
+    (['EN-gb-oxendict'], 'en-GB'),
+    (['iw-IL'], 'he'),
+    (['zh-yue-HK'], 'yue'),
+    (['zh-Hant-TW-x-private'], 'zh-Hant-TW'),
+    (['fr-FR', 'de-Latn-DE-1901'], 'de-Latn-DE'),
+    (['sl-rozaj-biske-1994'], 'sl-rozaj-biske'),
+    (['fr-FR'], 'en'),
+    (['*'], 'en'),
+    ([], 'en'),
+    ('fr-FR;q=0.9, he-IL;q=0.8, de-DE;q=0.95', 'de-DE'),
+    ('de-DE;q=0, he', 'he'),
+])
+def test_lookup(locale_matcher: LocaleMatcher, language_priority_list, expected: str):
+    assert locale_matcher.lookup(language_priority_list) == expected
+
+
+def test_lookup_without_default(repository: BCP47RepositoryInterface):
+    assert LocaleMatcher(repository, ['en-GB']).lookup(['aav']) is None
+
+
+@pytest.mark.parametrize('language_priority_list, expected', [
+    (['en'], ['en', 'en-GB']),
+    (['de-de'], ['de-DE']),
+    (['he', 'en-GB', 'en'], ['he', 'en-GB', 'en']),
+    (['*'], _SUPPORTED_TAGS),
+    (['de-*-DE'], []),
+    (['fr'], ['fr-CA']),
+])
+def test_basic_filter(locale_matcher: LocaleMatcher, language_priority_list, expected):
+    assert locale_matcher.basic_filter(language_priority_list) == expected
+
+
+@pytest.mark.parametrize('language_priority_list, expected', [
+    (['de-*-DE'], ['de-DE', 'de-Latn-DE']),
+    (['de-DE'], ['de-DE', 'de-Latn-DE']),
+    (['*-DE'], ['de-DE', 'de-Latn-DE']),
+    (['zh-TW'], ['zh-Hant-TW']),
+    (['sl-biske'], ['sl-rozaj-biske']),
+    (['en-oxendict'], []),
+    ('zh-TW;q=0.5, en', ['en', 'en-GB', 'zh-Hant-TW']),
+])
+def test_extended_filter(locale_matcher: LocaleMatcher, language_priority_list, expected):
+    assert locale_matcher.extended_filter(language_priority_list) == expected
+
+
+def test_extended_filter_does_not_skip_singletons():
+    locale_matcher = LocaleMatcher(Repository(), ['de-x-DE', 'de-Latn-DE'])
+    assert locale_matcher.extended_filter(['de-DE']) == ['de-Latn-DE']
+    assert locale_matcher.lookup(['de-x-de-1901']) == 'de-x-DE'
+
+
+@pytest.mark.parametrize('language_priority_list, expected_lookup, expected_filter', [
+    ('fr;q=0.5, US', 'en', ['fr-CA']),
+    ('US, Latn, 1994, zz, en--GB, -, Latn-US;q=0.9, ñ, en-GB-,,;;q=', 'en', []),
+    (['US', '1994', '', '-', 'en_GB', 'he-IL'], 'he', []),
+    (['US', '1994', '', '-', 'en_GB', 'he'], 'he', ['he']),
+])
+def test_garbage_language_ranges(locale_matcher: LocaleMatcher, language_priority_list, expected_lookup: str,
+                                 expected_filter):
+    assert locale_matcher.lookup(language_priority_list) == expected_lookup
+    assert locale_matcher.basic_filter(language_priority_list) == expected_filter
+    assert locale_matcher.extended_filter(language_priority_list) == expected_filter
+
+
+def test_garbage_supported_tags():
+    repository = Repository()
+    assert LocaleMatcher(repository, ['en', 'US']).lookup(['us']) == 'US'
+    with pytest.raises(TagOrSubtagNotFoundError):
+        LocaleMatcher(repository, ['en', '1994'])
+
+
+def test_parse_accept_language(locale_matcher: LocaleMatcher):
+    assert locale_matcher.parse_accept_language('fr;q=0, en;q=0.8, de , es;q=abc, it;q=0.8, pt;q=2') == \
+        ('de', 'en', 'it')
+    assert locale_matcher.parse_accept_language('') == ()
+
+
+def test_supported_tags(repository: BCP47RepositoryInterface):
+    assert LocaleMatcher(repository, ['en-GB', 'EN-gb', 'f1-FK', 'en']).supported_tags == ('en-GB', 'en')
+
+
+def test_invalid_supported_tag(repository: BCP47RepositoryInterface):
+    with pytest.raises(TagOrSubtagNotFoundError):
+        LocaleMatcher(repository, ['en', 'en--GB'])
+
+
+def test_language_ranges_are_memoized(repository: BCP47RepositoryInterface, monkeypatch: pytest.MonkeyPatch):
+    locale_matcher = LocaleMatcher(repository, ['en-GB'])
+    canonicalized_tags = []
+    canonicalize = repository.canonicalize
+
+    def _canonicalize(tag: str) -> str:
+        canonicalized_tags.append(tag)
+        return canonicalize(tag)
+
+    monkeypatch.setattr(repository, 'canonicalize', _canonicalize)
+    for _ in range(3):
+        assert locale_matcher.lookup(['en-GB-oxendict', 'f1']) == 'en-GB'
+        assert locale_matcher.basic_filter(['f1']) == ['en-GB']
+
+    assert canonicalized_tags == ['en-GB-oxendict', 'f1']
+    assert locale_matcher.cache_info().misses == 2
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize('requests', [1_000, 100_000])
+def test_locale_matcher_benchmark(requests: int):
+    repository = Repository()
+    languages = [language.subtag for language in repository.languages]
+    regions = [region.subtag for region in repository.regions if len(region.subtag) == 2]
+    supported_tags = [f'{language}-{region}' for language, region in itertools.product(languages[:30], regions[:5])]
+    language_ranges = [f'{language}-{region}'
+                       for language, region in itertools.islice(itertools.product(languages, regions), requests)]
+    assert len(set(language_ranges)) == requests
+
+    locale_matcher = LocaleMatcher(repository, supported_tags, cache_size=requests)
+    gc.disable()
+    try:
+        start = time.perf_counter()
+        first_results = [locale_matcher.lookup([language_range]) for language_range in language_ranges]
+        first_time = time.perf_counter() - start
+
+        start = time.perf_counter()
+        memoized_results = [locale_matcher.lookup([language_range]) for language_range in language_ranges]
+        memoized_time = time.perf_counter() - start
+    finally:
+        gc.enable()
+
+    print(f'{requests} distinct requests: {requests / first_time:.0f} requests/s, '
+          f'memoized: {requests / memoized_time:.0f} requests/s')
+    assert memoized_results == first_results
+    assert memoized_time < first_time
@@ -1,9 +1,30 @@
 import dataclasses
 import datetime
-from typing import List, Type, Iterable
-
+import functools
+import gc
+import gzip
+import http.server
+import io
+import os
+import threading
+import time
+import tracemalloc
+import urllib.request
+from pathlib import Path
+from typing import Any, Dict, List, Tuple, Type, Iterable
+
+import pytest
+
+from enums.bcp47_type import BCP47Type
 from enums.language_scope import LanguageScopeEnum
+from exceptions.invalid.invalid_language_data_error import InvalidLanguageDataError
+from exceptions.read_only_repository_error import ReadOnlyRepositoryError
+from exceptions.not_found.script_subtag_not_found_error import ScriptSubtagNotFoundError
+from exceptions.unexpected_bcp47.unexpected_bcp47_circular_reference_error import \
+    UnexpectedBCP47CircularReferenceError
 from interface.bcp47_repository.bcp47_repository_interface import BCP47RepositoryInterface
+from mixin.language_subtag_registry_mixin import LanguageSubtagRegistryMixin, _SymbolTable
+from records.record import Record
 from repository import Repository
 from schemas.ext_lang import ExtLang, ExtLangPrefix, ExtLangPreferredValue
 from schemas.grandfathered import Grandfathered
@@ -233,6 +254,462 @@ def test_bcp47_data_redundant(repository: BCP47RepositoryInterface):
     assert redundant.updated_at == datetime.datetime(2023, 10, 16, 0, 0)
 
 
+def _write_registry(tmp_path: Path, items: List[str]) -> str:
+    path = tmp_path / 'language-subtag-registry'
+    path.write_text('\n%%\n'.join(['File-Date: 2023-10-16', *items]) + '\n', encoding='utf-8')
+    return str(path)
+
+
+def test_load_references_declared_after_the_item(tmp_path: Path):
+    repository = Repository(
+        _write_registry(tmp_path, [
+            'Type: variant\nSubtag: fake2\nDescription: Fake 2\nAdded: 2005-04-17\nPrefix: xx-Xxxx-fake1',
+            'Type: language\nSubtag: xy\nDescription: XY\nAdded: 2005-10-16\nDeprecated: 2020-01-01\n'
+            'Preferred-Value: xx\nMacrolanguage: xx',
+            'Type: language\nSubtag: xx\nDescription: XX\nAdded: 2005-10-16\nSuppress-Script: Xxxx',
+            'Type: script\nSubtag: Xxxx\nDescription: Script XX\nAdded: 2005-10-16',
+            'Type: variant\nSubtag: fake1\nDescription: Fake 1\nAdded: 2005-04-17',
+        ]))
+
+    assert [language.subtag for language in repository.languages] == ['xy', 'xx']
+    language = repository.get_language_by_subtag('xy')
+    assert language.macro_language is repository.get_language_by_subtag('xx')
+    assert language.preferred_value.language is repository.get_language_by_subtag('xx')
+    assert repository.get_language_by_subtag('xx').suppress_script is repository.get_script_by_subtag('Xxxx')
+    assert repository.get_variant_by_subtag('fake2').prefix[0].tag == 'xx-Xxxx-fake1'
+
+
+def test_load_missing_reference(tmp_path: Path):
+    with pytest.raises(ScriptSubtagNotFoundError):
+        Repository(
+            _write_registry(tmp_path,
+                            ['Type: language\nSubtag: xx\nDescription: XX\nAdded: 2005-10-16\nSuppress-Script: Xxxx']))
+
+
+def test_load_circular_reference(tmp_path: Path):
+    with pytest.raises(UnexpectedBCP47CircularReferenceError):
+        Repository(
+            _write_registry(tmp_path, [
+                'Type: language\nSubtag: xx\nDescription: XX\nAdded: 2005-10-16\nMacrolanguage: xy',
+                'Type: language\nSubtag: xy\nDescription: XY\nAdded: 2005-10-16\nMacrolanguage: xx',
+            ]))
+
+
+def test_lazy_loads_only_accessed_types(tmp_path: Path):
+    repository = Repository(
+        _write_registry(tmp_path, [
+            'Type: variant\nSubtag: fake2\nDescription: Fake 2\nAdded: 2005-04-17\nPrefix: xx-Xxxx-fake1',
+            'Type: language\nSubtag: xy\nDescription: XY\nAdded: 2005-10-16\nMacrolanguage: xx',
+            'Type: language\nSubtag: xx\nDescription: XX\nAdded: 2005-10-16\nSuppress-Script: Xxxx',
+            'Type: script\nSubtag: Xxxx\nDescription: Script XX\nAdded: 2005-10-16',
+            'Type: variant\nSubtag: fake1\nDescription: Fake 1\nAdded: 2005-04-17',
+            'Type: region\nSubtag: XX\nDescription: Broken\nAdded: not a date',
+        ]),
+        lazy=True)
+
+    variant = repository.get_variant_by_subtag('fake2')
+    assert variant.prefix[0].tag == 'xx-Xxxx-fake1'
+    assert repository._unloaded_types == {BCP47Type.LANGUAGE, BCP47Type.EXTLANG, BCP47Type.REGION,
+                                          BCP47Type.GRANDFATHERED, BCP47Type.REDUNDANT, BCP47Type.SCRIPT}
+    assert [language.subtag for language in repository.languages] == ['xy', 'xx']
+    assert variant.prefix[0].language is repository.get_language_by_subtag('xx')
+    assert repository.get_language_by_subtag('xy').macro_language is repository.languages[1]
+    assert repository.get_script_by_subtag('xxxx') is repository.languages[1].suppress_script
+    with pytest.raises(ValueError):
+        repository.get_region_by_subtag('XX')
+
+
+def test_lazy_errors_are_raised_again(tmp_path: Path):
+    repository = Repository(
+        _write_registry(tmp_path, [
+            'Type: language\nSubtag: xx\nDescription: XX\nAdded: 2005-10-16\nSuppress-Script: Xxxx',
+            'Type: region\nSubtag: XX\nDescription: Broken\nAdded: not a date',
+        ]),
+        lazy=True)
+
+    for _ in range(2):
+        with pytest.raises(ScriptSubtagNotFoundError):
+            _ = repository.languages
+        with pytest.raises(ValueError):
+            _ = repository.regions
+
+
+def test_lazy_same_data(mocked_data_path: str, repository: BCP47RepositoryInterface):
+    lazy_repository = Repository(mocked_data_path, lazy=True)
+    assert lazy_repository.tag_parser('en-en-f1-latn-gb-fake1-oxendict') == \
+        repository.tag_parser('en-en-f1-latn-gb-fake1-oxendict')
+    assert lazy_repository.canonicalize('f1-f1-latn-fk') == 'en-Latn-GB'
+    for name in ('languages', 'ext_langs', 'scripts', 'regions', 'variants', 'grandfathered', 'redundant'):
+        assert [item.model_dump() for item in getattr(lazy_repository, name)] == \
+            [item.model_dump() for item in getattr(repository, name)]
+
+
+@pytest.mark.benchmark
+def test_lazy_benchmark():
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    repository = Repository()
+    repository.get_region_by_subtag('GB')
+    repository.get_script_by_subtag('Latn')
+    eager_time = time.perf_counter() - start
+    eager_memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del repository
+
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    repository = Repository(lazy=True)
+    repository.get_region_by_subtag('GB')
+    repository.get_script_by_subtag('Latn')
+    lazy_time = time.perf_counter() - start
+    lazy_memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    print(f'Regions and scripts, eager: {eager_time:.3f}s {eager_memory / 2 ** 20:.1f}MiB, '
+          f'lazy: {lazy_time:.3f}s {lazy_memory / 2 ** 20:.1f}MiB')
+    assert lazy_time * 2 < eager_time
+    assert lazy_memory * 2 < eager_memory
+
+def test_trusted_same_data(mocked_data_path: str, repository: BCP47RepositoryInterface):
+    trusted_repository = Repository(mocked_data_path, trusted=True)
+    trusted_repository.validate()
+    assert trusted_repository.canonicalize('f1-f1-latn-fk') == 'en-Latn-GB'
+    for name in ('languages', 'ext_langs', 'scripts', 'regions', 'variants', 'grandfathered', 'redundant'):
+        trusted_items = getattr(trusted_repository, name)
+        items = getattr(repository, name)
+        assert [item.model_dump() for item in trusted_items] == [item.model_dump() for item in items]
+        assert [item.model_fields_set for item in trusted_items] == [item.model_fields_set for item in items]
+
+
+def test_trusted_validate(tmp_path: Path):
+    path = _write_registry(tmp_path, [
+        'Type: language\nSubtag: xx\nDescription: XX\nAdded: 2005-10-16',
+        'Type: language\nSubtag: xy\nDescription: XY\nAdded: 2005-10-16\nPreferred-Value: xx',
+    ])
+    with pytest.raises(InvalidLanguageDataError):
+        Repository(path)
+
+    repository = Repository(path, trusted=True)
+    assert repository.get_language_by_subtag('xy').preferred_value.language.subtag == 'xx'
+    with pytest.raises(InvalidLanguageDataError):
+        repository.validate()
+    Repository(path, trusted=True, lazy=True).get_language_by_subtag('xx')
+
+
+@pytest.mark.benchmark
+def test_trusted_benchmark():
+    times = {False: [], True: []}
+    for _ in range(5):
+        for trusted in times:
+            gc.collect()
+            start = time.perf_counter()
+            repository = Repository(trusted=trusted)
+            times[trusted].append(time.perf_counter() - start)
+    start = time.perf_counter()
+    repository.validate()
+    validate_time = time.perf_counter() - start
+
+    print(f'Load, validated: {min(times[False]):.3f}s, trusted: {min(times[True]):.3f}s, '
+          f'validate: {validate_time:.3f}s')
+    assert min(times[True]) < min(times[False])
+
+
+def test_get_shared_loads_once(mocked_data_path: str, monkeypatch: pytest.MonkeyPatch):
+    loads = []
+    load_data = Repository._load_data
+    monkeypatch.setattr(Repository, '_load_data', lambda self: loads.append(self) or load_data(self))
+    barrier = threading.Barrier(8)
+    repositories = []
+
+    def _get_shared():
+        barrier.wait()
+        repositories.append(Repository.get_shared(mocked_data_path))
+
+    threads = [threading.Thread(target=_get_shared) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    try:
+        assert len(loads) == 1
+        assert all(repository is loads[0] for repository in repositories)
+        assert Repository.get_shared(Path(mocked_data_path)) is loads[0]
+        assert Repository.get_shared(mocked_data_path, use_records=True) is not loads[0]
+    finally:
+        Repository.drop_shared(mocked_data_path)
+    assert Repository.get_shared(mocked_data_path) is not loads[0]
+    Repository.drop_shared(mocked_data_path)
+
+
+def test_get_shared_reloads_modified_registry(tmp_path: Path):
+    path = _write_registry(tmp_path, ['Type: language\nSubtag: xx\nDescription: XX\nAdded: 2005-10-16'])
+    repository = Repository.get_shared(path)
+    assert Repository.get_shared(path) is repository
+
+    _write_registry(tmp_path, ['Type: language\nSubtag: xx\nDescription: XX\nAdded: 2005-10-16',
+                               'Type: language\nSubtag: xy\nDescription: XY\nAdded: 2005-10-16'])
+    shared_repository = Repository.get_shared(path)
+    Repository.drop_shared(path)
+    assert shared_repository is not repository
+    assert [language.subtag for language in shared_repository.languages] == ['xx', 'xy']
+
+
+def test_get_shared_is_read_only(mocked_data_path: str, tmp_path: Path):
+    diff = Repository(mocked_data_path).diff(_get_new_mocked_registry(tmp_path, mocked_data_path))
+    repository = Repository.get_shared(mocked_data_path)
+    try:
+        with pytest.raises(ReadOnlyRepositoryError):
+            repository.apply_diff(diff)
+        assert repository.try_get_language_by_subtag('xx') is None
+        for tags_or_subtags in (repository.languages, repository.ext_langs, repository.scripts, repository.regions,
+                                repository.variants, repository.grandfathered, repository.redundant,
+                                repository.languages_scopes):
+            assert isinstance(tags_or_subtags, tuple)
+        assert repository.languages is repository.languages
+        assert isinstance(Repository(mocked_data_path).languages, list)
+    finally:
+        Repository.drop_shared(mocked_data_path)
+
+
+@pytest.mark.parametrize('open_stream', [
+    lambda path: open(path, 'r', encoding='utf-8'),
+    lambda path: open(path, 'rb'),
+    lambda path: gzip.open(io.BytesIO(gzip.compress(Path(path).read_bytes()))),
+    lambda path: io.BytesIO(Path(path).read_bytes().replace(b'\n', b'\r\n')),
+    lambda path: io.StringIO(Path(path).read_text(encoding='utf-8').replace('\n', '\r\n'), newline=''),
+])
+def test_load_from_stream(mocked_data_path: str, repository: BCP47RepositoryInterface, open_stream):
+    with open_stream(mocked_data_path) as stream:
+        stream_repository = Repository(stream)
+        assert not stream.closed
+    for name in ('languages', 'ext_langs', 'scripts', 'regions', 'variants', 'grandfathered', 'redundant'):
+        assert [item.model_dump() for item in getattr(stream_repository, name)] == \
+            [item.model_dump() for item in getattr(repository, name)]
+
+
+def test_load_from_crlf_stream_in_small_chunks(mocked_data_path: str, repository: BCP47RepositoryInterface,
+                                                monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(LanguageSubtagRegistryMixin, '_CHUNK_SIZE', 1)
+    stream_repository = Repository(io.BytesIO(Path(mocked_data_path).read_bytes().replace(b'\n', b'\r\n')))
+    assert [item.model_dump() for item in stream_repository.languages] == \
+        [item.model_dump() for item in repository.languages]
+
+
+def test_load_from_http_response(mocked_data_path: str, tmp_path: Path):
+    handler = functools.partial(http.server.SimpleHTTPRequestHandler, directory=os.path.dirname(mocked_data_path))
+    with http.server.ThreadingHTTPServer(('127.0.0.1', 0), handler) as server:
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        try:
+            url = f'http://127.0.0.1:{server.server_address[1]}/{os.path.basename(mocked_data_path)}'
+            with urllib.request.urlopen(url) as response:
+                repository = Repository(response, snapshot_dir_path=str(tmp_path), lazy=True)
+        finally:
+            server.shutdown()
+    assert repository.get_region_by_subtag('fk').preferred_value.region.subtag == 'GB'
+    assert not list(tmp_path.iterdir())
+
+
+def test_load_items_split_between_chunks(tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+    monkeypatch.setattr(Repository, '_CHUNK_SIZE', 3)
+    path = _write_registry(tmp_path, [
+        'Type: language\nSubtag: xx\nDescription: Ñandú\nAdded: 2005-10-16',
+        'Type: script\nSubtag: Xxxx\nDescription: Script %\nAdded: 2005-10-16',
+    ])
+    with open(path, 'rb') as f:
+        repository = Repository(f)
+    assert repository.get_language_by_subtag('xx').description == ['Ñandú']
+    assert repository.get_script_by_subtag('Xxxx').description == ['Script %']
+
+
+@pytest.mark.benchmark
+def test_load_peak_memory_benchmark():
+    mixin = LanguageSubtagRegistryMixin()
+    path = mixin._LANGUAGE_SUBTAG_REGISTRY_FILE_PATH
+
+    def _read_whole_file():
+        with open(path, 'r', encoding='utf-8') as f:
+            items = f.read().split('%%')
+        updated_at = mixin._get_file_date(items.pop(0))
+        return [mixin._parse_item(item, updated_at) for item in items]
+
+    results = {}
+    for name, read_items in (('read+split', _read_whole_file), ('streaming', lambda: mixin._read_items(path))):
+        gc.collect()
+        tracemalloc.start()
+        start = time.perf_counter()
+        symbol_table = _SymbolTable()
+        for data_dict in read_items():
+            mixin._register_item(symbol_table, data_dict)
+        results[name] = (time.perf_counter() - start, tracemalloc.get_traced_memory()[1])
+        tracemalloc.stop()
+
+    print(', '.join(f'{name}: {elapsed:.3f}s peak {peak / 2 ** 20:.2f}MiB'
+                    for name, (elapsed, peak) in results.items()))
+    assert results['streaming'][1] < results['read+split'][1]
+
+
+def _write_new_registry(tmp_path: Path, registry_path: str, replacements: List[Tuple[str, str]],
+                        added_items: List[str]) -> str:
+    with open(registry_path, 'r', encoding='utf-8') as f:
+        text = f.read()
+    for old, new in replacements:
+        assert old in text
+        text = text.replace(old, new)
+    path = tmp_path / 'new-language-subtag-registry'
+    path.write_text('\n%%\n'.join([text.rstrip('\n'), *added_items]) + '\n', encoding='utf-8')
+    return str(path)
+
+
+def _get_new_mocked_registry(tmp_path: Path, mocked_data_path: str) -> str:
+    return _write_new_registry(tmp_path, mocked_data_path, [
+        ('Description: Fake script\n', 'Description: Fake script changed\n'),
+        ('Subtag: en\nDescription: English\nAdded: 2005-10-16', 'Subtag: en\nDescription: English\nAdded: 2006-10-16'),
+        ('\n%%\nType: variant\nSubtag: oxendict\nDescription: Oxford English Dictionary spelling\nAdded: 2005-04-17\n'
+         'Prefix: en-en-f1-Latn-GB-fake1\nPrefix: aav-f1-Fake-FK-fake1\nComments: test variant\n'
+         'Deprecated: 2010-07-29\nPreferred-Value: fake1', ''),
+    ], ['Type: language\nSubtag: xx\nDescription: XX\nAdded: 2023-10-16\nSuppress-Script: Latn'])
+
+
+def _dump_items(repository: Repository, name: str) -> List[Dict[str, Any]]:
+    return [(item.to_model() if isinstance(item, Record) else item).model_dump() for item in getattr(repository, name)]
+
+
+def test_diff(mocked_data_path: str, repository: Repository, tmp_path: Path):
+    path = _get_new_mocked_registry(tmp_path, mocked_data_path)
+    diff = repository.diff(path)
+
+    assert {bcp47_type: list(items) for bcp47_type, items in diff.added.items()} == {BCP47Type.LANGUAGE: ['xx']}
+    assert {bcp47_type: list(items) for bcp47_type, items in diff.removed.items()} == {BCP47Type.VARIANT: ['oxendict']}
+    assert {bcp47_type: list(items) for bcp47_type, items in diff.modified.items()} == {
+        BCP47Type.SCRIPT: ['Fake'], BCP47Type.LANGUAGE: ['en']}
+    assert {bcp47_type: list(items) for bcp47_type, items in diff.relinked.items()} == {
+        BCP47Type.LANGUAGE: ['f1'], BCP47Type.EXTLANG: ['en', 'f1'], BCP47Type.REDUNDANT: ['f1']}
+    assert diff.added[BCP47Type.LANGUAGE]['xx']['suppress_script'] == 'Latn'
+    assert diff.modified[BCP47Type.LANGUAGE]['en']['added'] == datetime.datetime(2006, 10, 16)
+    assert diff
+
+    path = _write_new_registry(tmp_path, mocked_data_path, [('File-Date: 2023-10-16', 'File-Date: 2024-03-07')], [])
+    assert not repository.diff(path, mocked_data_path)
+
+
+@pytest.mark.parametrize('kwargs', [{}, {'use_records': True}, {'trusted': True}, {'lazy': True}])
+def test_apply_diff(mocked_data_path: str, tmp_path: Path, kwargs: Dict[str, Any]):
+    path = _get_new_mocked_registry(tmp_path, mocked_data_path)
+    repository = Repository(mocked_data_path, tag_parser_cache_size=16, **kwargs)
+    assert repository.tag_parser('en-oxendict').language.added == datetime.datetime(2005, 10, 16)
+
+    repository.apply_diff(repository.diff(path))
+    new_repository = Repository(path, **kwargs)
+    for name in ('languages', 'ext_langs', 'scripts', 'regions', 'variants', 'grandfathered', 'redundant'):
+        assert _dump_items(repository, name) == _dump_items(new_repository, name)
+
+    english = repository.get_language_by_subtag('en')
+    assert repository.get_language_by_subtag('f1').preferred_value.language is english
+    assert repository.get_ext_lang_by_subtag('en').prefix[0].language.preferred_value.language is english
+    assert repository.get_redundant_by_tag('f1').preferred_value.language is english
+    assert repository.tag_parser('EN-fake').language is english
+    assert not repository.is_valid('en-oxendict')
+    assert repository.try_get_variant_by_subtag('oxendict') is None
+    assert repository.canonicalize('f1-f1-latn-fk') == 'en-Latn-GB'
+    assert repository.get_languages_by_suppress_script('latn') == (english, repository.languages[1],
+                                                                   repository.get_language_by_subtag('xx'))
+    assert [language.subtag for language in repository.find_languages(added_from=datetime.datetime(2006, 1, 1))] == \
+        [language.subtag for language in new_repository.find_languages(added_from=datetime.datetime(2006, 1, 1))]
+    assert repository.decode_tag(repository.encode_tag('xx-Fake')).tag == 'xx-Fake'
+
+
+def test_apply_diff_invalid(mocked_data_path: str, tmp_path: Path):
+    path = _write_new_registry(tmp_path, mocked_data_path, [('Description: Fake script\n', '')], [
+        'Type: language\nSubtag: xx\nDescription: XX\nAdded: 2023-10-16\nSuppress-Script: Xxxx'])
+    repository = Repository(mocked_data_path)
+    languages = list(repository.languages)
+    script = repository.get_script_by_subtag('Fake')
+
+    with pytest.raises(ScriptSubtagNotFoundError):
+        repository.apply_diff(repository.diff(path))
+    assert repository.languages == languages
+    assert repository.get_script_by_subtag('Fake') is script
+
+
+def test_apply_diff_does_not_change_previous_data(mocked_data_path: str, tmp_path: Path):
+    repository = Repository(mocked_data_path)
+    languages = repository.languages
+    language_subtags = [language.subtag for language in languages]
+    variant_prefixes = repository._get_variant_prefixes(  # pylint: disable=protected-access
+        repository.get_variant_by_subtag('oxendict'))
+
+    repository.apply_diff(repository.diff(_get_new_mocked_registry(tmp_path, mocked_data_path)))
+    assert [language.subtag for language in languages] == language_subtags
+    assert repository.languages is not languages
+    assert repository._get_variant_prefixes(  # pylint: disable=protected-access
+        repository.get_variant_by_subtag('fake1')) is not variant_prefixes
+
+
+def test_apply_diff_concurrent_readers(mocked_data_path: str, tmp_path: Path):
+    path = _get_new_mocked_registry(tmp_path, mocked_data_path)
+    repository = Repository(mocked_data_path, tag_parser_cache_size=16)
+    diffs = [repository.diff(path), repository.diff(mocked_data_path, path)]
+    stop = threading.Event()
+    errors: List[BaseException] = []
+
+    def _read():
+        while not stop.is_set():
+            try:
+                assert repository.canonicalize('f1-f1-latn-fk') == 'en-Latn-GB'
+                assert repository.tag_parser('EN-fake').script.subtag == 'Fake'
+                assert repository.decode_tag(repository.encode_tag('aav-Fake-FK')).tag == 'aav-Fake-FK'
+                assert len(list(repository.find_languages(deprecated=False))) > 0
+            except BaseException as e:  # pylint: disable=broad-exception-caught
+                errors.append(e)
+                return
+
+    readers = [threading.Thread(target=_read) for _ in range(4)]
+    for reader in readers:
+        reader.start()
+    for i in range(50):
+        repository.apply_diff(diffs[i % 2])
+    stop.set()
+    for reader in readers:
+        reader.join()
+
+    assert not errors
+    assert repository.try_get_language_by_subtag('xx') is None
+    assert repository.tag_parser('en-oxendict').variant[0].subtag == 'oxendict'
+
+
+@pytest.mark.benchmark
+def test_apply_diff_benchmark(tmp_path: Path):
+    registry_path = Repository._LANGUAGE_SUBTAG_REGISTRY_FILE_PATH
+    path = _write_new_registry(tmp_path, registry_path, [
+        ('File-Date: 2024-03-07', 'File-Date: 2024-06-14'),
+        ('Subtag: aa\nDescription: Afar\nAdded: 2005-10-16', 'Subtag: aa\nDescription: Afar\nAdded: 2005-10-16\n'
+                                                           'Deprecated: 2024-06-14'),
+        ('Description: Cyrillic\n', 'Description: Cyrillic script\n'),
+        ('Description: Hebrew\n', 'Description: Hebrew language\n'),
+    ], ['Type: language\nSubtag: zzy\nDescription: New language\nAdded: 2024-06-14',
+        'Type: variant\nSubtag: newvar\nDescription: New variant\nAdded: 2024-06-14\nPrefix: zzy'])
+    repository = Repository()
+    diff = repository.diff(path)
+
+    gc.collect()
+    start = time.perf_counter()
+    repository.apply_diff(diff)
+    apply_time = time.perf_counter() - start
+
+    gc.collect()
+    start = time.perf_counter()
+    new_repository = Repository(path)
+    load_time = time.perf_counter() - start
+
+    print(f'Apply diff ({sum(len(items) for items in (*diff.added.values(), *diff.modified.values()))} changed and '
+          f'{sum(len(items) for items in diff.relinked.values())} relinked items): {apply_time:.4f}s, '
+          f'full reload: {load_time:.3f}s')
+    assert len(repository.languages) == len(new_repository.languages)
+    assert repository.is_valid('zzy-newvar', strict=True)
+    assert apply_time * 10 < load_time
+
 #
 #
 # def test_bcp47_data_redundant(repository: BCP47RepositoryInterface):
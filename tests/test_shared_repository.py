@@ -0,0 +1,162 @@
+import gc
+import multiprocessing
+import os
+import time
+import tracemalloc
+
+import pytest
+
+from enums.bcp47_type import BCP47Type
+from exceptions.invalid.invalid_shared_registry_error import InvalidSharedRegistryError
+from exceptions.not_found.language_subtag_not_found_error import LanguageSubtagNotFoundError
+from exceptions.not_found.region_subtag_not_found_error import RegionSubtagNotFoundError
+from exceptions.not_found.tag_or_subtag_not_found_error import TagOrSubtagNotFoundError
+from repository import Repository
+from shared_repository import SharedRepository
+
+
+@pytest.fixture(scope='module')
+def buffer(mocked_data_path: str) -> bytes:
+    return SharedRepository.encode(mocked_data_path)
+
+
+@pytest.fixture
+def shared_repository(buffer: bytes) -> SharedRepository:
+    return SharedRepository(buffer)
+
+
+@pytest.mark.parametrize('name', ['languages', 'ext_langs', 'scripts', 'regions', 'variants', 'grandfathered',
+                                  'redundant', 'languages_scopes'])
+def test_same_data_as_repository(shared_repository: SharedRepository, repository: Repository, name: str):
+    assert [item.model_dump() for item in getattr(shared_repository, name)] == \
+        [item.model_dump() for item in getattr(repository, name)]
+
+
+def test_objects_are_created_once(shared_repository: SharedRepository):
+    language = shared_repository.get_language_by_subtag('EN')
+    assert shared_repository.get_language_by_subtag('en') is language
+    assert shared_repository.languages[0] is language
+    assert shared_repository.get_ext_lang_by_subtag('en').preferred_value.language is language
+
+
+def test_lists_are_read_once(shared_repository: SharedRepository, monkeypatch: pytest.MonkeyPatch):
+    languages = shared_repository.languages
+    monkeypatch.setattr(shared_repository._registry_buffer,  # pylint: disable=protected-access
+                        'iter_records', lambda bcp47_type: pytest.fail('Items should not be read again.'))
+    assert shared_repository.languages is languages
+
+
+def test_get_by_subtag(shared_repository: SharedRepository, repository: Repository):
+    assert shared_repository.get_region_by_subtag('gb') == repository.get_region_by_subtag('GB')
+    assert shared_repository.get_region_by_subtag('GB', case_sensitive=True).subtag == 'GB'
+    assert shared_repository.get_redundant_by_tag('F1').tag == 'f1'
+    assert shared_repository.try_get_variant_by_subtag('OXENDICT').subtag == 'oxendict'
+    assert shared_repository.try_get_script_by_subtag('latn', case_sensitive=True) is None
+    with pytest.raises(RegionSubtagNotFoundError):
+        shared_repository.get_region_by_subtag('gb', case_sensitive=True)
+    with pytest.raises(LanguageSubtagNotFoundError) as exc_info:
+        shared_repository.get_language_by_subtag('ñ')
+    assert isinstance(exc_info.value.__cause__, TagOrSubtagNotFoundError)
+
+
+def test_tag_parser(shared_repository: SharedRepository, repository: Repository):
+    for tag in ('en-en-f1-latn-gb-fake1-oxendict', 'f1', 'aav-Fake-FK'):
+        assert shared_repository.tag_parser(tag).model_dump() == repository.tag_parser(tag).model_dump()
+    assert not shared_repository.is_valid('en-gb-en')
+    assert shared_repository.is_valid('en-en-f1-latn-gb-fake1-oxendict', strict=True)
+    assert not shared_repository.is_valid('en-oxendict', strict=True)
+    assert shared_repository.canonicalize('f1-f1-latn-fk') == 'en-Latn-GB'
+
+
+def test_reverse_indexes(shared_repository: SharedRepository, repository: Repository):
+    for name, tag_str in (('get_languages_by_macro_language', 'aav'), ('get_languages_by_suppress_script', 'LATN'),
+                          ('get_tags_or_subtags_by_preferred_value', 'en'), ('get_languages_by_macro_language', 'zz')):
+        assert [item.model_dump() for item in getattr(shared_repository, name)(tag_str)] == \
+            [item.model_dump() for item in getattr(repository, name)(tag_str)]
+    assert shared_repository.get_tags_or_subtags_by_preferred_value('EN') is \
+        shared_repository.get_tags_or_subtags_by_preferred_value('en')
+
+
+def test_find_languages(shared_repository: SharedRepository, repository: Repository):
+    languages = shared_repository.find_languages(deprecated=False)
+    assert not shared_repository._symbol_table.objects[BCP47Type.LANGUAGE]
+    assert [language.model_dump() for language in languages] == \
+        [language.model_dump() for language in repository.find_languages(deprecated=False)]
+    assert [language.subtag for language in shared_repository.find_languages('macrolanguage')] == ['aav']
+
+
+def test_encode_tag(shared_repository: SharedRepository, repository: Repository):
+    for tag in ('en-en-f1-latn-gb-fake1-oxendict', 'f1', 'aav-Fake-FK'):
+        code = shared_repository.encode_tag(tag)
+        assert code == repository.encode_tag(tag)
+        assert shared_repository.decode_tag(code).model_dump() == repository.decode_tag(code).model_dump()
+
+
+def test_from_file(mocked_data_path: str, tmp_path):
+    file_path = os.path.join(tmp_path, 'registry.bin')
+    SharedRepository.dump(file_path, mocked_data_path)
+    assert os.listdir(tmp_path) == ['registry.bin']
+
+    with SharedRepository.from_file(file_path) as shared_repository:
+        assert shared_repository.tag_parser('en-GB').tag == 'en-GB'
+
+
+def _attach_and_parse(name: str, tag: str, queue: multiprocessing.Queue):
+    with SharedRepository.from_shared_memory(name) as shared_repository:
+        queue.put(shared_repository.tag_parser(tag).tag)
+
+
+def test_from_shared_memory(mocked_data_path: str):
+    shared_memory = SharedRepository.create_shared_memory(mocked_data_path)
+    try:
+        queue = multiprocessing.Queue()
+        process = multiprocessing.Process(target=_attach_and_parse, args=(shared_memory.name, 'EN-latn-gb', queue))
+        process.start()
+        assert queue.get(timeout=30) == 'en-Latn-GB'
+        process.join(timeout=30)
+        assert process.exitcode == 0
+
+        with SharedRepository.from_shared_memory(shared_memory.name) as shared_repository:
+            assert shared_repository.get_script_by_subtag('fake').subtag == 'Fake'
+    finally:
+        shared_memory.close()
+        shared_memory.unlink()
+
+
+@pytest.mark.parametrize('buffer', [b'', b'not a shared registry', b'BCP47SR\x01\x05\x00\x00\x00{....'])
+def test_invalid_buffer(buffer: bytes):
+    with pytest.raises(InvalidSharedRegistryError):
+        SharedRepository(buffer)
+
+
+@pytest.mark.benchmark
+def test_shared_repository_benchmark():
+    buffer = SharedRepository.encode()
+    tags = ['zh-Hant-TW', 'en-GB', 'sl-rozaj-biske', 'de-CH-1901', 'es-419', 'sr-Latn-RS']
+
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    repository = Repository()
+    repository_time = time.perf_counter() - start
+    for tag in tags:
+        repository.tag_parser(tag)
+    repository_memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    del repository
+
+    gc.collect()
+    tracemalloc.start()
+    start = time.perf_counter()
+    shared_repository = SharedRepository(buffer)
+    attach_time = time.perf_counter() - start
+    for tag in tags:
+        shared_repository.tag_parser(tag)
+    shared_repository_memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+
+    print(f'Repository: {repository_time:.3f}s {repository_memory / 2 ** 20:.1f}MiB, '
+          f'shared repository ({len(buffer) / 2 ** 20:.1f}MiB buffer): {attach_time:.4f}s '
+          f'{shared_repository_memory / 2 ** 20:.2f}MiB')
+    assert shared_repository_memory * 10 < repository_memory
+    assert attach_time * 10 < repository_time
@@ -0,0 +1,105 @@
+import os
+import shutil
+import time
+from pathlib import Path
+
+import pytest
+
+import snapshot_service as snapshot_service_module
+from repository import Repository
+from snapshot_service import SnapshotService
+
+
+@pytest.fixture
+def registry_path(tmp_path: Path, mocked_data_path: str) -> Path:
+    path = tmp_path / 'language-subtag-registry'
+    shutil.copy(mocked_data_path, path)
+    return path
+
+
+def test_snapshot_is_written_and_restored(tmp_path: Path, registry_path: Path, monkeypatch: pytest.MonkeyPatch):
+    snapshot_dir_path = tmp_path / 'snapshots'
+    repository = Repository(str(registry_path), snapshot_dir_path=str(snapshot_dir_path))
+    assert len(os.listdir(snapshot_dir_path)) == 1
+
+    def _fail_load_bcp47(_self):
+        raise AssertionError('The language subtag registry should not be parsed.')
+
+    monkeypatch.setattr(Repository, '_load_bcp47', _fail_load_bcp47)
+    restored_repository = Repository(str(registry_path), snapshot_dir_path=str(snapshot_dir_path))
+
+    assert len(restored_repository.languages) == len(repository.languages)
+    language = restored_repository.get_language_by_subtag('f1')
+    assert language.macro_language is restored_repository.get_language_by_subtag('aav')
+    assert language.preferred_value.language is restored_repository.get_language_by_subtag('en')
+    assert restored_repository.get_language_by_subtag('aav').scope is restored_repository.get_language_scope_by_name(
+        'macrolanguage')
+
+
+def test_snapshot_is_invalidated_by_content(tmp_path: Path, registry_path: Path):
+    snapshot_service = SnapshotService(str(tmp_path / 'snapshots'))
+    key = snapshot_service.get_key(str(registry_path))
+    assert '2023-10-16' in key
+
+    with open(registry_path, 'a', encoding='utf-8') as f:
+        f.write('\n%%\nType: region\nSubtag: ZZ\nDescription: New region\nAdded: 2023-10-16\n')
+
+    assert snapshot_service.get_key(str(registry_path)) != key
+
+    Repository(str(registry_path), snapshot_dir_path=str(tmp_path / 'snapshots'))
+    repository = Repository(str(registry_path), snapshot_dir_path=str(tmp_path / 'snapshots'))
+    assert repository.get_region_by_subtag('ZZ').description == ['New region']
+
+
+def test_snapshot_corrupted_is_ignored(tmp_path: Path, registry_path: Path):
+    snapshot_dir_path = tmp_path / 'snapshots'
+    Repository(str(registry_path), snapshot_dir_path=str(snapshot_dir_path))
+    snapshot_file_path = snapshot_dir_path / os.listdir(snapshot_dir_path)[0]
+    snapshot_file_path.write_bytes(b'corrupted')
+
+    repository = Repository(str(registry_path), snapshot_dir_path=str(snapshot_dir_path))
+    assert repository.get_language_by_subtag('en').subtag == 'en'
+    assert snapshot_file_path.read_bytes() != b'corrupted'
+
+
+def test_snapshot_incomplete_is_ignored(tmp_path: Path, registry_path: Path):
+    snapshot_dir_path = tmp_path / 'snapshots'
+    snapshot_service = SnapshotService(str(snapshot_dir_path))
+    key = snapshot_service.get_key(str(registry_path))
+    snapshot_service.dump(key, {'languages_scopes': []})
+
+    repository = Repository(str(registry_path), snapshot_dir_path=str(snapshot_dir_path))
+    assert repository.get_language_by_subtag('en').subtag == 'en'
+    assert len(repository.languages_scopes) == len(Repository(str(registry_path)).languages_scopes)
+    assert len(snapshot_service.load(key)) > 1
+
+
+def test_snapshot_is_invalidated_by_version_and_schema(registry_path: Path, monkeypatch: pytest.MonkeyPatch):
+    snapshot_service = SnapshotService('snapshots')
+    key = snapshot_service.get_key(str(registry_path))
+
+    monkeypatch.setattr(snapshot_service_module, '_get_package_version', lambda: '0.0.0')
+    version_key = snapshot_service.get_key(str(registry_path))
+    assert version_key != key
+
+    monkeypatch.setattr(snapshot_service_module, '_get_schema_hash', lambda: '0' * 16)
+    assert snapshot_service.get_key(str(registry_path)) not in (key, version_key)
+
+
+@pytest.mark.benchmark
+def test_snapshot_startup_time(tmp_path: Path):
+    snapshot_dir_path = str(tmp_path / 'snapshots')
+
+    start = time.perf_counter()
+    Repository()
+    parse_time = time.perf_counter() - start
+
+    Repository(snapshot_dir_path=snapshot_dir_path)
+
+    start = time.perf_counter()
+    repository = Repository(snapshot_dir_path=snapshot_dir_path)
+    snapshot_time = time.perf_counter() - start
+
+    print(f'Startup parsing registry: {parse_time:.3f}s, startup from snapshot: {snapshot_time:.3f}s')
+    assert repository.get_language_by_subtag('en').suppress_script is repository.get_script_by_subtag('Latn')
+    assert snapshot_time < parse_time